@@ -0,0 +1,78 @@
+"""
+benchmarks.bench_dispatch
+-------------------------
+
+Measures ``Machine.dispatch`` for a fleet of models whose guard only passes for a few of them. The guard is
+evaluated once per state group when it declares a vectorized form (see ``tfism.core.vectorized``). Thread pools only
+pay off without the GIL (free-threaded CPython). Run with
+``python benchmarks/bench_dispatch.py [--models N] [--workers 4] [--chunk-size 1024]``.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from tfism import Machine
+from tfism.core import vectorized
+
+
+def _over_limit(accounts: list["Account"], limit: int) -> list[bool]:
+    return [account.balance > limit for account in accounts]
+
+
+class Account:
+    def __init__(self, balance: int) -> None:
+        self.balance = balance
+
+    def over_limit(self, limit: int) -> bool:
+        return self.balance > limit
+
+
+class VectorizedAccount(Account):
+    @vectorized(_over_limit)
+    def over_limit(self, limit: int) -> bool:
+        return self.balance > limit
+
+
+def _measure(model_cls: type[Account], models: int, run: Callable[[Machine, list[Any]], Any]) -> float:
+    """Returns the number of models processed per second."""
+    accounts = [model_cls(balance % 1000) for balance in range(models)]
+    machine = Machine(accounts, states=["open", "review"], initial="open", auto_transitions=False)
+    machine.add_transition("audit", "open", "review", conditions="over_limit")
+    machine.add_transition("audit", "review", "review")
+    begin = time.perf_counter()
+    run(machine, accounts)
+    return models / (time.perf_counter() - begin)
+
+
+def _loop(machine: Machine, accounts: list[Any]) -> None:
+    for account in accounts:
+        account.audit(limit=990)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=200000, help="number of models")
+    parser.add_argument("--workers", type=int, default=4, help="threads of the executor")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="models per executor task")
+    args = parser.parse_args()
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("%d models, GIL %s" % (args.models, "enabled" if gil else "disabled"))
+    with ThreadPoolExecutor(args.workers) as executor:
+
+        def _threaded(machine: Machine, accounts: list[Any]) -> None:
+            machine.dispatch_executor = executor
+            machine.dispatch_chunk_size = args.chunk_size
+            machine.dispatch("audit", limit=990)
+
+        scenarios: list[tuple[str, type[Account], Callable[[Machine, list[Any]], Any]]] = [
+            ("loop over models", Account, _loop),
+            ("dispatch", Account, lambda machine, _: machine.dispatch("audit", limit=990)),
+            ("dispatch (vectorized guard)", VectorizedAccount, lambda machine, _: machine.dispatch("audit", limit=990)),
+            ("dispatch (%d threads)" % args.workers, Account, _threaded),
+        ]
+        for name, model_cls, run in scenarios:
+            print("%-40s %10.0f models/s" % (name, _measure(model_cls, args.models, run)))
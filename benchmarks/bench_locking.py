@@ -0,0 +1,60 @@
+"""
+benchmarks.bench_locking
+------------------------
+
+Measures the per-trigger overhead of tfsm.extensions.locking compared to an unlocked machine. Triggers are called
+from a single thread which means locks are never contended. Run with
+``python benchmarks/bench_locking.py [--number N]``.
+"""
+
+import argparse
+import timeit
+
+from tfism import Machine
+from tfism.extensions import HierarchicalMachine, LockedHierarchicalMachine, LockedMachine
+
+_SCENARIOS: list[tuple[str, type[Machine], dict[str, str]]] = [
+    ("Machine", Machine, {}),
+    ("LockedMachine", LockedMachine, {}),
+    ("LockedMachine (lock_mode='model')", LockedMachine, {"lock_mode": "model"}),
+    ("LockedMachine (lock_mode='rw')", LockedMachine, {"lock_mode": "rw"}),
+    ("HierarchicalMachine", HierarchicalMachine, {}),
+    ("LockedHierarchicalMachine", LockedHierarchicalMachine, {}),
+]
+
+
+class Model:
+    def on_enter_B(self) -> None:
+        pass
+
+    def check(self) -> bool:
+        return True
+
+
+def _create_model(machine_cls: type[Machine], **kwargs: str) -> Model:
+    model = Model()
+    machine_cls(
+        model,
+        states=["A", "B", "C"],
+        transitions=[["go", "A", "B"], ["go", "B", "C"], ["go", "C", "A"]],
+        initial="A",
+        auto_transitions=False,
+        before_state_change="check",
+        **kwargs,
+    )
+    return model
+
+
+def run(number: int) -> None:
+    baseline = None
+    for label, machine_cls, kwargs in _SCENARIOS:
+        model = _create_model(machine_cls, **kwargs)
+        duration = min(timeit.repeat(model.go, number=number, repeat=5)) / number * 1e6  # type: ignore[attr-defined]
+        baseline = duration if baseline is None else baseline
+        print("%-40s %8.2f us/trigger %6.2fx" % (label, duration, duration / baseline))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000, help="triggers per measurement")
+    run(parser.parse_args().number)
@@ -0,0 +1,69 @@
+"""
+benchmarks.bench_logging
+------------------------
+
+Measures the per-trigger overhead of tfsm.core logging. Each scenario cycles a model through a small set of states
+with a few callbacks per transition. Run with ``python benchmarks/bench_logging.py [--number N]``.
+"""
+
+import argparse
+import logging
+import os
+import timeit
+
+from tfism import Machine
+
+_SCENARIOS = [
+    ("logging off (WARNING)", logging.WARNING, False),
+    ("logging on (DEBUG), handler filters", logging.DEBUG, False),
+    ("logging on (DEBUG), records emitted", logging.DEBUG, True),
+]
+
+
+class Model:
+    def on_enter_B(self) -> None:
+        pass
+
+    def on_exit_B(self) -> None:
+        pass
+
+    def check(self) -> bool:
+        return True
+
+
+def _create_model() -> Model:
+    model = Model()
+    Machine(
+        model,
+        states=["A", "B", "C"],
+        transitions=[["go", "A", "B"], ["go", "B", "C"], ["go", "C", "A"]],
+        initial="A",
+        auto_transitions=False,
+        before_state_change="check",
+        after_state_change="check",
+    )
+    return model
+
+
+def run(number: int) -> None:
+    logger = logging.getLogger("tfism.core")
+    previous_level = logger.level
+    handler = logging.StreamHandler(open(os.devnull, "w"))  # noqa: SIM115
+    try:
+        for label, level, emit in _SCENARIOS:
+            logger.setLevel(level)
+            handler.setLevel(logging.DEBUG if emit else logging.CRITICAL)
+            logger.addHandler(handler)
+            model = _create_model()
+            duration = min(timeit.repeat(model.go, number=number, repeat=5))  # type: ignore[attr-defined]
+            logger.removeHandler(handler)
+            print("%-40s %8.2f us/trigger" % (label, duration / number * 1e6))
+    finally:
+        logger.setLevel(previous_level)
+        handler.stream.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000, help="triggers per measurement")
+    run(parser.parse_args().number)
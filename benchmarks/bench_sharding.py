@@ -0,0 +1,64 @@
+"""
+benchmarks.bench_sharding
+-------------------------
+
+Compares the throughput of a single machine with tfsm.extensions.sharding for a fleet of models. The sharded
+machine only scales when the host has at least as many cores as shards. Run with
+``python benchmarks/bench_sharding.py [--models N] [--triggers N] [--shards 1,2,4]``.
+"""
+
+import argparse
+import os
+import time
+
+from tfism.extensions.markup import MarkupMachine
+from tfism.extensions.sharding import ShardedMachine
+
+_CONFIG = dict(
+    states=["A", "B", "C"],
+    transitions=[["go", "A", "B"], ["go", "B", "C"], ["go", "C", "A"]],
+    initial="A",
+    auto_transitions=False,
+)
+
+
+class Model:
+    pass
+
+
+def run_single(models: int, triggers: int) -> float:
+    fleet = [Model() for _ in range(models)]
+    machine = MarkupMachine(model=fleet, **_CONFIG)  # type: ignore[arg-type]
+    begin = time.perf_counter()
+    for _ in range(triggers):
+        for model in fleet:
+            model.go()  # type: ignore[attr-defined]
+    duration = time.perf_counter() - begin
+    machine.remove_model(fleet)
+    return models * triggers / duration
+
+
+def run_sharded(models: int, triggers: int, shards: int) -> float:
+    with ShardedMachine(MarkupMachine(**_CONFIG).markup, shards=shards, batch_size=1024) as machine:  # type: ignore[arg-type]
+        for key in range(models):
+            machine.add_model(key)
+        machine.flush()
+        machine.get_model_state(models - 1).result()
+        begin = time.perf_counter()
+        futures = [machine.trigger(key, "go") for _ in range(triggers) for key in range(models)]
+        machine.flush()
+        for future in futures:
+            future.result()
+        return models * triggers / (time.perf_counter() - begin)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=10000, help="number of models")
+    parser.add_argument("--triggers", type=int, default=10, help="triggers per model")
+    parser.add_argument("--shards", default="1,2,4", help="comma separated shard counts")
+    args = parser.parse_args()
+    print("%d CPUs, %d models, %d triggers per model" % (os.cpu_count() or 1, args.models, args.triggers))
+    print("%-40s %10.0f triggers/s" % ("MarkupMachine", run_single(args.models, args.triggers)))
+    for count in (int(value) for value in args.shards.split(",")):
+        print("%-40s %10.0f triggers/s" % ("ShardedMachine (shards=%d)" % count, run_sharded(args.models, args.triggers, count)))
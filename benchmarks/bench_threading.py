@@ -0,0 +1,77 @@
+"""
+benchmarks.bench_threading
+--------------------------
+
+Measures how the throughput of a machine scales with the number of threads. Every thread triggers events of a model
+of its own while all models share one machine. Without the GIL (free-threaded CPython), the throughput of
+independent models should grow with the number of threads. Run with
+``python benchmarks/bench_threading.py [--threads 1,2,4,8] [--number N]``.
+"""
+
+import argparse
+import sys
+import time
+from threading import Barrier, Thread
+from typing import Any
+
+from tfism import Machine
+from tfism.extensions import LockedMachine
+
+_SCENARIOS: list[tuple[str, type[Machine], dict[str, Any]]] = [
+    ("Machine", Machine, {}),
+    ("Machine (queued='model')", Machine, {"queued": "model"}),
+    ("LockedMachine", LockedMachine, {}),
+    ("LockedMachine (lock_mode='model')", LockedMachine, {"lock_mode": "model"}),
+]
+
+
+class Model:
+    def check(self) -> bool:
+        return True
+
+
+def _measure(machine_cls: type[Machine], kwargs: dict[str, Any], threads: int, number: int) -> float:
+    """Returns the number of triggers per second processed by ``threads`` threads."""
+    models = [Model() for _ in range(threads)]
+    machine_cls(
+        models,
+        states=["A", "B", "C"],
+        transitions=[["go", "A", "B"], ["go", "B", "C"], ["go", "C", "A"]],
+        initial="A",
+        auto_transitions=False,
+        before_state_change="check",
+        **kwargs,
+    )
+    barrier = Barrier(threads + 1)
+
+    def work(model: Any) -> None:
+        trigger = model.go
+        barrier.wait()
+        for _ in range(number):
+            trigger()
+
+    workers = [Thread(target=work, args=(model,)) for model in models]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    begin = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * number / (time.perf_counter() - begin)
+
+
+def run(thread_counts: list[int], number: int) -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("Python %s, GIL %s" % (sys.version.split()[0], "enabled" if gil else "disabled"))
+    print("%-40s %s" % ("", " ".join("%10s" % ("%d thr" % count) for count in thread_counts)))
+    for label, machine_cls, kwargs in _SCENARIOS:
+        results = [_measure(machine_cls, kwargs, count, number) for count in thread_counts]
+        print("%-40s %s" % (label, " ".join("%10.0f" % result for result in results)), "triggers/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", default="1,2,4,8", help="comma separated thread counts")
+    parser.add_argument("--number", type=int, default=20000, help="triggers per thread")
+    args = parser.parse_args()
+    run([int(count) for count in args.threads.split(",")], args.number)
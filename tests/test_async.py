@@ -253,6 +253,10 @@ class TestAsync(TestTransitions):
         self.assertTrue(model1.is_B())
         self.assertEqual("C", model2.state)
         self.assertEqual(machine.initial, model3.state)
+        self.assertEqual([True], asyncio.run(machine.adispatch_to([model2], "go")))
+        self.assertEqual(machine.initial, model2.state)
+        with self.assertRaises(RuntimeError):
+            machine.dispatch_to([model1], "go")
 
     def test_queued(self):
         states = ["A", "B", "C", "D"]
@@ -343,6 +347,92 @@ class TestAsync(TestTransitions):
 
         asyncio.run(run())
 
+    def test_coalesce(self):
+        values = []
+
+        async def burst():
+            for value in range(5):
+                await m.refresh(value, total=value)
+
+        def record(*args, **kwargs):
+            values.append((args, kwargs))
+
+        async def run():
+            await m.go()
+            self.assertEqual([((4,), {"total": 4})], values)
+            self.assertEqual(4, m.queue_stats.coalesced)
+            await m.refresh(9, total=9)
+            self.assertEqual(((9,), {"total": 9}), values[-1])
+            # drains of the asynchronous queue are recorded like those of synchronous machines
+            self.assertEqual((2, 3), (m.queue_stats.drains, m.queue_stats.processed))
+
+        for queued in (True, "model"):
+            values.clear()
+            m = self.machine_cls(states=["A", "B"], initial="A", queued=queued)
+            m.add_transition("go", "A", "B", after=burst)
+            m.add_transition("refresh", "B", None, after=record)
+            m.coalesce("refresh")
+            asyncio.run(run())
+
+    def test_queue_priority(self):
+        calls = []
+
+        async def burst():
+            await m.tick(1)
+            await m.abort()
+            await m.tick(2, queue_priority=5)
+            await m.tick(3)
+
+        def record(*args, **kwargs):
+            calls.append(args[0] if args else "abort")
+            self.assertNotIn("queue_priority", kwargs)
+
+        for queued in (True, "model"):
+            calls.clear()
+            m = self.machine_cls(states=["A", "B"], initial="A", queued=queued)
+            m.add_transition("go", "A", "B", after=burst)
+            m.add_transition("tick", "B", None, after=record)
+            m.add_transition("abort", "B", None, after=record)
+            m.prioritize("abort", 10)
+            asyncio.run(m.go())
+            self.assertEqual(["abort", 2, 1, 3], calls)
+
+    def test_queue_futures(self):
+        futures = []
+
+        async def burst():
+            futures.append(await m.fail())
+            futures.append(await m.to_A())
+            futures.append(await m.fail())
+            futures.append(await m.to_B())
+
+        async def run():
+            with self.assertRaises(MachineError):
+                await m.go()
+            self.assertFalse(await futures[0])
+            self.assertTrue(await futures[1])
+            with self.assertRaises(MachineError):
+                await futures[2]
+            self.assertTrue(futures[3].cancelled())
+            self.assertTrue(await (await m.to_C()))
+
+        for queued in (True, "model"):
+            futures.clear()
+            m = self.machine_cls(states=["A", "B", "C"], initial="A", queued=queued, queue_futures=True)
+            m.add_transition("go", "A", "B", after=burst)
+            m.add_transition("fail", "B", "C", conditions=lambda: False)
+            asyncio.run(run())
+
+        async def leave():
+            # the future of an event whose callback removes the model still resolves
+            self.assertTrue(await asyncio.wait_for(await model.leave(), 1))
+
+        model = DummyModel()
+        m = self.machine_cls(model, states=["A", "B"], initial="A", queued="model", queue_futures=True)
+        m.add_transition("leave", "A", "B", after=lambda: m.remove_model(model))
+        asyncio.run(leave())
+        self.assertEqual([], m.models)
+
     def test_queued_remove(self):
 
         def remove_model(event_data):
@@ -637,6 +727,31 @@ class TestAsync(TestTransitions):
 
         asyncio.run(run())
 
+    def test_may_trigger_all(self):
+        calls = []
+
+        def check():
+            calls.append("check")
+            return True
+
+        m = self.machine_cls(states=["A", "B", "C"], initial="A", auto_transitions=False, prepare_event=lambda: calls.append("prepare"))
+        m.add_transition("walk", "A", "B", conditions=[lambda: False])
+        m.add_transition("run", "A", "C")
+        m.add_transition("stop", "C", "A", conditions=check)
+        m.add_transition("hold", "C", "C", conditions=check)
+
+        async def run():
+            assert await m.may_trigger_all() == ["run"]
+            await m.run()
+            calls.clear()
+            assert await m.aget_available_triggers(m) == ["stop", "hold"]
+            # 'prepare_event' is called once and conditions with the same function are checked once
+            assert calls == ["prepare", "check"]
+
+        asyncio.run(run())
+        with self.assertRaises(RuntimeError):
+            m.get_available_triggers(m)
+
     def test_machine_may_transitions(self):
         states = ["A", "B", "C"]
         m = self.machine_cls(states=states, initial="A", auto_transitions=False)
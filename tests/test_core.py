@@ -1,18 +1,31 @@
+import gc
+import logging
 import sys
 import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
 from typing import TYPE_CHECKING, List
 from unittest import TestCase, skipIf
 
 from tfism import EventData, Machine, MachineError, State
-from tfism.core import Transition, _prep_ordered_arg, listify
+from tfism.core import (
+    _ATTRIBUTE,
+    _IMPORTED,
+    _METHOD,
+    _MODEL_CALLABLES,
+    DispatchResults,
+    Transition,
+    _prep_ordered_arg,
+    listify,
+    vectorized,
+)
 
 from .utils import DummyModel, InheritedStuff, Stuff
 
 try:
-    from unittest.mock import MagicMock
+    from unittest.mock import MagicMock, patch
 except ImportError:
-    from unittest.mock import MagicMock
+    from unittest.mock import MagicMock, patch
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -170,6 +183,31 @@ class TestTransitions(TestCase):
         s.advance()
         self.assertEqual(s.state, "C")
 
+    def test_vectorized_conditions(self):
+        class Account:
+            def __init__(self, balance):
+                self.balance = balance
+
+            @vectorized(lambda accounts, limit: [account.balance > limit for account in accounts])
+            def over_limit(self, limit):
+                return self.balance > limit
+
+            def is_open(self, limit):
+                return True
+
+        accounts = [Account(5), Account(20), Account(15)]
+        m = Machine(accounts, states=["A", "B"], initial="A")
+        m.add_transition("check", "A", "B", conditions="over_limit", unless="is_open")
+        conditions = m.get_transitions("check")[0].conditions
+        event_data = EventData(m.get_state("A"), m.events["check"], m, accounts[0], (), {"limit": 10})
+        self.assertEqual([False, True, True], conditions[0].check_batch(event_data, accounts))
+        self.assertIsNone(conditions[1].check_batch(event_data, accounts))
+        # the scalar form is used for single models
+        self.assertFalse(accounts[1].check(limit=10))
+        m.get_transitions("check")[0].conditions.pop()
+        self.assertTrue(accounts[1].check(limit=10))
+        self.assertFalse(accounts[0].check(limit=10))
+
     def test_multiple_add_transitions_from_state(self):
         s = self.stuff
         s.machine.add_transition("advance", "A", "B", conditions=["this_fails"])
@@ -331,6 +369,37 @@ class TestTransitions(TestCase):
         with self.assertRaises(AttributeError):
             m.to_C()
 
+    def test_auto_transitions_lazy(self):
+        import pickle
+
+        m = Machine(states=["A", "B"], initial="A")
+        m.add_transition("to_C", "A", "B")
+        m.add_state("C")
+        # transitions are created on demand
+        self.assertEqual(0, dict.__len__(m.events["to_B"].transitions))
+        self.assertIn("C", m.events["to_B"].transitions)
+        m.to_C()
+        self.assertEqual(1, dict.__len__(m.events["to_C"].transitions))
+        self.assertEqual(3, len(m.get_transitions("to_B")))
+        self.assertEqual(["A", "B", "C"], list(m.events["to_B"].transitions))
+        # previously added transitions are kept
+        self.assertEqual(4, len(m.get_transitions("to_C")))
+        self.assertEqual(["B", "C"], [t.dest for t in m.events["to_C"].transitions["A"]])
+        m.remove_transition("to_A", source="B")
+        m.add_state("D")
+        m.to_D()
+        m.to_A()
+        m.to_B()
+        with self.assertRaises(MachineError):
+            m.to_A()
+        self.assertEqual(["A", "C", "D"], [t.source for t in m.get_transitions("to_A")])
+        m2 = pickle.loads(pickle.dumps(m))
+        m2.add_state("E")
+        m2.to_E()
+        m2.to_B()
+        with self.assertRaises(MachineError):
+            m2.to_A()
+
     def test_ordered_transitions(self):
         states = ["beginning", "middle", "end"]
         m = Machine(states=states)
@@ -565,6 +634,57 @@ class TestTransitions(TestCase):
         self.assertEqual(self.stuff.state, model2.state)
         model2.to_F()
 
+    def test_model_binding_class(self):
+        class Model:
+            def __init__(self):
+                self.entered = 0
+
+            def on_enter_B(self):
+                self.entered += 1
+
+        m = Machine(model=None, states=["A", "B"], transitions=[["go", "A", "B"]], initial="A", model_binding="class")
+        model1, model2 = Model(), Model()
+        m.add_model([model1, model2])
+        self.assertIs(type(model1), type(model2))
+        self.assertIsInstance(model1, Model)
+        self.assertEqual({"entered", "state"}, set(vars(model1)))
+        self.assertTrue(model1.may_go())
+        self.assertTrue(model1.go())
+        self.assertTrue(model1.is_B())
+        self.assertEqual(1, model1.entered)
+        self.assertTrue(model2.is_A())
+        m.add_state("C")
+        m.add_transition("advance", "B", "C")
+        self.assertTrue(model1.trigger("advance"))
+        self.assertTrue(model1.is_C())
+        self.assertFalse(model2.may_trigger("advance"))
+        m.remove_transition("advance")
+        self.assertFalse(hasattr(model2, "advance"))
+        # the machine itself is bound by instance
+        m = Machine(states=["A", "B"], initial="A", model_binding="class")
+        self.assertIs(Machine, type(m))
+        m.to_B()
+        self.assertTrue(m.is_B())
+        with self.assertRaises(ValueError):
+            Machine(model_binding="model")
+
+    def test_model_binding_class_pickle(self):
+        import pickle
+
+        m = Machine(model=None, states=["A", "B", "C"], transitions=[["go", "A", "B"]], initial="A", model_binding="class")
+        model = DummyModel()
+        m.add_model(model)
+        model.go()
+        m2 = pickle.loads(pickle.dumps(m))
+        self.assertTrue(m2.models[0].is_B())
+        m2.models[0].to_C()
+        self.assertTrue(model.is_B())
+        model2 = pickle.loads(pickle.dumps(model))
+        self.assertIsInstance(model2, DummyModel)
+        model2.to_A()
+        self.assertTrue(model2.go())
+        self.assertTrue(model.is_B())
+
     def test_queued(self):
         states = ["A", "B", "C", "D"]
         # Define with list of dictionaries
@@ -610,6 +730,281 @@ class TestTransitions(TestCase):
         with self.assertRaises(ValueError):
             m.do(machine=m)
 
+    def test_model_queue(self):
+        order = []
+        m1 = DummyModel()
+        m2 = DummyModel()
+
+        def on_enter_B(event_data):
+            order.append((event_data.model, "B"))
+            if event_data.model is m1:
+                m1.to_C()
+                # events of other models are not queued behind m1's events
+                m2.go()
+                self.assertTrue(m2.is_B())
+                self.assertTrue(m1.is_B())
+
+        m = self.machine_cls(
+            model=[m1, m2],
+            states=["A", {"name": "B", "on_enter": on_enter_B}, "C"],
+            transitions=[["go", "A", "B"]],
+            initial="A",
+            queued="model",
+            send_event=True,
+        )
+        self.assertEqual("model", m.has_queue)
+        m1.go()
+        self.assertTrue(m1.is_C())
+        self.assertEqual([(m1, "B"), (m2, "B")], order)
+        self.assertEqual({}, m._transition_queue_dict)
+        m.add_transition("fail", "C", "A", before=partial(self.stuff.this_raises, ValueError))
+        m.add_transition("fail", "B", "A", after=m1.fail)
+        with self.assertRaises(ValueError):
+            m1.fail()
+        self.assertEqual({}, m._transition_queue_dict)
+        # removing a model drops its pending events
+        m = self.machine_cls(model=None, states=["A", "B", "C"], initial="A", queued="model")
+
+        class Model:
+            def __init__(self, remove):
+                self.remove = remove
+
+            def on_enter_B(self):
+                if self.remove:
+                    self.to_C()
+                    m.remove_model(self)
+                    self.to_A()
+
+            def on_enter_C(self):
+                raise RuntimeError("Event was not cancelled")
+
+        model = Model(remove=True)
+        other = Model(remove=False)
+        m.add_model([model, other])
+        model.to_B()
+        self.assertEqual("A", model.state)
+        self.assertEqual({}, m._transition_queue_dict)
+        other.to_B()
+        self.assertTrue(other.is_B())
+
+    def test_queue_capacity(self):
+        import pickle
+        import threading
+
+        from tfism.core import TransitionQueue
+
+        def cascade(event_data):
+            # queue three events while 'go' is processed
+            for _ in range(3):
+                event_data.model.tick()
+
+        def create(**kwargs):
+            m = Machine(states=["A", "B"], initial="A", queued=True, queue_capacity=2, send_event=True, **kwargs)
+            m.add_transition("go", "A", "B", after=cascade)
+            m.add_transition("tick", "B", "B", after=lambda event_data: ticks.append(event_data.transition))
+            return m
+
+        ticks = []
+        m = create()
+        with self.assertRaises(MachineError):
+            m.go()
+        self.assertEqual(0, len(m._transition_queue))
+        m = create(queue_overflow="drop_newest")
+        m.go()
+        self.assertEqual(2, len(ticks))
+        self.assertEqual(1, m.queue_stats.dropped)
+        self.assertEqual(3, m.queue_stats.high_water)
+        self.assertEqual(3, m.queue_stats.processed)
+        self.assertEqual(1, m.queue_stats.drains)
+        self.assertEqual(3.0, m.queue_stats.events_per_drain)
+        m.queue_stats.reset()
+        self.assertEqual(0, m.queue_stats.processed)
+        m = create(queue_overflow="drop_oldest")
+        m.to_A()
+        m.go()
+        self.assertEqual(1, m.queue_stats.dropped)
+        m2 = pickle.loads(pickle.dumps(Machine(states=["A"], initial="A", queued=True, queue_capacity=2, queue_overflow="drop_oldest")))
+        self.assertEqual(2, m2._transition_queue.capacity)
+        self.assertEqual("drop_oldest", m2._transition_queue.overflow)
+        self.assertIs(m2.queue_stats, m2._transition_queue.stats)
+        # the processing thread cannot wait for itself
+        m = create(queue_overflow="block")
+        with self.assertRaises(MachineError):
+            m.go()
+        with self.assertRaises(ValueError):
+            Machine(queued=True, queue_overflow="unknown")
+        # other threads wait until there is room in the queue
+        queue = TransitionQueue(capacity=1, overflow="block")
+        started = threading.Event()
+        release = threading.Event()
+        queue.append(lambda: started.set() or release.wait())
+        queue.append(lambda: None)
+        drainer = threading.Thread(target=queue.drain)
+        drainer.start()
+        started.wait()
+        appended = []
+        producer = threading.Thread(target=lambda: appended.append(queue.append(lambda: None)))
+        producer.start()
+        producer.join(0.05)
+        self.assertEqual([], appended)
+        release.set()
+        producer.join()
+        drainer.join()
+        self.assertEqual([True], appended)
+        # the drainer might have finished before the producer appended its trigger
+        self.assertLessEqual(len(queue), 1)
+        # producers check for room and append while holding the lock of the condition they wait for
+        with queue._not_full:
+            producer = threading.Thread(target=lambda: appended.append(queue.append(lambda: None)))
+            producer.start()
+            producer.join(0.05)
+            self.assertEqual([True], appended)
+        producer.join()
+        self.assertEqual([True, True], appended)
+
+    def test_queue_stats_threads(self):
+        import threading
+
+        # model queues of different models share the statistics but are drained by different threads
+        models = [DummyModel() for _ in range(8)]
+        m = Machine(models, states=["A", "B"], transitions=[["go", "A", "B"], ["go", "B", "A"]], initial="A", queued="model")
+
+        def work(model):
+            for _ in range(500):
+                model.go()
+
+        threads = [threading.Thread(target=work, args=(model,)) for model in models]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(4000, m.queue_stats.processed)
+        self.assertEqual(4000, m.queue_stats.drains)
+        self.assertEqual(1, m.queue_stats.high_water)
+
+    def test_coalesce(self):
+        def burst(*args, **kwargs):
+            # refresh is coalesced while 'go' is processed
+            for value in range(5):
+                m.refresh(value, total=value)
+
+        def record(*args, **kwargs):
+            values.append((args, kwargs))
+
+        for queued in (True, "model"):
+            values = []
+            m = self.machine_cls(states=["A", "B"], initial="A", queued=queued)
+            m.add_transition("go", "A", "B", after=burst)
+            m.add_transition("refresh", "B", None, after=record)
+            m.coalesce("refresh")
+            m.go()
+            self.assertEqual([((4,), {"total": 4})], values)
+            self.assertEqual(4, m.queue_stats.coalesced)
+            # a call which is already processed is not merged
+            m.refresh(9, total=9)
+            self.assertEqual(((9,), {"total": 9}), values[-1])
+        values = []
+        m.to_A()
+        m.coalesce("refresh", "first")
+        m.go()
+        self.assertEqual([((0,), {"total": 0})], values)
+        values = []
+        m.to_A()
+        m.coalesce("refresh", lambda queued, new: new if new.args[0] > queued.args[0] else queued)
+        m.go()
+        self.assertEqual([((4,), {"total": 4})], values)
+        values = []
+        m.to_A()
+        m.coalesce("refresh", None)
+        m.go()
+        self.assertEqual(5, len(values))
+        with self.assertRaises(ValueError):
+            m.coalesce("refresh", "unknown")
+        # merged calls with a higher priority move the pending call
+        values = []
+        m.to_A()
+        m.coalesce("refresh")
+        m.add_transition("tick", "B", None, after=record)
+        m.get_transitions("go")[0].after = [lambda: [m.tick(), m.refresh(1), m.refresh(2, queue_priority=5), m.refresh(3)]]
+        m.go()
+        self.assertEqual([((3,), {}), ((), {})], values)
+
+    def test_queue_priority(self):
+        def burst(*args, **kwargs):
+            m.tick(1)
+            m.tick(2)
+            m.abort()
+            m.tick(3, queue_priority=5)
+            m.tick(4, queue_priority=-1)
+            m.tick(5)
+
+        def record(*args, **kwargs):
+            calls.append(args[0] if args else "abort")
+            self.assertNotIn("queue_priority", kwargs)
+
+        for queued in (True, "model"):
+            calls = []
+            m = self.machine_cls(states=["A", "B"], initial="A", queued=queued)
+            m.add_transition("go", "A", "B", after=burst)
+            m.add_transition("tick", "B", None, after=record)
+            m.add_transition("abort", "B", None, after=record)
+            m.prioritize("abort", 10)
+            m.go()
+            self.assertEqual(["abort", 3, 1, 2, 5, 4], calls)
+        # overflowing queues drop the oldest trigger with the lowest priority
+        calls = []
+        m = self.machine_cls(states=["A", "B"], initial="A", queued=True, queue_capacity=5, queue_overflow="drop_oldest")
+        m.add_transition("go", "A", "B", after=burst)
+        m.add_transition("tick", "B", None, after=record)
+        m.add_transition("abort", "B", None, after=record)
+        m.prioritize("abort", 10)
+        m.prioritize("abort", 0)
+        m.go()
+        self.assertEqual([3, 1, 2, "abort", 5], calls)
+        # triggers are dropped themselves when all pending triggers have a higher priority
+        calls = []
+        m = self.machine_cls(states=["A", "B"], initial="A", queued=True, queue_capacity=2, queue_overflow="drop_oldest")
+        m.add_transition("go", "A", "B", after=lambda: [m.tick(1, queue_priority=5), m.tick(2, queue_priority=5), m.tick(3)])
+        m.add_transition("tick", "B", None, after=record)
+        m.go()
+        self.assertEqual([1, 2], calls)
+        self.assertEqual(1, m.queue_stats.dropped)
+
+    def test_queue_futures(self):
+        futures = []
+
+        def burst(*args, **kwargs):
+            futures.append(m.fail())
+            futures.append(m.to_A())
+            futures.append(m.fail())
+            futures.append(m.to_B())
+
+        for queued in (True, "model"):
+            futures.clear()
+            m = self.machine_cls(states=["A", "B", "C"], initial="A", queued=queued, queue_futures=True)
+            m.add_transition("go", "A", "B", after=burst)
+            m.add_transition("fail", "B", "C", conditions=lambda *args, **kwargs: False)
+            # the second 'fail' is processed in state A and raises an error which is passed to the caller of 'go'
+            with self.assertRaises(MachineError):
+                m.go()
+            self.assertFalse(futures[0].result())
+            self.assertTrue(futures[1].result())
+            self.assertIsInstance(futures[2].exception(), MachineError)
+            self.assertTrue(futures[3].cancelled())
+            result = m.to_C()
+            self.assertTrue(result.done())
+            self.assertTrue(result.result())
+
+        futures.clear()
+        m = self.machine_cls(
+            states=["A", "B", "C"], initial="A", queued=True, queue_futures=True, queue_capacity=1, queue_overflow="drop_newest"
+        )
+        m.add_transition("go", "A", "B", after=burst)
+        m.add_transition("fail", ["B", "C"], "C")
+        m.go()
+        self.assertTrue(futures[0].result())
+        self.assertTrue(all(future.cancelled() for future in futures[1:]))
+
     def test_queued_remove(self):
         m = self.machine_cls(model=None, states=["A", "B", "C"], initial="A", queued=True)
         assert_equal = self.assertEqual
@@ -801,6 +1196,37 @@ class TestTransitions(TestCase):
         # rather than a list
         self.assertNotIsInstance(m.model, list)
 
+    def test_model_registry(self):
+        import pickle
+
+        class Model:
+            def __eq__(self, other):
+                return True
+
+            __hash__ = object.__hash__
+
+        s1, s2, s3 = Model(), Model(), Model()
+        m = Machine(model=[s1, s2], states=["A", "B"], initial="A")
+        # models are identified by identity; equal models are still separate models
+        self.assertEqual(len(m.models), 2)
+        self.assertIn(s2, m.models)
+        self.assertNotIn(s3, m.models)
+        self.assertIs(s2, m.models[1])
+        self.assertIs(s2, m.models[-1])
+        self.assertEqual([s1], m.models[:1])
+        with self.assertRaises(IndexError):
+            _ = m.models[2]
+        for model in m.models:
+            m.remove_model(model)
+        self.assertFalse(m.models)
+        with self.assertRaises(ValueError):
+            m.remove_model(s1)
+        m.add_model([s3, s1])
+        self.assertEqual([s3, s1], m.models)
+        m2 = pickle.loads(pickle.dumps(Machine(model=[DummyModel(), DummyModel()], states=["A", "B"], initial="A")))
+        self.assertEqual(2, len(m2.models))
+        self.assertIn(m2.models[1], m2.models)
+
     def test_dispatch(self):
         s1, s2 = Stuff(), Stuff()
         states = ["A", "B", "C"]
@@ -821,6 +1247,94 @@ class TestTransitions(TestCase):
         self.assertEqual(s1.state, "A")
         self.assertEqual(s2.state, "C")
 
+    def test_dispatch_to(self):
+        s1, s2, s3 = Stuff(), Stuff(), Stuff()
+        m = Machine(model=[s1, s2, s3], states=["A", "B", "C"], initial="A", transitions=[["go", "A", "B"], ["go", "B", "C"]])
+        m.add_transition("check", "B", "C", conditions="is_false")
+        s2.to_B()
+        self.assertEqual([True], m.dispatch_to([s1], "go"))
+        self.assertEqual(["B", "B", "A"], [s1.state, s2.state, s3.state])
+        self.assertIsInstance(m.dispatch_to([s1, s2], "check"), DispatchResults)
+        self.assertTrue(m.dispatch_to([], "go"))
+        # invalid states are detected before any model is triggered
+        with self.assertRaises(MachineError):
+            m.dispatch("check")
+        self.assertEqual(["B", "B", "A"], [s1.state, s2.state, s3.state])
+        m.ignore_invalid_triggers = True
+        results = m.dispatch("check")
+        self.assertEqual([False, False, False], results)
+        self.assertFalse(results)
+        results = m.dispatch_to([s3, s1], "go")
+        self.assertEqual([True, True], results)
+        self.assertTrue(results)
+        self.assertEqual(["C", "B", "B"], [s1.state, s2.state, s3.state])
+
+    def test_dispatch_changed_states(self):
+        s1, s2, s3 = Stuff(), Stuff(), Stuff()
+        m = Machine(model=[s1, s2, s3], states=["A", "B", "C"], initial="A", transitions=[["go", "A", "B"], ["go", "B", "C"]])
+        m.add_transition("go", "C", "A", conditions="is_false")
+        s3.to_C()
+        # triggering the first model moves the others out of the states they have been grouped by
+        moved = []
+
+        def move_others():
+            if not moved:
+                moved.append(True)
+                s2.go()
+                s3.to_B()
+
+        m.get_transitions("go", "A", "B")[0].add_callback("after", move_others)
+        self.assertEqual([True, True, True], m.dispatch("go"))
+        self.assertEqual(["B", "C", "C"], [s1.state, s2.state, s3.state])
+
+    def test_dispatch_vectorized_conditions(self):
+        checks = []
+
+        def batch_over_limit(accounts, limit):
+            checks.append(len(accounts))
+            return [account.balance > limit for account in accounts]
+
+        class Account:
+            def __init__(self, balance):
+                self.balance = balance
+
+            @vectorized(batch_over_limit)
+            def over_limit(self, limit):
+                checks.append(1)
+                return self.balance > limit
+
+        accounts = [Account(balance) for balance in range(0, 100, 10)]
+        m = Machine(accounts, states=["open", "review"], initial="open")
+        m.add_transition("audit", "open", "review", conditions="over_limit", after=lambda limit: checks.append(limit))
+        self.assertEqual([False] * 7 + [True] * 3, m.dispatch("audit", limit=65))
+        # guards are evaluated once for the group and not again for the models which passed them
+        self.assertEqual([10, 65, 65, 65], checks)
+        self.assertEqual(3, sum(account.state == "review" for account in accounts))
+        checks.clear()
+        m.add_transition("audit", "open", "open")
+        self.assertEqual([True] * 7, m.dispatch_to(accounts[:7], "audit", limit=25))
+        self.assertEqual([7, 25, 25, 25, 25], checks)
+        self.assertEqual(["open"] * 3 + ["review"] * 4, [account.state for account in accounts[:7]])
+
+    def test_dispatch_executor(self):
+        models = [Stuff() for _ in range(10)]
+        m = Machine(models, states=["A", "B", "C"], initial="A", transitions=[["go", "A", "B"], ["go", "B", "C"]])
+        for model in models[::2]:
+            model.to_B()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            m.dispatch_executor = executor
+            m.dispatch_chunk_size = 3
+            self.assertTrue(m.dispatch("go"))
+            self.assertEqual(["C", "B"] * 5, [model.state for model in models])
+            self.assertEqual([True] * 5, m.dispatch_to(models[::2], "to_A"))
+            self.assertEqual(["A", "B"] * 5, [model.state for model in models])
+            self.assertEqual([True] * 10, m.dispatch("to_A"))
+            self.assertEqual(["A"] * 10, [model.state for model in models])
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            m.dispatch_executor = executor
+            with self.assertRaises(ValueError):
+                m.dispatch("go")
+
     def test_remove_model(self):
         m = self.machine_cls()
         self.assertIn(m, m.models)
@@ -875,6 +1389,240 @@ class TestTransitions(TestCase):
         trigger_state = m.get_triggers(m.states["B"])
         self.assertEqual(trigger_name, trigger_state)
 
+    def test_get_triggers_index(self):
+        m = Machine(states=["A", "B", "C"], transitions=[["go", "A", "B"]], initial="A", auto_transitions=False)
+        self.assertEqual(["go"], m.get_triggers("A"))
+        self.assertIn("A", m._trigger_index)
+        m.add_transition("jump", "A", "C")
+        m.add_transition("back", "C", "A")
+        self.assertEqual(["go", "jump"], m.get_triggers("A"))
+        self.assertEqual(["go", "jump", "back"], m.get_triggers("C", "A"))
+        self.assertTrue(m.may_jump())
+        m.remove_transition("go")
+        self.assertEqual(["jump"], m.get_triggers("A"))
+        self.assertFalse(m.may_trigger("go"))
+        m.add_state("D")
+        m.add_transition("go", "D", "A")
+        self.assertEqual(["go"], m.get_triggers("D"))
+        # callers may alter the result without corrupting the index
+        m.get_triggers("D").append("jump")
+        self.assertEqual(["go"], m.get_triggers("D"))
+
+    def test_freeze(self):
+        import pickle
+
+        calls = []
+        d = DummyModel()
+        m = Machine(
+            d,
+            states=["A", "B", State("C", final=True)],
+            initial="A",
+            auto_transitions=False,
+            before_state_change=lambda: calls.append("before_state_change"),
+            after_state_change=lambda: calls.append("after_state_change"),
+            on_final=lambda: calls.append("final"),
+        )
+        d.check = lambda: calls.append("check") or True
+        m.add_transition("go", "A", "B", prepare=lambda: calls.append("prepare"), conditions="check", after=lambda: calls.append("after"))
+        m.add_transition("go", "B", "C", unless=lambda: True)
+        m.add_transition("go", "B", "C", before=lambda: calls.append("before"))
+        m.add_transition("stay", "C", None)
+        m.on_enter_B(lambda: calls.append("enter_B"))
+        m.on_exit_A(lambda: calls.append("exit_A"))
+        m.freeze()
+        self.assertTrue(m.frozen)
+        self.assertTrue(d.go())
+        self.assertEqual(["prepare", "check", "before_state_change", "exit_A", "enter_B", "after", "after_state_change"], calls)
+        self.assertTrue(d.is_B())
+        del calls[:]
+        d.go()
+        self.assertEqual(["before_state_change", "before", "final", "after_state_change"], calls)
+        self.assertTrue(d.stay())
+        self.assertIsNotNone(m.events["go"].transitions["A"][0]._compiled)
+        for mutate in [
+            partial(m.add_state, "D"),
+            partial(m.add_transition, "back", "C", "A"),
+            partial(m.remove_transition, "go"),
+            partial(m.before_go, "check"),
+            partial(setattr, m, "after_state_change", []),
+        ]:
+            with self.assertRaises(MachineError):
+                mutate()
+        # models can still be added
+        d2 = DummyModel()
+        m.add_model(d2)
+        d2.check = lambda: True
+        self.assertTrue(d2.go())
+        m2 = pickle.loads(pickle.dumps(Machine(states=["A", "B"], transitions=[["go", "A", "B"]], initial="A")))
+        m2.freeze()
+        m2 = pickle.loads(pickle.dumps(m2))
+        self.assertTrue(m2.go())
+        self.assertTrue(m2.frozen)
+        with self.assertRaises(MachineError):
+            m2.add_state("C")
+
+    def test_freeze_custom_transition(self):
+        compiled = []
+
+        class CustomTransition(Transition):
+            def _change_state(self, event_data):
+                super()._change_state(event_data)
+
+            def _compile(self, machine):
+                compiled.append(self)
+                return super()._compile(machine)
+
+        class CustomMachine(Machine):
+            transition_cls = CustomTransition
+
+        m = CustomMachine(states=["A", "B"], transitions=[["go", "A", "B"], ["go", "B", "A"]], initial="A")
+        m.freeze()
+        for _ in range(4):
+            self.assertTrue(m.go())
+        # transitions which cannot be compiled are only checked once
+        self.assertEqual(2, len(compiled))
+        self.assertIs(False, compiled[0]._compiled)
+
+    def test_recycle_event_data(self):
+        seen = []
+
+        def record(event_data):
+            seen.append((id(event_data), event_data.model, event_data.args))
+            if event_data.event.name == "go" and event_data.model.is_B():
+                event_data.model.back()
+
+        d = DummyModel()
+        m = Machine(
+            d,
+            states=["A", "B"],
+            transitions=[["go", "A", "B"], ["back", "B", "A"]],
+            initial="A",
+            send_event=True,
+            after_state_change=record,
+            recycle_event_data=True,
+        )
+        d.go(1)
+        self.assertEqual(2, len(m._event_data_pool))
+        # the nested 'back' event used another instance
+        self.assertNotEqual(seen[0][0], seen[1][0])
+        self.assertTrue(all(event_data.model is None and event_data.args == () for event_data in m._event_data_pool))
+        pooled = {id(event_data) for event_data in m._event_data_pool}
+        del seen[:]
+        self.assertTrue(d.go(2))
+        self.assertEqual((d, (2,)), seen[0][1:])
+        self.assertIn(seen[0][0], pooled)
+        with self.assertRaises(MachineError):
+            d.back()
+        self.assertEqual(2, len(m._event_data_pool))
+        m = Machine(states=["A", "B"], transitions=[["go", "A", "B"]], initial="A", queued=True, recycle_event_data=True)
+        m.go()
+        self.assertEqual([], m._event_data_pool)
+
+    def test_dispatch_table(self):
+        m = Machine(states=["A", "B", "C"], transitions=[["go", "A", "B"]], initial="A", auto_transitions=False)
+        m.go()
+        self.assertEqual(m.state, "B")
+        self.assertIn(("A", m.events["go"]), m._dispatch_table)
+        # adding a transition must invalidate previously compiled entries
+        m.add_transition("go", "B", "C")
+        self.assertFalse(m._dispatch_table)
+        m.go()
+        self.assertEqual(m.state, "C")
+        with self.assertRaises(MachineError):
+            m.go()
+        m.add_transition("go", "C", "A")
+        m.go()
+        self.assertEqual(m.state, "A")
+        m.remove_transition("go", source="A")
+        with self.assertRaises(MachineError):
+            m.go()
+        m.add_state("D")
+        m.add_transition("go", "A", "D")
+        m.go()
+        self.assertEqual(m.state, "D")
+
+    def test_callable_cache(self):
+        class Model:
+            pass
+
+        model = Model()
+        m = Machine(model, states=["A", "B"], initial="A", send_event=True, after_state_change="tests.test_core.on_exit_B")
+        model.to_B()
+        self.assertTrue(model.exit_B_called)
+        # patched module attributes must be honoured even though the module has been cached
+        with patch("tests.test_core.on_exit_B") as mock:
+            model.to_A()
+            self.assertTrue(mock.called)
+        # a model class that later gains a dotted attribute is only considered after the cache has been cleared
+        patched = MagicMock()
+        setattr(Model, "tests.test_core.on_exit_B", patched)
+        model.to_B()
+        self.assertFalse(patched.called)
+        Machine.clear_callable_cache()
+        model.to_A()
+        self.assertTrue(patched.called)
+        delattr(Model, "tests.test_core.on_exit_B")
+        Machine.clear_callable_cache()
+        with self.assertRaises(AttributeError):
+            m.resolve_callable("tests.test_core.does_not_exist", EventData(None, None, m, model, (), {}))
+
+    def test_callable_kinds(self):
+        class Model:
+            value = 1
+
+            def check(self):
+                return True
+
+            @property
+            def ready(self):
+                return self.value > 0
+
+        model = Model()
+        m = Machine(model, states=["A", "B"], initial="A")
+        event_data = EventData(None, None, m, model, (), {})
+        self.assertTrue(m.resolve_callable("check", event_data)())
+        self.assertTrue(m.resolve_callable("ready", event_data)())
+        m.resolve_callable("tests.test_core.on_exit_B", event_data)
+        kinds = _MODEL_CALLABLES[id(Model)][1]
+        self.assertEqual([_METHOD, _ATTRIBUTE, _IMPORTED], [kinds[name] for name in ("check", "ready", "tests.test_core.on_exit_B")])
+        # methods and attributes are still retrieved from the model on every call
+        model.value = 0
+        self.assertFalse(m.resolve_callable("ready", event_data)())
+        model.check = lambda: False
+        self.assertFalse(m.resolve_callable("check", event_data)())
+        # attributes which are not callable and shadow a method are wrapped
+        model.check = False
+        self.assertFalse(m.resolve_callable("check", event_data)())
+        self.assertEqual(_METHOD, _MODEL_CALLABLES[id(Model)][1]["check"])
+        self.assertTrue(m.resolve_callable("check", EventData(None, None, m, Model(), (), {}))())
+        Machine.clear_callable_cache()
+        self.assertFalse(m.resolve_callable("check", event_data)())
+        self.assertEqual(_ATTRIBUTE, _MODEL_CALLABLES[id(Model)][1]["check"])
+        # entries are dropped with their class
+        key = id(Model)
+        m.remove_model(model)
+        del Model, model, event_data
+        gc.collect()
+        self.assertNotIn(key, _MODEL_CALLABLES)
+
+    def test_log_guards(self):
+        logger = logging.getLogger("tfism.core")
+        previous_level = logger.level
+        m = Machine(states=["A", "B"], initial="A", after_state_change=lambda: None)
+        try:
+            logger.setLevel(logging.WARNING)
+            m.to_B()
+            self.assertFalse(m._log_debug)
+            self.assertFalse(m._log_info)
+            # guards are refreshed when the next event is processed
+            with self.assertLogs(logger, level=logging.DEBUG) as logs:
+                m.to_A()
+            self.assertTrue(m._log_debug)
+            self.assertTrue(any("Entering state A" in msg for msg in logs.output))
+            self.assertTrue(any("Executed callback" in msg for msg in logs.output))
+        finally:
+            logger.setLevel(previous_level)
+
     def test_skip_override(self):
         local_mock = MagicMock()
 
@@ -1300,6 +2048,30 @@ class TestTransitions(TestCase):
         assert not d.may_walk()
         assert not d.may_trigger("walk")
 
+    def test_may_trigger_all(self):
+        checks = []
+        prepared = []
+
+        def check(value=True):
+            checks.append(value)
+            return value
+
+        d = DummyModel()
+        m = Machine(model=d, states=["A", "B", "C"], initial="A", prepare_event=lambda **kwargs: prepared.append(1))
+        m.add_transition("walk", "A", "B", conditions=check)
+        m.add_transition("run", "A", "C", conditions=check, unless=lambda **kwargs: False)
+        m.add_transition("stop", "B", "C")
+        m.add_transition("jump", "A", "UNKNOWN")
+        # prepare callbacks of transitions might change the result of conditions which are checked again
+        m.add_transition("hop", "A", "B", prepare=lambda **kwargs: prepared.append(2), conditions=check)
+        self.assertEqual(["to_A", "to_B", "to_C", "walk", "run", "hop"], d.may_trigger_all())
+        self.assertEqual([1, 2], prepared)
+        self.assertEqual([True, True], checks)
+        self.assertEqual(["to_A", "to_B", "to_C"], d.may_trigger_all(value=False))
+        self.assertEqual(["to_A", "to_B", "to_C", "walk", "run", "hop"], m.get_available_triggers(d))
+        d.walk()
+        self.assertEqual(["to_A", "to_B", "to_C", "stop"], d.may_trigger_all())
+
     def test_may_transition_with_exception(self):
         stuff = Stuff(machine_cls=self.machine_cls, extra_kwargs={"send_event": True})
         stuff.machine.add_transition(
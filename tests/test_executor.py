@@ -0,0 +1,98 @@
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from unittest import TestCase
+
+from tfism import MachineError
+from tfism.extensions import ExecutorMachine
+
+from .utils import DummyModel, Stuff
+
+
+class TestExecutor(TestCase):
+    def setUp(self):
+        self.machine_cls = ExecutorMachine
+        self.stuff = Stuff(machine_cls=self.machine_cls, extra_kwargs={"max_workers": 4})
+
+    def tearDown(self):
+        self.stuff.machine.shutdown()
+
+    def test_futures(self):
+        m = self.stuff.machine
+        m.add_transition("forward", "A", "B")
+        future = self.stuff.to_A()
+        self.assertTrue(future.result(timeout=1))
+        self.assertTrue(self.stuff.forward().result(timeout=1))
+        self.assertTrue(self.stuff.is_B())
+        # the second 'forward' is processed in state B and raises; later events are still processed
+        self.assertIsInstance(self.stuff.forward().exception(timeout=1), MachineError)
+        self.assertTrue(self.stuff.to_C().result(timeout=1))
+        self.assertTrue(self.stuff.is_C())
+
+    def test_model_order(self):
+        m = self.machine_cls(states=["A", "B"], initial="A", max_workers=4)
+        models = [DummyModel() for _ in range(3)]
+        calls = {id(model): [] for model in models}
+
+        def record(event_data):
+            time.sleep(0.001)
+            calls[id(event_data.model)].append(event_data.kwargs["value"])
+
+        m.send_event = True
+        m.add_model(models)
+        m.add_transition("tick", "A", "A", after=record)
+        futures = [m.events["tick"].trigger(model, value=value) for value in range(10) for model in models]
+        for future in futures:
+            future.result(timeout=5)
+        self.assertEqual([list(range(10))] * 3, list(calls.values()))
+        m.shutdown()
+
+    def test_parallel_models(self):
+        # both callbacks have to wait for each other which only works when models are processed in parallel
+        barrier = threading.Barrier(2, timeout=5)
+        m = self.machine_cls(model=[DummyModel(), DummyModel()], states=["A", "B"], initial="A", max_workers=2)
+        m.add_transition("go", "A", "B", after=barrier.wait)
+        futures = [model.go() for model in m.models]
+        self.assertEqual([True, True], [future.result(timeout=5) for future in futures])
+        m.shutdown()
+
+    def test_queued_callbacks(self):
+        m = self.stuff.machine
+        results = []
+
+        def cascade():
+            results.append(self.stuff.to_C())
+            results.append(self.stuff.is_B())
+
+        m.add_transition("forward", "A", "B", after=cascade)
+        self.stuff.to_A().result(timeout=1)
+        self.assertTrue(self.stuff.forward().result(timeout=1))
+        self.assertTrue(results[0].result(timeout=1))
+        self.assertTrue(results[1])
+        self.assertTrue(self.stuff.is_C())
+
+    def test_remove_model(self):
+        release = threading.Event()
+        m = self.machine_cls(model=None, states=["A", "B"], initial="A", max_workers=1)
+        model = DummyModel()
+        m.add_model(model)
+        m.add_transition("go", "A", "B", after=lambda: release.wait(5))
+        m.add_transition("back", "B", "A")
+        running = model.go()
+        pending = model.back()
+        m.remove_model(model)
+        release.set()
+        self.assertTrue(running.result(timeout=5))
+        with self.assertRaises(CancelledError):
+            pending.result(timeout=1)
+        self.assertEqual({}, m._transition_queue_dict)
+        m.shutdown()
+
+    def test_external_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            m = self.machine_cls(states=["A", "B"], initial="A", executor=executor)
+            self.assertTrue(m.to_B().result(timeout=1))
+            m.shutdown()
+            self.assertTrue(m.to_A().result(timeout=1))
+        with self.assertRaises(ValueError):
+            self.machine_cls(queue_overflow="block")
@@ -20,17 +20,18 @@ class TestFactory(TestCase):
         locked_cls = self.factory.get_predefined(locked=True)
         self.assertFalse(hasattr(locked_cls, "_get_graph"))
         self.assertFalse(hasattr(locked_cls, "get_nested_triggers"))
-        self.assertTrue("__getattribute__" in locked_cls.__dict__)
+        # public methods are wrapped once when the class is created
+        self.assertIs(locked_cls.get_state.__wrapped__, machine_cls.get_state)
 
         locked_nested_cls = self.factory.get_predefined(nested=True, locked=True)
         self.assertFalse(hasattr(locked_nested_cls, "_get_graph"))
         self.assertTrue(hasattr(locked_nested_cls, "get_nested_triggers"))
-        self.assertEqual(locked_nested_cls.__getattribute__, locked_cls.__getattribute__)
-        self.assertNotEqual(machine_cls.__getattribute__, locked_cls.__getattribute__)
+        self.assertIs(locked_nested_cls.get_state.__wrapped__, nested_cls.get_state)
+        self.assertIs(locked_nested_cls.add_model.__wrapped__, locked_cls.add_model.__wrapped__)
 
         graph_locked_cls = self.factory.get_predefined(graph=True, locked=True)
         self.assertTrue(hasattr(graph_locked_cls, "_get_graph"))
-        self.assertEqual(graph_locked_cls.__getattribute__, locked_cls.__getattribute__)
+        self.assertIs(graph_locked_cls.get_state.__wrapped__, machine_cls.get_state)
 
         graph_nested_cls = self.factory.get_predefined(graph=True, nested=True)
         self.assertNotEqual(nested_cls._create_transition, graph_nested_cls._create_transition)
@@ -1,6 +1,7 @@
 def test_imports() -> None:
     from tfism import Machine
     from tfism.extensions import (
+        ExecutorMachine,
         GraphMachine,
         HierarchicalGraphMachine,
         HierarchicalMachine,
@@ -9,6 +10,8 @@ def test_imports() -> None:
         LockedHierarchicalMachine,
         LockedMachine,
         MachineFactory,
+        ShardedMachine,
+        TableMachine,
     )
 
     try:
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import logging
 import sys
 import tempfile
 from functools import partial
@@ -7,6 +8,7 @@ from os import unlink
 from os.path import getsize
 from unittest import skipIf
 
+from tfism import MachineError
 from tfism.extensions import HierarchicalGraphMachine
 from tfism.extensions.nesting import HierarchicalMachine, NestedState
 
@@ -277,6 +279,10 @@ class TestNestedTransitions(TestTransitions):
         m.next_state()
         self.assertEqual(m.state, f"first{State.separator}second")
 
+    def test_model_binding_unsupported(self):
+        with self.assertRaises(ValueError):
+            self.stuff.machine_cls(states=["A", "B"], initial="A", model_binding="class")
+
     def test_pickle(self):
         print("separator", self.state_cls.separator)
         if sys.version_info < (3, 4):
@@ -416,6 +422,75 @@ class TestNestedTransitions(TestTransitions):
         self.assertEqual(len(trans), 3)
         self.assertTrue("relax" in trans)
 
+    def test_freeze(self):
+        machine = self.stuff.machine_cls(states=["A", {"name": "B", "children": ["1", "2"]}], initial="A")
+        machine.add_transition("go", "A", "B")
+        machine.freeze()
+        for mutate in [partial(machine.add_state, "C"), partial(machine.remove_transition, "go")]:
+            with self.assertRaises(MachineError):
+                mutate()
+        machine.go()
+        self.assertEqual("B", machine.state)
+
+    def test_may_trigger_all(self):
+        seperator = self.state_cls.separator
+        calls = []
+
+        def check():
+            calls.append("check")
+            return True
+
+        states = ["standing", {"name": "caffeinated", "children": ["dithering", "running"]}]
+        transitions = [
+            ["walk", f"caffeinated{seperator}dithering", f"caffeinated{seperator}running", check],
+            ["relax", "caffeinated", "standing", check],
+            ["drink", "standing", f"caffeinated{seperator}dithering"],
+            ["sprint", f"caffeinated{seperator}running", f"caffeinated{seperator}running"],
+        ]
+        model = Dummy()
+        machine = self.stuff.machine_cls(
+            model,
+            states=states,
+            transitions=transitions,
+            initial="standing",
+            auto_transitions=False,
+            prepare_event=lambda: calls.append("prepare"),
+        )
+        self.assertEqual(["drink"], model.may_trigger_all())
+        model.drink()
+        calls.clear()
+        self.assertEqual(["walk", "relax"], machine.get_available_triggers(model))
+        # 'prepare_event' is called once and conditions with the same function are checked once
+        self.assertEqual(["prepare", "check"], calls)
+
+    def test_nested_log_guards(self):
+        writes = []
+
+        class Counted(self.stuff.machine_cls):  # type: ignore
+            def __setattr__(self, key, value):
+                if key in ("_log_debug", "_log_info"):
+                    writes.append(key)
+                super().__setattr__(key, value)
+
+        core_logger = logging.getLogger("tfism.core")
+        logger = logging.getLogger("tfism.extensions.nesting")
+        previous_levels = core_logger.level, logger.level
+        m = Counted(states=["A", "B"], initial="A")
+        try:
+            core_logger.setLevel(logging.WARNING)
+            logger.setLevel(logging.DEBUG)
+            m.to_B()
+            self.assertTrue(m._log_debug)
+            self.assertTrue(m._log_info)
+            # the guards are only written when the levels change
+            writes.clear()
+            m.to_A()
+            m.to_B()
+            self.assertEqual([], writes)
+        finally:
+            core_logger.setLevel(previous_levels[0])
+            logger.setLevel(previous_levels[1])
+
     def test_get_nested_transitions(self):
         seperator = self.state_cls.separator
         states = [
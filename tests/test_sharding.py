@@ -0,0 +1,84 @@
+from concurrent.futures import wait
+from unittest import TestCase
+
+from tfism import MachineError
+from tfism.extensions.markup import MarkupMachine
+from tfism.extensions.sharding import ShardedMachine, ShardModel
+
+
+class CountingModel(ShardModel):
+    """Model used by worker processes; it has to be importable."""
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.count = 0
+
+    def increase(self, value=1):
+        self.count += value
+
+    def counted(self):
+        return self.count
+
+
+class TestSharding(TestCase):
+    def setUp(self):
+        machine = MarkupMachine(
+            states=["A", "B", "C"],
+            transitions=[
+                {"trigger": "go", "source": "A", "dest": "B", "after": "increase"},
+                {"trigger": "go", "source": "B", "dest": "C"},
+                {"trigger": "back", "source": "*", "dest": "A"},
+            ],
+            initial="A",
+            auto_transitions=False,
+        )
+        self.machine = ShardedMachine(machine.markup, shards=2, model_factory=CountingModel, batch_size=4)
+
+    def tearDown(self):
+        self.machine.close()
+
+    def test_trigger(self):
+        m = self.machine
+        futures = [m.add_model(key) for key in range(10)]
+        m.add_model("custom", initial="C")
+        with self.assertRaises(ValueError):
+            m.add_model("custom")
+        with self.assertRaises(ValueError):
+            m.trigger("unknown", "go")
+        self.assertEqual(10, sum(m.shard_sizes) - 1)
+        results = [m.trigger(key, "go") for key in range(10)]
+        # batches are sent when a result is requested
+        self.assertTrue(results[-1].result(timeout=5))
+        m.flush()
+        wait(futures + results, timeout=5)
+        self.assertTrue(all(future.result() for future in results))
+        self.assertEqual("B", m.get_model_state(3).result(timeout=5))
+        self.assertEqual("C", m.get_model_state("custom").result(timeout=5))
+        # errors of a request are passed to its future only
+        self.assertIsInstance(m.trigger("custom", "go").exception(timeout=5), MachineError)
+        self.assertTrue(m.trigger("custom", "back").result(timeout=5))
+        self.assertEqual("A", m.remove_model("custom").result(timeout=5))
+        with self.assertRaises(ValueError):
+            m.shard_of("custom")
+
+    def test_rebalance(self):
+        m = self.machine
+        for key in range(12):
+            m.add_model(key)
+            m.trigger(key, "go")
+        for key in range(12):
+            if m.shard_of(key) == 0:
+                m.remove_model(key)
+        self.assertEqual([0, 6], m.shard_sizes)
+        self.assertEqual(3, m.rebalance())
+        self.assertEqual([3, 3], m.shard_sizes)
+        keys = [key for key in range(12) if key % 2]
+        # moved models keep their state
+        self.assertTrue(all(m.get_model_state(key).result(timeout=5) == "B" for key in keys))
+        self.assertEqual(2, m.rebalance(shards=3))
+        self.assertEqual([2, 2, 2], m.shard_sizes)
+        self.assertEqual(4, m.rebalance(shards=1))
+        self.assertEqual([6], m.shard_sizes)
+        self.assertTrue(all(m.trigger(key, "go").result(timeout=5) for key in keys))
+        with self.assertRaises(ValueError):
+            m.rebalance(shards=0)
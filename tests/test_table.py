@@ -0,0 +1,229 @@
+from enum import Enum
+from unittest import TestCase, skipIf
+
+from tfism import MachineError, State
+from tfism.core import vectorized
+from tfism.extensions import TableMachine
+from tfism.extensions.table import RowGroup, RowModel
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+class Phase(Enum):
+    IDLE = 1
+    BUSY = 2
+
+
+class TestTable(TestCase):
+    def setUp(self):
+        self.machine = TableMachine(
+            states=["A", "B", "C"],
+            transitions=[["go", "A", "B"], ["go", "B", "C"], ["stay", "A", None], ["reset", "*", "A"]],
+            initial="A",
+            auto_transitions=False,
+        )
+
+    def test_trigger_rows(self):
+        m = self.machine
+        self.assertEqual(range(0, 5), m.add_rows(5))
+        self.assertEqual(range(5, 7), m.add_rows(2, initial="C"))
+        self.assertEqual(["A", "B", "C"], m.table.names)
+        self.assertEqual([True, True, True], m.trigger_rows("go", [0, 1, 2]))
+        self.assertEqual([True, True], m.trigger_rows("go", [0, 1]))
+        self.assertEqual("C", m.table[0])
+        self.assertEqual([True], m.trigger_rows("stay", [3]))
+        self.assertEqual("A", m.table[3])
+        self.assertEqual(2, m.table.count("A"))
+        self.assertEqual(4, m.table.count("C"))
+        # no row models are needed for transitions without callbacks
+        self.assertEqual([], m.models)
+        with self.assertRaises(MachineError):
+            m.trigger_rows("go", [5])
+        with self.assertRaises(AttributeError):
+            m.trigger_rows("unknown", [0])
+        m.ignore_invalid_triggers = True
+        self.assertEqual([False, True], m.trigger_rows("go", [5, 3]))
+        self.assertEqual("B", m.table[3])
+
+    def test_row_models(self):
+        m = self.machine
+        m.add_rows(3)
+        entered = []
+        m.add_transition("check", "A", "B", conditions=lambda value: value > 0)
+        m.on_enter_C(lambda value=None: entered.append(value))
+        self.assertEqual([False, False], m.trigger_rows("check", [0, 1], 0))
+        self.assertEqual([True], m.trigger_rows("check", [0], 1))
+        self.assertEqual(2, len(m.models))
+        model = m.row_model(0)
+        self.assertIsInstance(model, RowModel)
+        self.assertIs(model, m.models[0])
+        self.assertTrue(model.is_B())
+        # models and the table share the state
+        self.assertEqual([True], m.trigger_rows("go", [0], 5))
+        self.assertEqual([5], entered)
+        self.assertTrue(model.is_C())
+        self.assertTrue(model.reset())
+        self.assertEqual("A", m.table[0])
+        m.release_row_model(0)
+        self.assertNotIn(model, m.models)
+        self.assertEqual([True], m.trigger_rows("go", [0]))
+        self.assertEqual("B", m.table[0])
+        with self.assertRaises(IndexError):
+            m.row_model(3)
+
+    def test_states(self):
+        m = TableMachine(states=Phase, transitions=[["go", Phase.IDLE, Phase.BUSY]], initial=Phase.IDLE)
+        m.add_rows(2)
+        self.assertEqual([True], m.trigger_rows("go", [1]))
+        self.assertEqual(Phase.BUSY, m.table[1])
+        self.assertEqual(Phase.BUSY, m.row_model(1).state)
+        # the column is widened when states are added
+        m = self.machine
+        m.add_rows(2)
+        self.assertEqual("B", m.table.column.typecode)
+        m.add_states(["S%d" % index for index in range(300)])
+        self.assertEqual("H", m.table.column.typecode)
+        m.add_transition("jump", "A", "S299")
+        self.assertEqual([True, True], m.trigger_rows("jump", [0, 1]))
+        self.assertEqual("S299", m.table[1])
+
+    def test_frozen(self):
+        m = self.machine
+        m.add_rows(2)
+        m.freeze()
+        self.assertEqual([True, True], m.trigger_rows("go", range(2)))
+        self.assertIn(m.events["go"], m._row_lookups)
+        self.assertEqual([True, True], m.trigger_rows("go", range(2)))
+        self.assertEqual(2, m.table.count("C"))
+
+
+@skipIf(np is None, "Vectorized transitions require NumPy.")
+class TestTableVectorized(TestCase):
+    def setUp(self):
+        self.groups = []
+        self.machine = TableMachine(
+            states=["A", "B", "C", {"name": "D", "on_enter": self.record}],
+            transitions=[["go", "A", "B"], ["go", "B", "C"], ["go", "C", "D"], ["stay", "*", None], ["check", "A", "B", "is_ready"]],
+            initial="A",
+            auto_transitions=False,
+            send_event=True,
+        )
+
+    def record(self, event_data):
+        self.groups.append((event_data.model, event_data.state.name, event_data.kwargs))
+
+    def test_compile_event(self):
+        m = self.machine
+        self.assertEqual([1, 2, 3, -1], m.compile_event("go").tolist())
+        self.assertEqual([0, 1, 2, 3], m.compile_event("stay").tolist())
+        self.assertEqual([-3, -1, -1, -1], m.compile_event("check").tolist())
+        with self.assertRaises(AttributeError):
+            m.compile_event("unknown")
+        m.freeze()
+        self.assertIs(m.compile_event("go"), m.compile_event("go"))
+
+    def test_compile_event_custom_states(self):
+        entered = []
+
+        class CustomState(State):
+            def enter(self, event_data):
+                entered.append(self.name)
+                super().enter(event_data)
+
+        class CustomMachine(TableMachine):
+            state_cls = CustomState
+
+        m = CustomMachine(states=["A", "B"], transitions=[["go", "A", "B"], ["stay", "A", None]], initial="A", auto_transitions=False)
+        m.add_rows(2)
+        # overridden state methods would be skipped by vectorized transitions
+        with self.assertRaises(ValueError):
+            m.advance_rows("go")
+        self.assertEqual([0, -1], m.compile_event("stay").tolist())
+        self.assertEqual([True, True], m.trigger_rows("go", [0, 1]))
+        self.assertEqual(["B", "B"], entered)
+
+    def test_advance_rows(self):
+        m = self.machine
+        m.add_rows(6)
+        self.assertEqual([True] * 6, m.advance_rows("go").tolist())
+        self.assertEqual([True, True], m.advance_rows("go", [0, 1]).tolist())
+        self.assertEqual([True, True], m.advance_rows("go", np.array([0, 5])).tolist())
+        self.assertEqual(["D", "C", "B", "B", "B", "C"], [m.table[row] for row in range(6)])
+        self.assertEqual([([0], "D")], [(group.rows.tolist(), state) for group, state, _ in self.groups])
+        # callbacks are called once per group of rows entering 'D'
+        del self.groups[:]
+        self.assertEqual([True] * 5, m.advance_rows("go", [1, 2, 3, 4, 5], value=1).tolist())
+        self.assertEqual(1, len(self.groups))
+        group, state, kwargs = self.groups[0]
+        self.assertIsInstance(group, RowGroup)
+        self.assertEqual(("C", "D"), (group.source, group.dest))
+        self.assertEqual([1, 5], group.rows.tolist())
+        self.assertEqual("D", state)
+        self.assertEqual({"value": 1}, kwargs)
+        # unchanged rows do not cause callbacks
+        self.assertEqual([True] * 6, m.advance_rows("stay").tolist())
+        self.assertEqual(1, len(self.groups))
+        # rows are not changed when the event is invalid for some of them
+        with self.assertRaises(MachineError):
+            m.advance_rows("go")
+        self.assertEqual(3, m.table.count("D"))
+        m.ignore_invalid_triggers = True
+        self.assertEqual([False, False, True], m.advance_rows("go", [0, 1, 2]).tolist())
+        self.assertEqual("D", m.table[2])
+
+    def test_row_models(self):
+        m = self.machine
+        m.add_rows(3)
+        model = m.row_model(1)
+        m.advance_rows("go")
+        self.assertTrue(model.is_B())
+        self.assertEqual(3, m.table.count("B"))
+        self.assertEqual([], m.advance_rows("go", []).tolist())
+
+    def test_advance_rows_conditions(self):
+        balances = np.array([5, 20, 15, 30, 0])
+        checks = []
+
+        def over_limit(event_data):
+            checks.append(event_data.model.rows.tolist())
+            return balances[event_data.model.rows] > event_data.kwargs["limit"]
+
+        @vectorized(over_limit)
+        def is_over_limit(event_data):
+            raise AssertionError("The vectorized form should be used.")
+
+        def is_even(event_data):
+            checks.append("scalar")
+            self.assertIsInstance(event_data.model, RowModel)
+            return event_data.model.row % 2 == 1
+
+        m = TableMachine(
+            states=["low", "high", "flagged", {"name": "blocked", "on_enter": self.record}],
+            transitions=[
+                {"trigger": "review", "source": "low", "dest": "blocked", "conditions": [is_over_limit, is_even], "unless": is_over_limit},
+                {"trigger": "review", "source": "low", "dest": "high", "conditions": is_over_limit},
+                {"trigger": "review", "source": "high", "dest": "flagged"},
+            ],
+            initial="low",
+            auto_transitions=False,
+            send_event=True,
+        )
+        m.add_rows(5)
+        m.table[4] = "high"
+        self.assertEqual([False, True, True, True, True], m.advance_rows("review", limit=10).tolist())
+        self.assertEqual(["low", "high", "high", "high", "flagged"], [m.table[row] for row in range(5)])
+        # guards are evaluated once per batch of remaining rows in the same state, scalar guards once per row
+        self.assertEqual([[0, 1, 2, 3], [1, 3], [0, 1, 2, 3]], [check for check in checks if check != "scalar"])
+        self.assertEqual(3, checks.count("scalar"))
+        # scalar guards do not add row models to the machine
+        self.assertEqual([], m.models)
+        self.assertFalse(self.groups)
+        # groups of rows are processed per transition
+        m.table[1] = "low"
+        m.get_transitions("review", "low", "blocked")[0].conditions.pop()
+        self.assertEqual([False, True], m.advance_rows("review", [0, 1], limit=10).tolist())
+        self.assertEqual(["low", "blocked"], [m.table[row] for row in range(2)])
+        self.assertEqual([([1], "blocked")], [(group.rows.tolist(), state) for group, state, _ in self.groups])
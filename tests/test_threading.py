@@ -114,6 +114,149 @@ class TestLockedTransitions(TestTransitions):
         self.assertAlmostEqual(fast - begin, 0, delta=0.1)
         self.assertAlmostEqual(blocked - begin, 1, delta=0.1)
 
+    def test_lock_modes(self):
+        import pickle
+        from threading import Event
+
+        def run(lock_mode, **kwargs):
+            release = Event()
+            m1, m2 = DummyModel(), DummyModel()
+            machine = self.machine_cls(model=[m1, m2], states=["A", "B"], initial="A", lock_mode=lock_mode, **kwargs)
+            machine.add_transition("block", "A", "B", after=lambda: release.wait(1))
+            machine.add_transition("go", "A", "B")
+            machine.add_transition("back", "B", "A")
+            thread = Thread(target=m1.block)
+            thread.start()
+            time.sleep(0.01)
+            begin = time.time()
+            # m2 is only blocked when it shares a lock with m1
+            m2.go()
+            m2.back()
+            elapsed = time.time() - begin
+            release.set()
+            thread.join()
+            self.assertTrue(m1.is_B())
+            return elapsed, machine
+
+        elapsed, machine = run("model")
+        self.assertLess(elapsed, 0.5)
+        # structural changes take the machine context
+        machine.add_transition("reset", "*", "A")
+        elapsed, machine = run("striped", lock_stripes=1)
+        self.assertGreater(elapsed, 0.5)
+        elapsed, machine = run("machine")
+        self.assertGreater(elapsed, 0.5)
+        machine = pickle.loads(pickle.dumps(self.machine_cls(states=["A"], initial="A", lock_mode="model")))
+        self.assertTrue(machine.to_A())
+        with self.assertRaises(ValueError):
+            self.machine_cls(lock_mode="unknown")
+        with self.assertRaises(ValueError):
+            self.machine_cls(lock_mode="model", queued=True)
+
+    def test_dispatch_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run(lock_mode):
+            models = [DummyModel() for _ in range(10)]
+            machine = self.machine_cls(model=models, states=["A", "B", "C"], initial="A", lock_mode=lock_mode)
+            machine.add_transition("go", "A", "B")
+            machine.add_transition("go", "B", "C")
+            machine.add_transition("spread", "C", "A", after=lambda: machine.dispatch_to(models, "to_B"))
+            machine.dispatch_executor = executor
+            machine.dispatch_chunk_size = 2
+            results = []
+            # workers must not wait for contexts held by the dispatching thread
+            thread = Thread(target=lambda: results.extend([machine.dispatch("go"), models[0].go()]))
+            thread.start()
+            thread.join(5)
+            self.assertFalse(thread.is_alive(), lock_mode)
+            self.assertTrue(all(results), lock_mode)
+            self.assertEqual(["C"] + ["B"] * 9, [model.state for model in models])
+            if lock_mode in ("machine", "rw"):
+                # dispatches from callbacks are processed by the thread holding the machine's contexts
+                thread = Thread(target=lambda: results.append(models[0].spread()))
+                thread.start()
+                thread.join(5)
+                self.assertFalse(thread.is_alive(), lock_mode)
+                self.assertEqual([True] * 3, [bool(result) for result in results])
+                self.assertEqual(["B"] * 10, [model.state for model in models])
+
+        executor = ThreadPoolExecutor(max_workers=4)
+        try:
+            for lock_mode in self.machine_cls.lock_modes:
+                run(lock_mode)
+        finally:
+            executor.shutdown(wait=False)
+
+    def test_read_write_lock(self):
+        import pickle
+        from threading import Event
+
+        reading, release = Event(), Event()
+
+        def check():
+            reading.set()
+            return release.wait(1)
+
+        m1, m2 = DummyModel(), DummyModel()
+        machine = self.machine_cls(model=[m1, m2], states=["A", "B"], initial="A", lock_mode="rw")
+        machine.add_transition("go", "A", "B", conditions=check)
+        thread = Thread(target=m1.may_go)
+        thread.start()
+        reading.wait(1)
+        begin = time.time()
+        # reads are not blocked by other readers
+        self.assertTrue(m2.is_A())
+        self.assertEqual(["go"], machine.get_triggers("A")[-1:])
+        self.assertLess(time.time() - begin, 0.5)
+        # writes wait for readers
+        m2.to_B()
+        self.assertGreater(time.time() - begin, 0.5)
+        thread.join()
+        self.assertTrue(m2.is_B())
+        # reads and writes are reentrant but a reader cannot write
+        machine.add_transition("check", "A", "A", conditions=lambda: m1.is_A() and machine.get_state("A") is not None)
+        release.set()
+        self.assertTrue(m1.check())
+        machine.add_transition("upgrade", "A", "B", conditions=lambda: m1.to_B())
+        with self.assertRaises(RuntimeError):
+            m1.may_upgrade()
+        machine = pickle.loads(pickle.dumps(self.machine_cls(states=["A", "B"], initial="A", lock_mode="rw")))
+        self.assertIs(machine._rw_lock, machine.machine_context[0])
+        self.assertTrue(machine.to_B())
+
+    def test_read_write_lock_writer_preference(self):
+        from threading import Event
+
+        from tfism.extensions.locking import ReadWriteLock
+
+        lock = ReadWriteLock()
+        events = []
+        acquired = Event()
+
+        def write():
+            with lock:
+                events.append("write")
+
+        def read():
+            with lock.reader:
+                acquired.set()
+                events.append("read")
+
+        with lock.reader:
+            writer = Thread(target=write)
+            writer.start()
+            time.sleep(0.05)
+            # the waiting writer blocks new readers but not the current one
+            reader = Thread(target=read)
+            reader.start()
+            self.assertFalse(acquired.wait(0.05))
+            with lock.reader:
+                events.append("reentrant read")
+        writer.join()
+        reader.join()
+        self.assertEqual(["reentrant read", "write", "read"], events)
+
     def test_context_managers(self):
 
         class CounterContext:
@@ -228,6 +371,40 @@ class TestLockedHierarchicalTransitions(TestNestedTransitions, TestLockedTransit
         time.sleep(1)
         self.assertEqual(self.stuff.state, "C")
 
+    def test_lock_modes(self):
+        states = ["A", {"name": "B", "children": ["1", "2"], "initial": "1"}, "C"]
+        transitions = [["go", "A", "B"], ["go", "B_1", "B_2"], ["go", "B_2", "C"], ["go", "C", "A"]]
+        for lock_mode in ("model", "striped", "rw"):
+            with self.assertRaises(ValueError):
+                self.machine_cls(states=states, initial="A", lock_mode=lock_mode)
+        models = [DummyModel() for _ in range(8)]
+        machine = self.machine_cls(model=models, states=states, transitions=transitions, initial="A", lock_mode="machine")
+        errors = []
+
+        def work(model):
+            try:
+                for _ in range(200):
+                    model.go()
+                    # queries enter the scope of nested states as well
+                    machine.get_triggers(model.state)
+                    machine.get_nested_triggers(model.state.split("_"))
+                    model.may_go()
+            except Exception as err:  # pragma: no cover
+                errors.append(err)
+
+        threads = [Thread(target=work, args=(model,)) for model in models]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        self.assertTrue(all(model.is_A() for model in models))
+
+    def test_read_write_lock(self):
+        # queries of hierarchical machines change the scope of the machine and cannot share a read lock
+        with self.assertRaises(ValueError):
+            self.machine_cls(states=["A", "B"], initial="A", lock_mode="rw")
+
     def test_callbacks(self):
 
         class MachineModel(self.stuff.machine_cls):  # type: ignore
@@ -9,12 +9,16 @@ and transition concepts.
 import inspect
 import itertools
 import logging
+import threading
+import types
 import warnings
+import weakref
 from collections import OrderedDict, defaultdict, deque
-from collections.abc import Callable, Collection, Sequence
+from collections.abc import Callable, Collection, Hashable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, wait
 from enum import Enum, EnumMeta
 from functools import partial
-from typing import Any, TypeAlias, Union, cast
+from typing import Any, Literal, TypeAlias, Union, cast
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.addHandler(logging.NullHandler())
@@ -27,6 +31,22 @@ Callback: TypeAlias = Callable[..., Any]
 CallbackList: TypeAlias = list[str | Callback]
 ListifyResult: TypeAlias = list[Any] | tuple[Any, ...]
 TriggerFunc: TypeAlias = "partial[Callable[..., bool]]"  # partial functions used as triggers
+CoalescePolicy: TypeAlias = str | Callable[["EventData", "EventData"], "EventData"]  # see Machine.coalesce
+# state value and state of a model, transitions to try in order and whether their conditions have been evaluated
+# (see Machine.dispatch_to)
+_DispatchPlan: TypeAlias = tuple[Any, "State", tuple["Transition", ...], bool]
+
+# Dotted callback paths mapped to the module and attribute name they point to. The attribute itself is retrieved
+# whenever the callback is resolved which means that patched module attributes are honoured.
+_IMPORTED_CALLABLES: dict[str, tuple[Any, str]] = {}
+# How names are resolved for instances of a model class (see Machine.resolve_callable). Entries are keyed by the id
+# of the class and hold a weak reference to it which drops the entry when the class is garbage collected.
+_MODEL_CALLABLES: dict[int, tuple["weakref.ref[type]", dict[str, int]]] = {}
+_METHOD = 1  # a function or method of the class; the attribute retrieved from the model is returned as is
+_ATTRIBUTE = 2  # any other attribute such as a property which might not be callable
+_IMPORTED = 3  # a dotted path which is not an attribute of the model and imported instead
+# Maximum number of EventData objects a machine keeps for reuse when 'recycle_event_data' is enabled.
+_EVENT_DATA_POOL_SIZE = 8
 
 
 def listify(obj: Any) -> list[Any] | tuple[Any, ...]:
@@ -75,6 +95,78 @@ def _prep_ordered_arg(desired_length: int, arguments: Any = None) -> list[Any]:
     return result
 
 
+def _import_callable(path: str) -> Callback:
+    """Retrieves a callable from a dotted path such as 'package.module.function'. The module of a path is imported
+    only once; the function is looked up in the module on every call.
+    Args:
+        path (str): Dotted path to the callable.
+    Returns:
+        callable referenced by path.
+    Raises:
+        ImportError, AttributeError or ValueError: If the path cannot be resolved.
+    """
+    try:
+        module, func_name = _IMPORTED_CALLABLES[path]
+    except KeyError:
+        module_name, func_name = path.rsplit(".", 1)
+        module = __import__(module_name)
+        for submodule_name in module_name.split(".")[1:]:
+            module = getattr(module, submodule_name)
+        _IMPORTED_CALLABLES[path] = (module, func_name)
+    return cast(Callback, getattr(module, func_name))
+
+
+def _model_callables(model_cls: type) -> dict[str, int]:
+    """Returns the resolution kinds of names for instances of ``model_cls`` and registers the class if necessary."""
+    key = id(model_cls)
+    try:
+        return _MODEL_CALLABLES[key][1]
+    except KeyError:
+        pass
+    kinds: dict[str, int] = {}
+    try:
+        ref = weakref.ref(model_cls, lambda _: _MODEL_CALLABLES.pop(key, None))
+    except TypeError:  # classes which cannot be referenced weakly are not cached
+        return kinds
+    _MODEL_CALLABLES[key] = (ref, kinds)
+    return kinds
+
+
+def _enabled_levels(logger: logging.Logger) -> tuple[bool, bool]:
+    """Returns whether debug and info messages of ``logger`` are emitted. Debug messages are only checked when info
+    messages are emitted which requires a single check while logging is disabled."""
+    if not logger.isEnabledFor(logging.INFO):
+        return False, False
+    return logger.isEnabledFor(logging.DEBUG), True
+
+
+def _call_with_arguments(func: Callback, event_data: "EventData") -> Any:
+    """Calls ``func`` with the arguments passed to the trigger. Used by frozen machines which do not send events."""
+    return func(*event_data.args, **event_data.kwargs)
+
+
+def vectorized(batch: Callback) -> Callable[[Callback], Callback]:
+    """Decorator which declares ``batch`` as the vectorized form of a condition. Bulk triggers evaluate ``batch``
+    once for a batch of models instead of the decorated condition once per model (see ``Condition.check_batch``).
+    ``batch`` is passed the batch and the arguments of the trigger or, when events are sent, the event data with the
+    batch as model. It returns one result per model of the batch.
+    Args:
+        batch (callable): The vectorized form of the condition.
+    """
+
+    def _decorator(func: Callback) -> Callback:
+        func.vectorized = batch  # type: ignore[attr-defined]
+        return func
+
+    return _decorator
+
+
+def _set_model_state(state: "State", event_data: "EventData") -> None:
+    """Assigns ``state`` to the model of ``event_data``. Used by transitions of frozen machines."""
+    event_data.machine.set_state(state, event_data.model)
+    event_data.state = state
+
+
 class State:
     """A persistent representation of a state managed by a ``Machine``.
 
@@ -171,16 +263,22 @@ class State:
 
     def enter(self, event_data: "EventData") -> None:
         """Triggered when a state is entered."""
-        _LOGGER.debug(f"{event_data.machine.name}Entering state {self.name}. Processing callbacks...")
-        event_data.machine.callbacks(self.on_enter, event_data)
-        _LOGGER.info(f"{event_data.machine.name}Finished processing state {self.name} enter callbacks.")
+        machine = event_data.machine
+        if machine._log_debug:
+            _LOGGER.debug("%sEntering state %s. Processing callbacks...", machine.name, self.name)
+        machine.callbacks(self.on_enter, event_data)
+        if machine._log_info:
+            _LOGGER.info("%sFinished processing state %s enter callbacks.", machine.name, self.name)
 
     def exit(self, event_data: "EventData") -> None:
         """Triggered when a state is exited."""
-        _LOGGER.debug(f"{event_data.machine.name}Exiting state {self.name}. Processing callbacks...")
-        event_data.machine.callbacks(self.on_exit, event_data)
+        machine = event_data.machine
+        if machine._log_debug:
+            _LOGGER.debug("%sExiting state %s. Processing callbacks...", machine.name, self.name)
+        machine.callbacks(self.on_exit, event_data)
         self._pocket = None
-        _LOGGER.info(f"{event_data.machine.name}Finished processing state {self.name} exit callbacks.")
+        if machine._log_info:
+            _LOGGER.info("%sFinished processing state %s exit callbacks.", machine.name, self.name)
 
     def add_callback(self, trigger: str, func: str | Callback) -> None:
         """Add a new enter or exit callback.
@@ -241,6 +339,32 @@ class Condition:
         result = predicate(*event_data.args, **event_data.kwargs)
         return bool(result == self.target)
 
+    def check_batch(self, event_data: "EventData", batch: Any) -> Any:
+        """Check which models of ``batch`` pass the condition with the vectorized form of the condition (see
+        ``vectorized``). The condition is resolved with ``event_data`` which should contain a model of the batch.
+        Args:
+            event_data (EventData): The event data passed to the vectorized form when event sending is enabled.
+                Its model is replaced by ``batch`` while the vectorized form is called.
+            batch: The models (or rows) to check.
+        Returns:
+            A NumPy array or list of booleans with one entry per model of the batch or None if the condition has no
+            vectorized form.
+        """
+        predicate = getattr(event_data.machine.resolve_callable(self.func, event_data), "vectorized", None)
+        if predicate is None:
+            return None
+        if event_data.machine.send_event:
+            model, event_data.model = event_data.model, batch
+            try:
+                result = predicate(event_data)
+            finally:
+                event_data.model = model
+        else:
+            result = predicate(batch, *event_data.args, **event_data.kwargs)
+        if hasattr(result, "dtype"):
+            return result == self.target
+        return [bool(value == self.target) for value in result]
+
     def __repr__(self) -> str:
         return "<%s(%s)@%s>" % (type(self).__name__, self.func, id(self))
 
@@ -260,7 +384,7 @@ class Transition:
             but only if condition checks have been successful.
     """
 
-    __slots__ = ["source", "dest", "prepare", "before", "after", "conditions"]
+    __slots__ = ["source", "dest", "prepare", "before", "after", "conditions", "_compiled"]
 
     dynamic_methods = ["before", "after", "prepare"]
     """ A list of dynamic methods which can be resolved by a ``Machine`` instance for convenience functions. """
@@ -309,13 +433,19 @@ class Transition:
         if unless is not None:
             for cond in listify(unless):
                 self.conditions.append(self.condition_cls(cond, target=False))
+        # steps of this transition compiled by a frozen machine (see Machine.freeze); False if it cannot be compiled
+        self._compiled: tuple[tuple[Callable[..., Any], bool | None], ...] | Literal[False] | None = None
 
     def _eval_conditions(self, event_data: "EventData") -> bool:
         for cond in self.conditions:
             if not cond.check(event_data):
-                _LOGGER.debug(
-                    f"{event_data.machine.name}Transition condition failed: {cond.func}() does not return {cond.target}. Transition halted."
-                )
+                if event_data.machine._log_debug:
+                    _LOGGER.debug(
+                        "%sTransition condition failed: %s() does not return %s. Transition halted.",
+                        event_data.machine.name,
+                        cond.func,
+                        cond.target,
+                    )
                 return False
         return True
 
@@ -326,26 +456,76 @@ class Transition:
         Returns: boolean indicating whether the transition was
             successfully executed (True if successful, False if not).
         """
-        _LOGGER.debug(f"{event_data.machine.name}Initiating transition from state {self.source} to state {self.dest}...")
-
-        event_data.machine.callbacks(self.prepare, event_data)
-        _LOGGER.debug(f"{event_data.machine.name}Executed callbacks before conditions.")
+        machine = event_data.machine
+        if machine._frozen and not (machine._log_debug or machine._log_info):
+            steps = self._compiled if self._compiled is not None else self._compile(machine)
+            if steps is not False:
+                for step, target in steps:
+                    if target is None:
+                        step(event_data)
+                    elif step(event_data) != target:
+                        return False
+                return True
+        if machine._log_debug:
+            _LOGGER.debug("%sInitiating transition from state %s to state %s...", machine.name, self.source, self.dest)
+
+        machine.callbacks(self.prepare, event_data)
+        if machine._log_debug:
+            _LOGGER.debug("%sExecuted callbacks before conditions.", machine.name)
 
         if not self._eval_conditions(event_data):
             return False
+        self._conduct(event_data)
+        return True
 
+    def _conduct(self, event_data: "EventData") -> None:
+        """Runs the callbacks and the state change of a transition whose conditions passed."""
+        machine = event_data.machine
         # Combine callbacks and convert to list for type safety
-        before_callbacks = list(itertools.chain(event_data.machine.before_state_change, self.before))
-        event_data.machine.callbacks(before_callbacks, event_data)
-        _LOGGER.debug(f"{event_data.machine.name}Executed callback before transition.")
+        before_callbacks = list(itertools.chain(machine.before_state_change, self.before))
+        machine.callbacks(before_callbacks, event_data)
+        if machine._log_debug:
+            _LOGGER.debug("%sExecuted callback before transition.", machine.name)
 
         if self.dest is not None:  # if self.dest is None this is an internal transition with no actual state change
             self._change_state(event_data)
 
-        after_callbacks = list(itertools.chain(self.after, event_data.machine.after_state_change))
-        event_data.machine.callbacks(after_callbacks, event_data)
-        _LOGGER.debug(f"{event_data.machine.name}Executed callback after transition.")
-        return True
+        after_callbacks = list(itertools.chain(self.after, machine.after_state_change))
+        machine.callbacks(after_callbacks, event_data)
+        if machine._log_debug:
+            _LOGGER.debug("%sExecuted callback after transition.", machine.name)
+
+    def _compile(self, machine: "Machine") -> tuple[tuple[Callable[..., Any], bool | None], ...] | Literal[False]:
+        """Flattens the stages of ``execute`` into a sequence of (step, target) pairs for a frozen machine.
+        Steps are called with event data; a step with a target is a condition which halts the transition
+        when its result does not equal the target. Empty stages are skipped and callables are bound upfront.
+        Returns False if the transition (class) alters execution and has to take the regular path. The result is
+        cached in both cases.
+        """
+        if type(self).execute is not Transition.execute or type(self)._change_state is not Transition._change_state:
+            self._compiled = False
+            return False
+        steps: list[tuple[Callable[..., Any], bool | None]] = [(machine._compile_callback(func), None) for func in self.prepare]
+        for cond in self.conditions:
+            if type(cond) is Condition and not isinstance(cond.func, str):
+                steps.append((machine._compile_callback(cond.func), cond.target))
+            else:
+                steps.append((cond.check, True))
+        steps.extend((machine._compile_callback(func), None) for func in itertools.chain(machine.before_state_change, self.before))
+        if self.dest is not None:
+            try:
+                source, dest = machine.get_state(self.source), machine.get_state(self.dest)
+            except ValueError:  # let the regular path raise
+                self._compiled = False
+                return False
+            steps.append((source.exit, None))
+            steps.append((partial(_set_model_state, dest), None))
+            steps.append((dest.enter, None))
+            if dest.final:
+                steps.extend((machine._compile_callback(func), None) for func in machine.on_final)
+        steps.extend((machine._compile_callback(func), None) for func in itertools.chain(self.after, machine.after_state_change))
+        self._compiled = tuple(steps)
+        return self._compiled
 
     def _change_state(self, event_data: "EventData") -> None:
         event_data.machine.get_state(self.source).exit(event_data)
@@ -454,6 +634,7 @@ class Event:
         # Convert source to string key for the defaultdict
         source_key = transition.source.name if isinstance(transition.source, Enum) else transition.source
         self.transitions[source_key].append(transition)
+        self.machine._invalidate_dispatch_table()  # pylint: disable=protected-access
 
     def trigger(self, model: Any, *args: Any, **kwargs: Any) -> bool:
         """Executes all tfsm that match the current state,
@@ -467,14 +648,30 @@ class Event:
                 be passed onto the EventData object, enabling arbitrary state
                 information to be passed on to downstream triggered functions.
         Returns: boolean indicating whether a transition was
-            successfully executed (True if successful, False if not).
+            successfully executed (True if successful, False if not). Queued machines with 'queue_futures'
+            return a future resolving to this value instead.
         """
-        func = partial(self._trigger, EventData(None, self, self.machine, model, args=args, kwargs=kwargs))
+        machine = self.machine
         # pylint: disable=protected-access
         # noinspection PyProtectedMember
         # Machine._process should not be called somewhere else. That's why it should not be exposed
         # to Machine users.
-        return self.machine._process(func)
+        if machine.has_queue or not machine.recycle_event_data:
+            return machine._process(self._trigger, EventData(None, self, machine, model, args=args, kwargs=kwargs), model=model)  # type: ignore[return-value]
+        # unqueued events are processed right away which means event data can be returned to the pool afterwards
+        pool = machine._event_data_pool
+        try:
+            event_data = pool.pop()
+            event_data.__init__(None, self, machine, model, args, kwargs)  # type: ignore[misc]
+        except IndexError:
+            event_data = EventData(None, self, machine, model, args=args, kwargs=kwargs)
+        try:
+            return machine._process(self._trigger, event_data)  # type: ignore[return-value]
+        finally:
+            # drop references to the model and passed arguments before the event data is pooled
+            event_data.__init__(None, self, machine, None, (), {})  # type: ignore[misc]
+            if len(pool) < _EVENT_DATA_POOL_SIZE:
+                pool.append(event_data)
 
     def _trigger(self, event_data: "EventData") -> bool:
         """Internal trigger function called by the ``Machine`` instance. This should not
@@ -485,9 +682,14 @@ class Event:
         Returns: boolean indicating whether a transition was
             successfully executed (True if successful, False if not).
         """
-        event_data.state = self.machine.get_model_state(event_data.model)
+        # pylint: disable=protected-access
+        entry = self.machine._get_dispatch_entry(self, event_data.model)
+        state = self.machine.get_model_state(event_data.model) if entry is None else entry[0]
+        event_data.state = state
         try:
-            if self._is_valid_source(event_data.state):
+            if entry is not None:
+                self._process(event_data, entry[1])
+            elif self._is_valid_source(state):
                 self._process(event_data)
         except BaseException as err:  # pylint: disable=broad-except; Exception will be handled elsewhere
             # Cast BaseException to Exception for error storage
@@ -504,18 +706,22 @@ class Event:
         finally:
             try:
                 self.machine.callbacks(self.machine.finalize_event, event_data)
-                _LOGGER.debug(f"{self.machine.name}Executed machine finalize callbacks")
+                if self.machine._log_debug:
+                    _LOGGER.debug("%sExecuted machine finalize callbacks", self.machine.name)
             except BaseException as err:  # pylint: disable=broad-except; Exception will be handled elsewhere
-                _LOGGER.error(f"{self.machine.name}While executing finalize callbacks a {type(err).__name__} occurred: {str(err)}")
+                _LOGGER.error("%sWhile executing finalize callbacks a %s occurred: %s", self.machine.name, type(err).__name__, err)
         return event_data.result
 
-    def _process(self, event_data: "EventData") -> None:
+    def _process(self, event_data: "EventData", transitions: Sequence["Transition"] | None = None) -> None:
         self.machine.callbacks(self.machine.prepare_event, event_data)
-        _LOGGER.debug(f"{self.machine.name}Executed machine preparation callbacks before conditions.")
-        # event_data.state should always be set when _process is called
-        # (set in _trigger before calling _process)
-        assert event_data.state is not None
-        for trans in self.transitions[event_data.state.name]:
+        if self.machine._log_debug:
+            _LOGGER.debug("%sExecuted machine preparation callbacks before conditions.", self.machine.name)
+        if transitions is None:
+            # event_data.state should always be set when _process is called
+            # (set in _trigger before calling _process)
+            assert event_data.state is not None
+            transitions = self.transitions[event_data.state.name]
+        for trans in transitions:
             event_data.transition = trans
             if trans.execute(event_data):
                 event_data.result = True
@@ -541,10 +747,499 @@ class Event:
                 'before', 'after' or 'prepare'.
             func (str): The name of the callback function.
         """
+        self.machine._check_mutable()  # pylint: disable=protected-access
         for trans in itertools.chain(*self.transitions.values()):
             trans.add_callback(trigger, func)
 
 
+class AutoTransitions(defaultdict[Any, list[Transition]]):
+    """Transitions of an auto transition event 'to_<dest>'. Every state of the machine (except excluded ones)
+    is a valid source but transitions are only created when a source is looked up. Iterating the mapping or
+    retrieving its length creates the transitions of all remaining states.
+
+    Attributes:
+        machine (Machine): The machine whose states are used as sources.
+        dest (str): Name of the destination state.
+        excluded (set): Sources that have been removed from the event.
+    """
+
+    def __init__(self, machine: "Machine", dest: str, excluded: Iterable[str] = ()) -> None:
+        super().__init__(list)
+        self.machine = machine
+        self.dest = dest
+        self.excluded = set(excluded)
+
+    def __missing__(self, key: str) -> list[Transition]:
+        transitions = [self.machine._create_transition(key, self.dest)] if self._is_auto_source(key) else []
+        self[key] = transitions
+        return transitions
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or self._is_auto_source(key)
+
+    def __bool__(self) -> bool:
+        return super().__len__() > 0 or any(self._is_auto_source(name) for name in self.machine.states)
+
+    def __len__(self) -> int:
+        self._complete()
+        return super().__len__()
+
+    def __iter__(self) -> Iterator[str]:
+        self._complete()
+        return super().__iter__()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def keys(self) -> Any:
+        self._complete()
+        return super().keys()
+
+    def values(self) -> Any:
+        self._complete()
+        return super().values()
+
+    def items(self) -> Any:
+        self._complete()
+        return super().items()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.machine, self.dest, self.excluded), None, None, iter(dict.items(self))
+
+    def _is_auto_source(self, key: object) -> bool:
+        return key in self.machine.states and key not in self.excluded
+
+    def _complete(self) -> None:
+        """Creates the missing transitions and orders entries like the machine's states."""
+        if all(super(AutoTransitions, self).__contains__(name) for name in self.machine.states if name not in self.excluded):
+            return
+        entries = dict(super().items())
+        self.clear()
+        for name in self.machine.states:
+            if name in entries:
+                self[name] = entries.pop(name)
+            elif name not in self.excluded:
+                self[name] = [self.machine._create_transition(name, self.dest)]
+        self.update(entries)
+
+
+class _ModelBinding:
+    """Descriptor installed on model classes generated by machines with ``model_binding="class"``.
+    Accessing it from a model returns ``partial(func, model, *args)`` which equals the partial that would
+    have been assigned to the model instance otherwise.
+    """
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        self.func = func
+        self.args = args
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return partial(self.func, instance, *self.args)
+
+
+class _ModelClassRegistry(dict[type, type]):
+    """Maps model classes to the classes generated for them by a machine. Generated classes cannot be pickled.
+    The registry is therefore pickled empty and refilled when the restored models are bound again."""
+
+    def __reduce__(self) -> tuple[type, tuple[()]]:
+        return type(self), ()
+
+
+class ModelRegistry:
+    """Ordered collection of the models attached to a machine. Models are identified by identity rather than
+    equality which makes membership tests, 'append' and 'remove' constant-time operations. Apart from that,
+    the registry supports the read operations of a list such as iteration, indexing, ``len`` and ``in``.
+    Iteration works on a snapshot which means models may be added or removed while iterating.
+    """
+
+    __slots__ = ("_models",)
+
+    def __init__(self, models: Iterable[Any] = ()) -> None:
+        self._models: dict[int, Any] = {}
+        for model in models:
+            self.append(model)
+
+    def append(self, model: Any) -> None:
+        """Adds a model unless it is already part of the registry."""
+        self._models.setdefault(id(model), model)
+
+    def remove(self, model: Any) -> None:
+        """Removes a model. Raises a ValueError if model is not part of the registry."""
+        try:
+            del self._models[id(model)]
+        except KeyError:
+            raise ValueError("Model %r is not part of the registry." % (model,))
+
+    def __contains__(self, model: Any) -> bool:
+        return id(model) in self._models
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(tuple(self._models.values()))
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return list(self._models.values())[index]
+        size = len(self._models)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("model index out of range")
+        return next(itertools.islice(self._models.values(), index, None))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ModelRegistry):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (type(self).__name__, list(self._models.values()))
+
+    def __reduce__(self) -> tuple[type, tuple[list[Any]]]:
+        # ids are not preserved when models are unpickled
+        return type(self), (list(self._models.values()),)
+
+
+class QueueStats:
+    """Statistics of the transition queues of a machine.
+
+    Attributes:
+        high_water (int): The largest number of events a queue contained at once (including the running one).
+        drains (int): How often a queue has been processed until it was empty.
+        processed (int): The number of events which have been processed from queues.
+        dropped (int): The number of events discarded due to the overflow policy.
+        coalesced (int): The number of events merged into a pending event of the same trigger and model.
+    """
+
+    __slots__ = ("high_water", "drains", "processed", "dropped", "coalesced", "_lock")
+    _counters = ("high_water", "drains", "processed", "dropped", "coalesced")
+
+    def __init__(self) -> None:
+        self.high_water = 0
+        self.drains = 0
+        self.processed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        # model queues of different models share the statistics and can be drained by several threads at once
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self._counters}
+
+    def __setstate__(self, state: dict[str, int]) -> None:
+        self.__init__()  # type: ignore[misc]
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def add(self, counter: str, value: int = 1) -> None:
+        """Increments ``counter`` by ``value``."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + value)
+
+    def record_drain(self, processed: int) -> None:
+        """Counts a drain which processed ``processed`` events."""
+        with self._lock:
+            self.drains += 1
+            self.processed += processed
+
+    def record_size(self, size: int) -> None:
+        """Raises ``high_water`` to ``size`` if it is lower."""
+        with self._lock:
+            if size > self.high_water:
+                self.high_water = size
+
+    @property
+    def events_per_drain(self) -> float:
+        """The average number of events processed per drain."""
+        return self.processed / self.drains if self.drains else 0.0
+
+    def reset(self) -> None:
+        """Sets all counters back to zero."""
+        self.__init__()  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        return "<%s(high_water=%d, drains=%d, processed=%d, dropped=%d, coalesced=%d)@%s>" % (
+            type(self).__name__,
+            self.high_water,
+            self.drains,
+            self.processed,
+            self.dropped,
+            self.coalesced,
+            id(self),
+        )
+
+
+class TransitionQueue(deque[Any]):
+    """Queue of triggers processed sequentially by a queued ``Machine``. The first element is the trigger that
+    is currently executed. ``capacity`` limits the number of pending triggers behind it. When a trigger is
+    appended to a full queue, the overflow policy decides what happens:
+
+        - 'raise': a MachineError is raised and the trigger is discarded.
+        - 'drop_oldest': the oldest pending trigger with the lowest priority is discarded. If every pending
+          trigger has a higher priority than the appended trigger, the appended trigger is discarded instead.
+        - 'drop_newest': the appended trigger is discarded.
+        - 'block': the appending thread waits until the queue has been drained below its capacity.
+          Triggers appended by the thread that processes the queue would wait forever and raise instead.
+          The same applies to queues which are not processed by ``drain`` (e.g. by asynchronous machines).
+
+    Triggers appended with a key can be looked up with ``pending`` until they are executed. This is used to
+    coalesce events (see ``Machine.coalesce``). Triggers with a higher priority are placed in front of
+    pending triggers with a lower priority. Triggers of the same priority are processed in FIFO order.
+    The running trigger always stays in front. A future appended with a trigger is resolved with the trigger's
+    return value (or exception) once it has been executed and cancelled if the trigger is discarded.
+
+    Attributes:
+        capacity (int): The maximum number of pending triggers or None for an unbounded queue.
+        overflow (str): The overflow policy.
+        stats (QueueStats): Statistics which might be shared with other queues of the same machine.
+    """
+
+    overflow_policies = ("raise", "drop_oldest", "drop_newest", "block")
+
+    def __init__(self, capacity: int | None = None, overflow: str = "raise", stats: QueueStats | None = None) -> None:
+        super().__init__()
+        if overflow not in self.overflow_policies:
+            raise ValueError("Overflow policy '%s' is not supported. Use one of %s." % (overflow, self.overflow_policies))
+        if capacity is not None and capacity < 1:
+            raise ValueError("Queue capacity must be at least 1 but was %d." % capacity)
+        self.capacity = capacity
+        self.overflow = overflow
+        self.stats = QueueStats() if stats is None else stats
+        self._not_full = threading.Condition() if overflow == "block" else None
+        self._drainer: int | None = None
+        # pending triggers by key and the keys by id of the trigger
+        self._pending: dict[Hashable, Any] = {}
+        self._pending_keys: dict[int, Hashable] = {}
+        # priorities of queued triggers by id of the trigger; triggers without an entry have priority 0
+        self._priorities: dict[int, int] = {}
+        # futures of queued triggers by id of the trigger
+        self._futures: dict[int, Any] = {}
+
+    def append(  # type: ignore[override]
+        self, trigger: Any, key: Hashable | None = None, priority: int = 0, future: Any = None
+    ) -> bool:
+        """Appends a trigger with respect to the capacity of the queue.
+        Args:
+            trigger: The callable to queue.
+            key: When passed, the trigger can be retrieved with ``pending(key)`` until it is executed.
+            priority (int): Triggers with a higher priority are executed before pending triggers with a lower one.
+            future: A future (e.g. ``concurrent.futures.Future`` or ``asyncio.Future``) which is resolved with
+                the result of ``trigger``.
+        Returns:
+            bool: False if the trigger has been discarded, True otherwise.
+        """
+        if self._not_full is not None and self.capacity is not None:
+            # waiting for room and appending happen under one acquisition or waiting threads could take the same slot
+            with self._not_full:
+                return self._append(trigger, key, priority, future)
+        return self._append(trigger, key, priority, future)
+
+    def _append(self, trigger: Any, key: Hashable | None, priority: int, future: Any) -> bool:
+        if self.capacity is not None and len(self) > self.capacity and not self._make_room(priority):
+            if future is not None:
+                future.cancel()
+            return False
+        if future is not None:
+            self._futures[id(trigger)] = future
+        if priority or self._priorities:
+            self._insert(trigger, priority)
+        else:
+            super().append(trigger)
+        # the first trigger is executed right away and cannot be pending
+        if key is not None and len(self) > 1:
+            self._pending[key] = trigger
+            self._pending_keys[id(trigger)] = key
+        if len(self) > self.stats.high_water:
+            self.stats.record_size(len(self))
+        return True
+
+    def _insert(self, trigger: Any, priority: int) -> None:
+        priorities = self._priorities
+        index = len(self)
+        # skip pending triggers with a lower priority but never pass the running trigger
+        while index > 1 and priorities.get(id(self[index - 1]), 0) < priority:
+            index -= 1
+        self.insert(index, trigger)
+        if priority:
+            priorities[id(trigger)] = priority
+
+    def promote(self, trigger: Any, priority: int) -> None:
+        """Raises the priority of the pending ``trigger`` to ``priority`` and moves it in front of pending triggers
+        with a lower priority (behind those with the same priority). Lower priorities are ignored."""
+        if priority <= self._priorities.get(id(trigger), 0):
+            return
+        self.remove(trigger)
+        self._insert(trigger, priority)
+
+    def pending(self, key: Hashable) -> Any:
+        """Returns the trigger which has been appended with ``key`` and has not been executed yet or None."""
+        return self._pending.get(key)
+
+    def future(self, trigger: Any) -> Any:
+        """Returns the future which has been appended with ``trigger`` or None."""
+        return self._futures.get(id(trigger))
+
+    def settle(self, trigger: Any, result: Any = None, error: BaseException | None = None) -> None:
+        """Resolves the future of ``trigger`` with ``result`` or ``error`` unless it has been cancelled."""
+        future = self._futures.pop(id(trigger), None)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def forget(self, trigger: Any) -> None:
+        """Makes ``trigger`` unavailable for ``pending``. Must be called before a trigger is executed."""
+        key = self._pending_keys.pop(id(trigger), None)
+        if key is not None:
+            del self._pending[key]
+
+    def popleft(self) -> Any:
+        trigger = super().popleft()
+        if self._priorities:
+            self._priorities.pop(id(trigger), None)
+        return trigger
+
+    def clear(self) -> None:
+        super().clear()
+        self._pending.clear()
+        self._pending_keys.clear()
+        self._priorities.clear()
+        futures = list(self._futures.values())
+        self._futures.clear()
+        for future in futures:
+            future.cancel()
+
+    def _discard(self, trigger: Any) -> None:
+        self.forget(trigger)
+        self._priorities.pop(id(trigger), None)
+        future = self._futures.pop(id(trigger), None)
+        if future is not None:
+            future.cancel()
+
+    def _make_room(self, priority: int) -> bool:
+        if self.overflow == "drop_oldest":
+            # the oldest trigger among those with the lowest priority unless the appended trigger ranks lower
+            lowest = self._priorities.get(id(self[-1]), 0) if self._priorities else 0
+            if lowest > priority:
+                self.stats.add("dropped")
+                return False
+            index = 1
+            if self._priorities:
+                index = len(self) - 1
+                while index > 1 and self._priorities.get(id(self[index - 1]), 0) == lowest:
+                    index -= 1
+            self._discard(self[index])
+            del self[index]
+            self.stats.add("dropped")
+            return True
+        if self.overflow == "drop_newest":
+            self.stats.add("dropped")
+            return False
+        # only wait when another thread is processing the queue; the caller holds the lock of '_not_full'
+        if self._not_full is None or self._drainer in (None, threading.get_ident()):
+            raise MachineError("Transition queue reached its capacity of %s pending events." % self.capacity)
+        self._not_full.wait_for(lambda: not self or len(self) <= cast(int, self.capacity))
+        return True
+
+    def drain(self) -> None:
+        """Processes triggers until the queue is empty. Every trigger stays in the queue while it is executed.
+        When a trigger raises an exception, its future receives the exception, the queue is cleared (which cancels
+        the futures of the remaining triggers) and the exception is passed on.
+        """
+        self._drainer = threading.get_ident()
+        processed = 0
+        popleft = self.popleft
+        not_full = self._not_full
+        head = None
+        try:
+            while self:
+                head = self[0]
+                if self._pending:
+                    self.forget(head)
+                result = head()
+                processed += 1
+                popleft()
+                if self._futures:
+                    self.settle(head, result)
+                if not_full is not None:
+                    with not_full:
+                        not_full.notify()
+        except BaseException as err:
+            if self._futures:
+                self.settle(head, error=err)
+            self.clear()
+            raise
+        finally:
+            self._drainer = None
+            self.stats.record_drain(processed)
+            if not_full is not None:
+                with not_full:
+                    not_full.notify_all()
+
+    def retain(self, predicate: Callable[[Any], bool]) -> None:
+        """Removes all pending triggers for which ``predicate`` returns False. The first (running) trigger is kept."""
+        if len(self) < 2:
+            return
+        running = self.popleft()
+        kept = []
+        for trigger in self:
+            if predicate(trigger):
+                kept.append(trigger)
+            else:
+                self._discard(trigger)
+        super().clear()
+        self.extend(kept)
+        self.appendleft(running)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.capacity, self.overflow, self.stats), None, iter(self)
+
+
+def _restore_model(machine: "Machine", func: Callable[..., Any], args: tuple[Any, ...]) -> Any:
+    """Recreates a pickled model with ``func(*args)`` and binds it to machine's generated model class.
+    Binding is postponed to ``Machine.__setstate__`` when the machine itself has not been restored yet.
+    """
+    model = func(*args)
+    if "_model_classes" in vars(machine):
+        model.__class__ = machine._get_model_class(model)
+    return model
+
+
+class _TriggerChecks:
+    """State shared while ``Machine.get_available_triggers`` checks the triggers of a model: whether
+    'prepare_event' callbacks have been called and the results of the conditions checked since the
+    prepare callbacks of a transition have last been called."""
+
+    __slots__ = ("prepared", "results")
+
+    def __init__(self) -> None:
+        self.prepared = False
+        self.results: dict[Any, bool] = {}
+
+
+class DispatchResults(list[Any]):
+    """Results of ``Machine.dispatch`` and ``Machine.dispatch_to`` in the order of the triggered models.
+    Like the boolean returned by earlier versions, the results are truthy if all triggers returned a truthy value.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return all(self)
+
+
 class Machine:
     """Machine manages states, tfsm and models. In case it is initialized without a specific model
     (or specifically no model), it will also act as a model itself. Machine takes also care of decorating
@@ -553,7 +1248,7 @@ class Machine:
     Attributes:
         states (OrderedDict): Collection of all registered states.
         events (dict): Collection of tfsm ordered by trigger/event.
-        models (list): List of models attached to the machine.
+        models (ModelRegistry): Ordered, identity-based collection of models attached to the machine.
         initial (str): Name of the initial state for new models.
         prepare_event (list): Callbacks executed when an event is triggered.
         before_state_change (list): Callbacks executed after condition checks but before transition is conducted.
@@ -562,7 +1257,8 @@ class Machine:
             Callbacks will be executed AFTER the custom callbacks assigned to the transition.
         finalize_event (list): Callbacks will be executed after all tfsm callbacks have been executed.
             Callbacks mentioned here will also be called if a transition or condition check raised an error.
-        _queued (bool): Whether tfsm in callbacks should be executed immediately (False) or sequentially.
+        _queued (bool or str): Whether tfsm in callbacks should be executed immediately (False) or sequentially
+            (True). With 'model', events are queued for each model individually.
         send_event (bool): When True, any arguments passed to trigger methods will be wrapped in an EventData
             object, allowing indirect and encapsulated access to data. When False, all positional and keyword
             arguments will be passed directly to all callback methods.
@@ -581,6 +1277,10 @@ class Machine:
     transition_cls = Transition
     event_cls = Event
     self_literal = "self"
+    priority_keyword = "queue_priority"  # keyword argument to set the queue priority of a call (see prioritize)
+    model_bindings: tuple[str, ...] = ("instance", "class")  # supported values of 'model_binding'
+    dispatch_executor: Executor | None = None  # executor which processes chunks of models in 'dispatch'
+    dispatch_chunk_size = 1024  # number of models per task submitted to 'dispatch_executor'
 
     def __init__(
         self,
@@ -595,13 +1295,18 @@ class Machine:
         before_state_change: str | Callback | CallbackList | None = None,
         after_state_change: str | Callback | CallbackList | None = None,
         name: str | None = None,
-        queued: bool = False,
+        queued: bool | str = False,
         prepare_event: str | Callback | CallbackList | None = None,
         finalize_event: str | Callback | CallbackList | None = None,
         model_attribute: str = "state",
         model_override: bool = False,
         on_exception: str | Callback | CallbackList | None = None,
         on_final: str | Callback | CallbackList | None = None,
+        model_binding: str = "instance",
+        recycle_event_data: bool = False,
+        queue_capacity: int | None = None,
+        queue_overflow: str = "raise",
+        queue_futures: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -639,16 +1344,34 @@ class Machine:
                 the transition happened. It receives the very same args as normal
                 callbacks.
             name: If a name is set, it will be used as a prefix for logger output
-            queued (boolean): When True, processes tfsm sequentially. A trigger
+            queued (boolean or str): When True, processes tfsm sequentially. A trigger
                 executed in a state callback function will be queued and executed later.
                 Due to the nature of the queued processing, all tfsm will
                 _always_ return True since conditional checks cannot be conducted at queueing time.
+                When set to 'model', every model gets its own queue. Events of one model are still processed
+                sequentially but do not wait for queued events of other models.
             prepare_event: A callable called on for before possible tfsm will be processed.
                 It receives the very same args as normal callbacks.
             finalize_event: A callable called on for each triggered event after tfsm have been processed.
                 This is also called when a transition raises an exception.
             on_exception: A callable called when an event raises an exception. If not set,
                 the exception will be raised instead.
+            model_binding (str): Either 'instance' (default) or 'class'. With 'instance', convenience functions
+                such as triggers and 'is_<state>' are assigned to every model as partials. With 'class', the
+                machine derives a class from each model class once, equips it with descriptors and assigns it
+                to added models which makes 'add_model' independent of the number of states and triggers.
+                Models whose class cannot be changed (and the machine itself) are bound per instance.
+            recycle_event_data (bool): When True, EventData objects of unqueued events are reset and reused
+                once the event has been processed. Callbacks must not keep references to the passed
+                event data in this case. Defaults to False.
+            queue_capacity (int): The maximum number of events waiting in a transition queue when queued is
+                set. Defaults to None which means queues are unbounded.
+            queue_overflow (str): What happens when an event is added to a full queue. Either 'raise' (default),
+                'drop_oldest', 'drop_newest' or 'block'. See TransitionQueue for details.
+            queue_futures (bool): When True, triggers of a queued machine return a ``concurrent.futures.Future``
+                (an ``asyncio.Future`` for asynchronous machines) instead of True. It resolves to the result of the event (or its exception) once the event has been
+                processed and is cancelled when the event is dropped or removed from the queue. Calls merged into a
+                pending call (see coalesce) return the future of the pending call. Defaults to False.
 
             **kwargs additional arguments passed to next class in MRO. This can be ignored in most cases.
         """
@@ -667,8 +1390,16 @@ class Machine:
 
         # initialize protected attributes first
         self._queued = queued
-        # Use Any for transition queue since partial functions have dynamic attributes
-        self._transition_queue: deque[Any] = deque()
+        # statistics of all transition queues of this machine
+        self.queue_stats = QueueStats()
+        self._transition_queue = TransitionQueue(queue_capacity, queue_overflow, self.queue_stats)
+        self.queue_futures = queue_futures
+        # queues of models with running transitions when queued is 'model'; created on demand and dropped when empty
+        self._transition_queue_dict: dict[int, TransitionQueue] = {}
+        # coalescing policies of queued triggers (see coalesce)
+        self._coalescing: dict[str, CoalescePolicy] = {}
+        # queue priorities of triggers (see prioritize)
+        self._priorities: dict[str, int] = {}
         self._before_state_change: CallbackList = []
         self._after_state_change: CallbackList = []
         self._prepare_event: CallbackList = []
@@ -676,6 +1407,27 @@ class Machine:
         self._on_exception: CallbackList = []
         self._on_final: CallbackList = []
         self._initial: StateName | None = None
+        # maps (model state value, event) to the state object and the transitions valid in this state
+        self._dispatch_table: dict[tuple[Any, Event], tuple[State, tuple[Transition, ...]]] = {}
+        # maps state names to the triggers which have transitions from this state (see get_triggers)
+        self._trigger_index: dict[str, list[str]] = {}
+        self._frozen = False
+        self.recycle_event_data = recycle_event_data
+        # EventData instances which can be reused for unqueued events (see recycle_event_data)
+        self._event_data_pool: list[EventData] = []
+        # cached logger levels to skip log calls in the hot path; refreshed whenever an event is processed
+        self._log_debug = False
+        self._log_info = False
+        self._update_log_guards()
+        if model_binding not in self.model_bindings:
+            raise ValueError(
+                "%s does not support model_binding '%s'. Use one of %s." % (type(self).__name__, model_binding, self.model_bindings)
+            )
+        self.model_binding = model_binding
+        # classes generated for model classes when model_binding is 'class'
+        self._model_classes = _ModelClassRegistry()
+        # models which could not be bound by class when model_binding is 'class'
+        self._instance_models = ModelRegistry()
 
         self.states: OrderedDict[StateName, State] = OrderedDict()
         self.events: OrderedDict[str, Event] = OrderedDict()
@@ -692,7 +1444,7 @@ class Machine:
         self.model_attribute = model_attribute
         self.model_override = model_override
 
-        self.models: list[Any] = []
+        self.models = ModelRegistry()
 
         if states is not None:
             self.add_states(states)
@@ -721,15 +1473,7 @@ class Machine:
         for mod in models:
             mod = self if mod is self.self_literal else mod
             if mod not in self.models:
-                self._checked_assignment(mod, "trigger", partial(self._get_trigger, mod))
-                self._checked_assignment(mod, "may_trigger", partial(self._can_trigger, mod))
-
-                for trigger in self.events:
-                    self._add_trigger_to_model(trigger, mod)
-
-                for state in self.states.values():
-                    self._add_model_to_state(state, mod)
-
+                self._bind_model(mod)
                 self.set_state(initial, model=mod)
                 self.models.append(mod)
 
@@ -743,11 +1487,80 @@ class Machine:
 
         for mod in models:
             self.models.remove(mod)
+            if mod in self._instance_models:
+                self._instance_models.remove(mod)
+            queue = self._transition_queue_dict.pop(id(mod), None)
+            # the first element is currently executed and removed by Machine._process when done
+            if queue is not None:
+                queue.retain(lambda entry: False)
         if len(self._transition_queue) > 0:
+            removed = ModelRegistry(models)
+            queue = self._transition_queue
             # the first element of the list is currently executed. Keeping it for further Machine._process(ing)
-            self._transition_queue = deque(
-                [self._transition_queue[0]] + [e for e in self._transition_queue if e.args[0].model not in models]
-            )
+            queue.retain(lambda entry: entry.args[0].model not in removed)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._rebind_models()
+
+    def _bind_model(self, model: Any) -> None:
+        """Adds convenience functions such as triggers, 'may_<trigger>' and 'is_<state>' to a model."""
+        if self.model_binding == "class" and model is not self:
+            try:
+                model.__class__ = self._get_model_class(model)
+                return
+            except TypeError:  # class assignment is not supported for this model (e.g. built-in types)
+                self._instance_models.append(model)
+
+        self._checked_assignment(model, "trigger", partial(self._get_trigger, model))
+        self._checked_assignment(model, "may_trigger", partial(self._can_trigger, model))
+        self._checked_assignment(model, "may_trigger_all", partial(self.get_available_triggers, model))
+
+        for trigger in self.events:
+            self._add_trigger_to_model(trigger, model)
+
+        for state in self.states.values():
+            self._add_model_to_state(state, model)
+
+    def _get_instance_bound_models(self) -> ModelRegistry:
+        """Returns the models which received their convenience functions as instance attributes."""
+        return self._instance_models if self.model_binding == "class" else self.models
+
+    def _get_model_class(self, model: Any) -> type:
+        """Returns the class generated for model's class and creates it if necessary."""
+        base = type(model)
+        try:
+            return self._model_classes[base]
+        except KeyError:
+            pass
+        machine = self
+
+        def __reduce_ex__(obj: Any, protocol: Any) -> tuple[Any, ...]:
+            # reduce obj like an instance of base and let _restore_model bind it again
+            func, args, *rest = base.__reduce_ex__(obj, protocol)  # type: ignore[call-arg, str-unpack]
+            args = tuple(base if arg is type(obj) else arg for arg in args)
+            return (_restore_model, (machine, func, args), *rest)
+
+        namespace = {"__slots__": (), "__reduce_ex__": __reduce_ex__, "__module__": base.__module__, "__qualname__": base.__qualname__}
+        model_cls = types.new_class(base.__name__, (base,), exec_body=lambda ns: ns.update(namespace))
+        self._checked_assignment(model_cls, "trigger", _ModelBinding(self._get_trigger))
+        self._checked_assignment(model_cls, "may_trigger", _ModelBinding(self._can_trigger))
+        self._checked_assignment(model_cls, "may_trigger_all", _ModelBinding(self.get_available_triggers))
+        for trigger in self.events:
+            self._add_trigger_to_model_class(trigger, model_cls)
+        for state in self.states.values():
+            self._add_model_class_to_state(state, model_cls)
+        self._model_classes[base] = model_cls
+        return model_cls
+
+    def _rebind_models(self) -> None:
+        """Binds restored models to generated classes again after the machine has been unpickled."""
+        if self.model_binding != "class":
+            return
+        generated = set(self._model_classes.values())
+        for mod in self.models:
+            if mod is not self and mod not in self._instance_models and type(mod) not in generated:
+                mod.__class__ = self._get_model_class(mod)
 
     @classmethod
     def _create_transition(cls, *args: Any, **kwargs: Any) -> Transition:
@@ -781,19 +1594,19 @@ class Machine:
             self._initial = state_name
 
     @property
-    def has_queue(self) -> bool:
-        """Return boolean indicating if machine has queue or not"""
+    def has_queue(self) -> bool | str:
+        """Return boolean indicating if machine has queue or not. Returns 'model' if models are queued individually."""
         return self._queued
 
     @property
     def model(self) -> Any | list[Any]:
         """List of models attached to the machine. For backwards compatibility, the property will
-        return the model instance itself instead of the underlying list  if there is only one attached
+        return the model instance itself instead of a list if there is only one attached
         to the machine.
         """
         if len(self.models) == 1:
             return self.models[0]
-        return self.models
+        return list(self.models)
 
     @property
     def before_state_change(self) -> CallbackList:
@@ -804,6 +1617,7 @@ class Machine:
     # this should make sure that _before_state_change is always a list
     @before_state_change.setter
     def before_state_change(self, value: str | Callback | CallbackList | None) -> None:
+        self._check_mutable()
         # Convert listify result to CallbackList (ensure we always have a list, not a tuple)
         self._before_state_change = list(listify(value)) if value is not None else []
 
@@ -816,6 +1630,7 @@ class Machine:
     # this should make sure that _after_state_change is always a list
     @after_state_change.setter
     def after_state_change(self, value: str | Callback | CallbackList | None) -> None:
+        self._check_mutable()
         # Convert listify result to CallbackList (ensure we always have a list, not a tuple)
         self._after_state_change = list(listify(value)) if value is not None else []
 
@@ -861,6 +1676,7 @@ class Machine:
     # this should make sure that finalize_event is always a list
     @on_final.setter
     def on_final(self, value: str | Callback | CallbackList | None) -> None:
+        self._check_mutable()
         # Convert listify result to CallbackList (ensure we always have a list, not a tuple)
         self._on_final = list(listify(value)) if value is not None else []
 
@@ -948,10 +1764,12 @@ class Machine:
 
             **kwargs additional keyword arguments used by state mixins.
         """
+        self._check_mutable()
 
         ignore = ignore_invalid_triggers
         if ignore is None:
             ignore = self.ignore_invalid_triggers
+        self._invalidate_dispatch_table()
 
         # Convert to list to handle both list and tuple returns from listify
         states_list = list(listify(states))
@@ -961,22 +1779,25 @@ class Machine:
 
             # Setup auto-transitions if enabled
             if self.auto_transitions:
-                for a_state in self.states.keys():
-                    # add all states as sources to auto tfsm 'to_<state>' with dest <state>
-                    if a_state == state.name:
-                        if self.model_attribute == "state":
-                            method_name = "to_%s" % a_state
-                        else:
-                            method_name = "to_%s_%s" % (self.model_attribute, a_state)
-                        self.add_transition(method_name, self.wildcard_all, a_state)
-
-                    # add auto transition with source <state> to <a_state>
-                    else:
-                        if self.model_attribute == "state":
-                            method_name = "to_%s" % a_state
-                        else:
-                            method_name = "to_%s_%s" % (self.model_attribute, a_state)
-                        self.add_transition(method_name, state.name, a_state)
+                self._add_auto_transitions(state.name)
+
+    def _add_auto_transitions(self, dest: str) -> None:
+        """Adds the auto transition event 'to_<dest>'. Its transitions are created lazily (see AutoTransitions)."""
+        if self.model_attribute == "state":
+            trigger = "to_%s" % dest
+        else:
+            trigger = "to_%s_%s" % (self.model_attribute, dest)
+        event = self.events[trigger] if trigger in self.events else self._add_event(trigger)
+        if isinstance(event.transitions, AutoTransitions):
+            return
+        transitions = AutoTransitions(self, dest)
+        # keep transitions which have been added to an already existing event
+        for source, existing in event.transitions.items():
+            transitions[source] = existing
+            if source in self.states:
+                existing.append(self._create_transition(source, dest))
+        event.transitions = transitions
+        self._invalidate_dispatch_table()
 
     def _get_or_create_state(
         self,
@@ -1117,8 +1938,10 @@ class Machine:
         self.states[state.name] = state
 
         # Bind to models
-        for model in self.models:
+        for model in self._get_instance_bound_models():
             self._add_model_to_state(state, model)
+        for model_cls in self._model_classes.values():
+            self._add_model_class_to_state(state, model_cls)
 
         return state
 
@@ -1141,21 +1964,37 @@ class Machine:
             if hasattr(model, method) and inspect.ismethod(getattr(model, method)) and method not in getattr(state, callback):
                 state.add_callback(callback, method)
 
-    def _checked_assignment(self, model: Any, name: str, func: Callable[..., Any]) -> None:
+    def _add_model_class_to_state(self, state: State, model_cls: type) -> None:
+        # Class binding counterpart of _add_model_to_state
+        if self.model_attribute == "state":
+            method_name = "is_%s" % state.name
+        else:
+            method_name = "is_%s_%s" % (self.model_attribute, state.name)
+        self._checked_assignment(model_cls, method_name, _ModelBinding(partial(self.is_state, state.value)))
+
+        for callback in self.state_cls.dynamic_methods:
+            method = f"{callback}_{state.name}"
+            # functions defined on the class become bound methods when retrieved from a model
+            is_method = inspect.ismethod(getattr(model_cls, method, None)) or inspect.isfunction(
+                inspect.getattr_static(model_cls, method, None)
+            )
+            if is_method and method not in getattr(state, callback):
+                state.add_callback(callback, method)
+
+    def _checked_assignment(self, model: Any, name: str, func: Callable[..., Any] | _ModelBinding) -> None:
         bound_func = getattr(model, name, None)
         if (bound_func is None) ^ self.model_override:
             setattr(model, name, func)
         else:
-            _LOGGER.warning(f"{self.name}Skip binding of '{name}' to model due to model override policy.")
+            _LOGGER.warning("%sSkip binding of '%s' to model due to model override policy.", self.name, name)
 
     def _can_trigger(self, model: Any, trigger: str, *args: Any, **kwargs: Any) -> bool:
         state = self.get_model_state(model)
         event_data = EventData(state, Event(name=trigger, machine=self), self, model, args, kwargs)
 
-        for trigger_name in self.get_triggers(state):
-            if trigger_name != trigger:
-                continue
-            for transition in self.events[trigger_name].transitions[state.name]:
+        event = self.events.get(trigger)
+        if event is not None and state.name in event.transitions:
+            for transition in event.transitions[state.name]:
                 try:
                     _ = self.get_state(transition.dest) if transition.dest is not None else transition.source
                 except ValueError:
@@ -1163,9 +2002,7 @@ class Machine:
 
                 event_data.transition = transition
                 try:
-                    self.callbacks(self.prepare_event, event_data)
-                    self.callbacks(transition.prepare, event_data)
-                    if all(c.check(event_data) for c in transition.conditions):
+                    if self._check_transition(transition, event_data):
                         return True
                 except BaseException as err:
                     # Cast BaseException to Exception for error storage
@@ -1187,6 +2024,10 @@ class Machine:
         self._checked_assignment(model, trigger, partial(self.events[trigger].trigger, model))
         self._add_may_transition_func_for_trigger(trigger, model)
 
+    def _add_trigger_to_model_class(self, trigger: str, model_cls: type) -> None:
+        self._checked_assignment(model_cls, trigger, _ModelBinding(self.events[trigger].trigger))
+        self._checked_assignment(model_cls, "may_%s" % trigger, _ModelBinding(self._can_trigger, trigger))
+
     def _get_trigger(self, model: Any, trigger_name: str, *args: Any, **kwargs: Any) -> bool:
         """Convenience function added to the model to trigger events by name.
         Args:
@@ -1207,6 +2048,81 @@ class Machine:
             return False
         return event.trigger(model, *args, **kwargs)
 
+    def get_available_triggers(self, model: Any, *args: Any, **kwargs: Any) -> list[str]:
+        """Collects all triggers which can currently be fired by ``model``. This is equivalent to calling
+        'may_<trigger>' for every trigger but 'prepare_event' callbacks are only called once and every
+        distinct condition is evaluated at most once until the prepare callbacks of a transition are called.
+        Conditions should therefore not depend on the transition they are evaluated for.
+        Args:
+            model (object): The model whose current state is checked.
+            *args: Positional arguments passed to callbacks and conditions.
+            **kwargs: Keyword arguments passed to callbacks and conditions.
+        Returns:
+            list of trigger names in the order events have been added.
+        """
+        state = self.get_model_state(model)
+        event_data: EventData | None = None
+        checks = _TriggerChecks()
+        available = []
+        for trigger in self._get_model_triggers(model):
+            event = self.events[trigger]
+            for transition in event.transitions[state.name]:
+                try:
+                    _ = self.get_state(transition.dest) if transition.dest is not None else transition.source
+                except ValueError:
+                    continue
+                if event_data is None:
+                    event_data = EventData(state, event, self, model, args, kwargs)
+                event_data.event = event
+                event_data.transition = transition
+                try:
+                    if self._check_transition(transition, event_data, checks):
+                        available.append(trigger)
+                        break
+                except BaseException as err:
+                    if isinstance(err, Exception):
+                        event_data.error = err
+                    else:
+                        event_data.error = Exception(f"{type(err).__name__}: {str(err)}")
+                    if self.on_exception:
+                        self.callbacks(self.on_exception, event_data)
+                    else:
+                        raise
+        return available
+
+    def _get_model_triggers(self, model: Any) -> list[str]:
+        """Returns the triggers with transitions from the current state of ``model``."""
+        return self.get_triggers(self.get_model_state(model))
+
+    def _check_transition(self, transition: Transition, event_data: EventData, checks: _TriggerChecks | None = None) -> bool:
+        """Calls the prepare callbacks of ``transition`` and checks its conditions like 'may_<trigger>' does.
+        With ``checks``, 'prepare_event' callbacks are called once and conditions with the same function and
+        target are checked once until the prepare callbacks of a transition are called."""
+        if checks is None:
+            self.callbacks(self.prepare_event, event_data)
+            self.callbacks(transition.prepare, event_data)
+            return all(c.check(event_data) for c in transition.conditions)
+        if not checks.prepared:
+            self.callbacks(self.prepare_event, event_data)
+            checks.prepared = True
+        if transition.prepare:
+            self.callbacks(transition.prepare, event_data)
+            # prepare callbacks might change what conditions return
+            checks.results.clear()
+        return all(self._check_condition(c, event_data, checks.results) for c in transition.conditions)
+
+    @staticmethod
+    def _check_condition(condition: Condition, event_data: EventData, results: dict[Any, bool]) -> bool:
+        """Checks ``condition`` unless a condition with the same function and target has already been checked."""
+        try:
+            key = (condition.func, condition.target)
+            return results[key]
+        except KeyError:
+            result = results[key] = condition.check(event_data)
+            return result
+        except TypeError:  # unhashable callbacks cannot be cached
+            return condition.check(event_data)
+
     def get_triggers(self, *args: Any) -> list[str]:
         """Collects all triggers FROM certain states.
         Args:
@@ -1216,7 +2132,22 @@ class Machine:
             list of transition/trigger names.
         """
         names = {state.name if hasattr(state, "name") else state for state in args}
-        return [t for (t, ev) in self.events.items() if any(name in ev.transitions for name in names)]
+        if len(names) == 1:
+            return list(self._get_state_triggers(names.pop()))
+        triggers = set().union(*(self._get_state_triggers(name) for name in names))
+        return [t for t in self.events if t in triggers]
+
+    def _get_state_triggers(self, name: str) -> list[str]:
+        """Returns the triggers with transitions from state ``name`` in the order events have been added.
+        Results are kept in a reverse index which is dropped whenever states or transitions change.
+        """
+        try:
+            return self._trigger_index[name]
+        except KeyError:
+            pass
+        triggers = [t for (t, ev) in self.events.items() if name in ev.transitions]
+        self._trigger_index[name] = triggers
+        return triggers
 
     def add_transition(
         self,
@@ -1258,12 +2189,11 @@ class Machine:
             **kwargs: Additional arguments which can be passed to the created transition.
                 This is useful if you plan to extend Machine.Transition and require more parameters.
         """
+        self._check_mutable()
         if trigger == self.model_attribute:
             raise ValueError("Trigger name cannot be same as model attribute name.")
         if trigger not in self.events:
-            self.events[trigger] = self._create_event(trigger, self)
-            for model in self.models:
-                self._add_trigger_to_model(trigger, model)
+            self._add_event(trigger)
 
         if source == self.wildcard_all:
             source = list(self.states.keys())
@@ -1287,6 +2217,15 @@ class Machine:
             _trans = self._create_transition(state, _dest, conditions, unless, before, after, prepare, **kwargs)
             self.events[trigger].add_transition(_trans)
 
+    def _add_event(self, trigger: str) -> Event:
+        """Creates a new event and binds its trigger to all models."""
+        event = self.events[trigger] = self._create_event(trigger, self)
+        for model in self._get_instance_bound_models():
+            self._add_trigger_to_model(trigger, model)
+        for model_cls in self._model_classes.values():
+            self._add_trigger_to_model_class(trigger, model_cls)
+        return event
+
     def add_transitions(self, transitions: list[Any] | Any) -> None:
         """Add several tfsm.
 
@@ -1426,6 +2365,7 @@ class Machine:
             source (str, Enum or State): Limits removal to tfsm from a certain state.
             dest (str, Enum or State): Limits removal to tfsm to a certain state.
         """
+        self._check_mutable()
         # Convert source/dest to lists if needed for filtering
         source_list: list[Any] | str = [s.name if hasattr(s, "name") else s for s in listify(source)] if source != "*" else "*"
         dest_list: list[Any] | str = [d.name if hasattr(d, "name") else d for d in listify(dest)] if dest != "*" else "*"
@@ -1445,32 +2385,217 @@ class Machine:
             }.items()
             if len(value) > 0
         }
+        self._invalidate_dispatch_table()
+        transitions = self.events[trigger].transitions
+        # auto transitions remain lazy; removed sources must not be recreated
+        if tmp and isinstance(transitions, AutoTransitions):
+            auto_transitions = AutoTransitions(self, transitions.dest, transitions.excluded.union(transitions.keys() - tmp.keys()))
+            auto_transitions.update(tmp)
+            self.events[trigger].transitions = auto_transitions
         # convert dict back to defaultdict in case tmp is not empty
-        if tmp:
+        elif tmp:
             self.events[trigger].transitions = defaultdict(list, **tmp)
         # if no transition is left remove the trigger from the machine and all models
         else:
-            for model in self.models:
+            for model in self._get_instance_bound_models():
                 delattr(model, trigger)
+            for model_cls in self._model_classes.values():
+                if trigger in vars(model_cls):
+                    delattr(model_cls, trigger)
             del self.events[trigger]
 
-    def dispatch(self, trigger: str, *args: Any, **kwargs: Any) -> bool:
-        """Trigger an event on all models assigned to the machine.
+    def dispatch(self, trigger: str, *args: Any, **kwargs: Any) -> DispatchResults:
+        """Trigger an event on all models assigned to the machine (see ``dispatch_to``).
         Args:
             trigger (str): Event name
             *args (list): List of arguments passed to the event trigger
             **kwargs (dict): Dictionary of keyword arguments passed to the event trigger
         Returns:
-            bool The truth value of all triggers combined with AND
+            DispatchResults: The result of every model which is truthy if all triggers succeeded
         """
-        res = [getattr(model, trigger)(*args, **kwargs) for model in self.models]
-        return all(res)
+        return self.dispatch_to(self.models, trigger, *args, **kwargs)
+
+    def dispatch_to(self, models: Iterable[Any], trigger: str, *args: Any, **kwargs: Any) -> DispatchResults:
+        """Trigger an event on ``models``. Models are grouped by their current state and the transitions of every
+        group are resolved once. Transitions are then executed from the resolved groups in the order of ``models``
+        without calling the trigger of every model. Models whose state has been changed by callbacks of models
+        triggered before them are triggered in the regular way.
+        When the event cannot be triggered from the state of a group, a MachineError is raised before any model is
+        triggered unless invalid triggers are ignored. When all conditions of a group have a vectorized form (see
+        ``vectorized``), they are evaluated once for the group and only the passed transition of every model is
+        executed. Grouping is skipped for queued machines, for machines with 'prepare_event', 'finalize_event' or
+        'on_exception' callbacks, for overridden model methods and for customized events.
+        If ``dispatch_executor`` is set, the models are processed in chunks of ``dispatch_chunk_size`` models by
+        the executor. Callbacks must be thread-safe then (see ``LockedMachine``). Process pools are rejected since
+        they would change copies of the models; use ``tfism.extensions.sharding.ShardedMachine`` to partition models
+        across processes instead.
+        Args:
+            models (iterable): Models assigned to the machine
+            trigger (str): Event name
+            *args (list): List of arguments passed to the event trigger
+            **kwargs (dict): Dictionary of keyword arguments passed to the event trigger
+        Returns:
+            DispatchResults: The result of every model which is truthy if all triggers succeeded
+        """
+        executor, size = self._get_dispatch_executor(), self.dispatch_chunk_size
+        if isinstance(executor, ProcessPoolExecutor):
+            raise ValueError("%sModels cannot be dispatched to a process pool. Use ShardedMachine instead." % self.name)
+        models = list(models)
+        results: list[Any] = [False] * len(models)
+        plans = self._plan_dispatch(models, trigger, args, kwargs)
+        if plans is not None:
+            self._update_log_guards()
+        pending = list(range(len(models)))
+        if executor is None or len(pending) <= size:
+            for index, result in zip(pending, self._dispatch_chunk(models, pending, trigger, plans, args, kwargs), strict=True):
+                results[index] = result
+            return DispatchResults(results)
+        chunks = [pending[start : start + size] for start in range(0, len(pending), size)]
+        futures = [executor.submit(self._dispatch_chunk, models, chunk, trigger, plans, args, kwargs) for chunk in chunks]
+        # all chunks are processed before errors are raised
+        wait(futures)
+        for chunk, future in zip(chunks, futures, strict=True):
+            for index, result in zip(chunk, future.result(), strict=True):
+                results[index] = result
+        return DispatchResults(results)
+
+    def _get_dispatch_executor(self) -> Executor | None:
+        """Returns the executor used by ``dispatch_to`` or None if models are processed by the calling thread."""
+        return self.dispatch_executor
+
+    def _dispatch_chunk(
+        self,
+        models: list[Any],
+        indices: list[int],
+        trigger: str,
+        plans: list[_DispatchPlan] | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[Any]:
+        """Triggers ``trigger`` on the models at ``indices`` and returns their results. Without ``plans``, the
+        trigger of every model is called. Otherwise, the transitions planned by ``_plan_dispatch`` are executed."""
+        if plans is None:
+            return [getattr(models[index], trigger)(*args, **kwargs) for index in indices]
+        event = self.events[trigger]
+        attribute = self.model_attribute
+        results: list[Any] = []
+        for index in indices:
+            model = models[index]
+            value, state, transitions, passed = plans[index]
+            if getattr(model, attribute) != value:
+                # a callback of a model triggered before has changed the state
+                results.append(getattr(model, trigger)(*args, **kwargs))
+                continue
+            if not transitions:
+                results.append(False)
+                continue
+            event_data = EventData(state, event, self, model, args, kwargs)
+            if passed:
+                # conditions have already been evaluated for the whole group
+                event_data.transition = transitions[0]
+                transitions[0]._conduct(event_data)
+                event_data.result = True
+            else:
+                for transition in transitions:
+                    event_data.transition = transition
+                    if transition.execute(event_data):
+                        event_data.result = True
+                        break
+            results.append(event_data.result)
+        return results
+
+    def _plan_dispatch(self, models: list[Any], trigger: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> list[_DispatchPlan] | None:
+        """Groups ``models`` by state and returns a plan for every model. Models planned without transitions
+        cannot pass any transition. Returns None if models cannot be grouped and have to be triggered one by one."""
+        event = self.events.get(trigger)
+        if (
+            event is None
+            or type(event).trigger is not Event.trigger
+            or type(event)._trigger is not Event._trigger
+            or type(event)._process is not Event._process
+            or self.has_queue
+            or self.model_override
+            or self.prepare_event
+            or self.finalize_event
+            or self.on_exception
+        ):
+            return None
+        groups: dict[Any, list[int]] = {}
+        attribute = self.model_attribute
+        try:
+            for index, model in enumerate(models):
+                groups.setdefault(getattr(model, attribute), []).append(index)
+        except TypeError:  # unhashable state values cannot be grouped
+            return None
+        plans: list[_DispatchPlan] = [None] * len(models)  # type: ignore[list-item]  # every model is planned below
+        for value, indices in groups.items():
+            entry = self._get_dispatch_entry(event, models[indices[0]])
+            if entry is None:
+                state = self.get_model_state(models[indices[0]])
+                # raises a MachineError unless invalid triggers are ignored for the state
+                event._is_valid_source(state)
+                entry = (state, ())
+            state, transitions = entry
+            passed = self._check_dispatch_conditions(event, entry, models, indices, args, kwargs) if transitions else None
+            if passed is None:
+                plan = (value, state, transitions, False)
+                for index in indices:
+                    plans[index] = plan
+                continue
+            plan = (value, state, (), True)
+            for index in indices:
+                plans[index] = plan
+            for transition, selected in passed:
+                plan = (value, state, (transition,), True)
+                for index in selected:
+                    plans[index] = plan
+        return plans
+
+    def _check_dispatch_conditions(
+        self,
+        event: Event,
+        entry: tuple[State, tuple[Transition, ...]],
+        models: list[Any],
+        indices: list[int],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[tuple[Transition, list[int]]] | None:
+        """Evaluates the conditions of the transitions of a state for models in that state. Returns every
+        transition with the indices of the models for which it is the first transition to pass. Returns None
+        unless every condition has a vectorized form and transitions execute in the regular way."""
+        state, transitions = entry
+        if any(transition.prepare or type(transition).execute is not Transition.execute for transition in transitions):
+            return None
+        passed: list[tuple[Transition, list[int]]] = []
+        remaining = indices
+        for transition in transitions:
+            selected = remaining
+            for condition in transition.conditions:
+                if not selected:
+                    break
+                event_data = EventData(state, event, self, models[selected[0]], args, kwargs)
+                event_data.transition = transition
+                mask = condition.check_batch(event_data, [models[index] for index in selected])
+                if mask is None:
+                    return None
+                selected = [index for index, value in zip(selected, mask, strict=True) if value]
+            if selected:
+                passed.append((transition, selected))
+                taken = set(selected)
+                remaining = [index for index in remaining if index not in taken]
+            if not remaining:
+                break
+        return passed
 
     def callbacks(self, funcs: CallbackList, event_data: "EventData") -> None:
         """Triggers a list of callbacks"""
-        for func in funcs:
-            self.callback(func, event_data)
-            _LOGGER.info(f"{self.name}Executed callback '{func}'")
+        if self._log_info:
+            for func in funcs:
+                self.callback(func, event_data)
+                _LOGGER.info("%sExecuted callback '%s'", self.name, func)
+        else:
+            for func in funcs:
+                self.callback(func, event_data)
 
     def callback(self, func: str | Callback, event_data: "EventData") -> None:
         """Trigger a callback function with passed event_data parameters. In case func is a string,
@@ -1503,28 +2628,131 @@ class Machine:
             callable function resolved from string or func
         """
         if isinstance(func, str):
+            model = event_data.model
             try:
-                resolved_func = getattr(event_data.model, func)
-                if not callable(resolved_func):  # if a property or some other not callable attribute was passed
-
-                    def func_wrapper(*_: Any, **__: Any) -> Any:  # properties cannot process parameters
-                        return resolved_func
-
-                    return func_wrapper
-                return cast(Callback, resolved_func)
-            except AttributeError:
+                kinds = _MODEL_CALLABLES[id(type(model))][1]
+            except KeyError:
+                kinds = _model_callables(type(model))
+            kind = kinds.get(func)
+            if kind == _METHOD:
+                resolved_func = getattr(model, func)
+                if callable(resolved_func):
+                    return cast(Callback, resolved_func)
+                # the method is shadowed by an attribute of the instance and has to be wrapped below
+            if kind != _IMPORTED:
                 try:
-                    module_name, func_name = func.rsplit(".", 1)
-                    module = __import__(module_name)
-                    for submodule_name in module_name.split(".")[1:]:
-                        module = getattr(module, submodule_name)
-                    return cast(Callback, getattr(module, func_name))
-                except (ImportError, AttributeError, ValueError):
-                    raise AttributeError(
-                        "Callable with name '%s' could neither be retrieved from the passed model nor imported from a module." % func
-                    )
+                    resolved_func = getattr(model, func)
+                except AttributeError:
+                    # only dotted paths are remembered since they cannot be regular (instance) attribute names
+                    if "." in func:
+                        kinds[func] = _IMPORTED
+                else:
+                    if kind is None:
+                        static = inspect.getattr_static(type(model), func, None)
+                        is_method = isinstance(static, (types.FunctionType, staticmethod, classmethod))
+                        kinds[func] = _METHOD if is_method and callable(resolved_func) else _ATTRIBUTE
+                    if not callable(resolved_func):  # if a property or some other not callable attribute was passed
+
+                        def func_wrapper(*_: Any, **__: Any) -> Any:  # properties cannot process parameters
+                            return resolved_func
+
+                        return func_wrapper
+                    return cast(Callback, resolved_func)
+            try:
+                return _import_callable(func)
+            except (ImportError, AttributeError, ValueError):
+                raise AttributeError(
+                    "Callable with name '%s' could neither be retrieved from the passed model nor imported from a module." % func
+                )
         return func
 
+    @staticmethod
+    def clear_callable_cache() -> None:
+        """Clears the caches used by ``resolve_callable``. Names are remembered per model class as methods of the
+        class, other attributes (such as properties) or dotted paths to import. Patched module attributes and
+        methods replaced on a class or an instance (even by attributes which are not callable) are picked up
+        automatically. Clearing the caches is required when modules have been replaced (e.g. in ``sys.modules``)
+        or when model classes have been patched to provide attributes with dotted names.
+        """
+        _IMPORTED_CALLABLES.clear()
+        _MODEL_CALLABLES.clear()
+
+    def _get_dispatch_entry(self, event: Event, model: Any) -> tuple[State, tuple[Transition, ...]] | None:
+        """Returns the current state of a model and the transitions of ``event`` which are valid in that state.
+            Entries are compiled on first use and cached until states or transitions of the machine change.
+        Args:
+            event (Event): The triggered event.
+            model (object): The model the event is triggered on.
+        Returns:
+            tuple of state and transitions or None if the event cannot be triggered from the model's state. In the
+            latter case, callers are expected to resolve the state in the regular way to raise suitable errors.
+        """
+        value = getattr(model, self.model_attribute)
+        try:
+            return self._dispatch_table[(value, event)]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable state values cannot be cached
+            return None
+        state = self.states.get(value.name if isinstance(value, Enum) else value)
+        if state is None:
+            return None
+        transitions = event.transitions.get(state.name)
+        if not transitions:
+            return None
+        entry = (state, tuple(transitions))
+        self._dispatch_table[(value, event)] = entry
+        return entry
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the machine has been frozen with ``freeze``."""
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Makes states and transitions of the machine immutable. Afterwards, adding states, adding or
+        removing transitions and changing 'before_state_change', 'after_state_change', 'on_final' or the
+        callbacks of an event raise a MachineError. Models can still be added and removed.
+        Transitions of a frozen machine are compiled into a flat sequence of steps on first execution
+        which skips empty callback lists and binds callables upfront. Callbacks passed by name are still
+        resolved for the model at hand. While debug or info logging is enabled, the regular path is taken
+        to emit the usual log messages.
+        """
+        self._frozen = True
+
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise MachineError("%sMachine is frozen and cannot be modified." % self.name)
+
+    def _compile_callback(self, func: str | Callback) -> Callable[..., Any]:
+        """Returns a function which calls ``func`` when passed event data like ``callback`` does."""
+        if isinstance(func, str) or type(self).callback is not Machine.callback:
+            return partial(self.callback, func)
+        if self.send_event:
+            return func
+        return partial(_call_with_arguments, func)
+
+    def _invalidate_dispatch_table(self) -> None:
+        """Drops all compiled dispatch entries and the trigger index. Must be called whenever states or
+        transitions change."""
+        self._dispatch_table.clear()
+        self._trigger_index.clear()
+
+    def _update_log_guards(self) -> None:
+        """Caches whether debug and info messages would be emitted. Log calls in the hot path check these
+        flags instead of building messages that would be filtered by the logger anyway. The flags are only
+        written when they change since triggers of different threads would otherwise keep writing to the
+        shared machine."""
+        log_debug, log_info = self._log_levels()
+        if log_debug is not self._log_debug:
+            self._log_debug = log_debug
+        if log_info is not self._log_info:
+            self._log_info = log_info
+
+    def _log_levels(self) -> tuple[bool, bool]:
+        """Returns whether debug and info messages of the machine would be emitted."""
+        return _enabled_levels(_LOGGER)
+
     def _has_state(self, state: State | StateName, raise_error: bool = False) -> bool:
         found = state in self.states.values()
         if not found and raise_error:
@@ -1532,66 +2760,131 @@ class Machine:
             raise ValueError(msg)
         return found
 
-    # TODO: Refactor _process to support per-model queues for better multi-model isolation
-    #
-    # Current implementation uses a single global queue (self._transition_queue) shared by all models.
-    # This can be improved by adopting the per-model queue design from AsyncMachine:
-    #
-    # Implementation plan:
-    # 1. Change `queued` parameter type from `bool` to `bool | str` to support:
-    #    - queued=False (default): No queue, execute immediately
-    #    - queued=True: Single global queue (current behavior, backward compatible)
-    #    - queued="model": Per-model queue isolation (new feature)
-    #
-    # 2. Replace self._transition_queue with self._transition_queue_dict:
-    #    - Type: dict[int, deque[Callable[[], bool]]]
-    #    - Key: id(model) for per-model isolation
-    #    - For queued=True: Use a dict-like wrapper around single queue (backward compatible)
-    #    - For queued="model": Create separate deque for each model
-    #
-    # 3. Update _process signature to include model parameter:
-    #    - def _process(self, trigger: Callable[[], bool], model: Any) -> bool:
-    #    - Access queue via: self._transition_queue_dict[id(model)]
-    #
-    # 4. Update _transition_queue initialization in __init__:
-    #    - Initialize based on queued value (True vs "model")
-    #    - Update add_model/remove_model to manage per-model queues
-    #
-    # 5. Update all callers to pass model parameter:
-    #    - Event._trigger() -> machine._process(trigger, event_data.model)
-    #
-    # Benefits:
-    # - Better isolation between models in multi-model scenarios
-    # - Prevents one model's long queue from blocking other models
-    # - Consistent design with AsyncMachine (see tfsm/extensions/asyncio.py)
-    # - Maintains backward compatibility via queued=True mode
-    #
-    # Reference: AsyncMachine implementation in tfsm/extensions/asyncio.py:1169-1193
-    def _process(self, trigger: Callable[[], bool]) -> bool:
+    def _process(self, trigger: Callable[..., bool], *args: Any, model: Any = None) -> "bool | Future[bool]":
+        """Calls ``trigger(*args)`` right away or queues it if the machine processes events sequentially.
+        Arguments are only bound to ``trigger`` if the call has to be queued. ``model`` determines the queue
+        to use when models are queued individually."""
+        self._update_log_guards()
 
         # default processing
         if not self.has_queue:
             if not self._transition_queue:
                 # if trigger raises an Error, it has to be handled by the Machine.process caller
-                return trigger()
+                return trigger(*args)
             raise MachineError("Attempt to process events synchronously while transition queue is not empty!")
 
+        entry = partial(trigger, *args) if args else trigger
+        key, priority = self._queue_options(entry, model)
+        if self.has_queue == "model":
+            return self._process_model_queue(entry, model, key, priority)
+
         # process queued events
-        self._transition_queue.append(trigger)
+        queue = self._transition_queue
+        result, appended = self._enqueue(queue, entry, key, priority, Future() if self.queue_futures else None)
         # another entry in the queue implies a running transition; skip immediate execution
-        if len(self._transition_queue) > 1:
-            return True
+        if appended and len(queue) == 1:
+            # execute as long as transition queue is not empty
+            queue.drain()
+        return result
+
+    def _process_model_queue(
+        self, trigger: Callable[[], bool], model: Any, coalesce_key: tuple[str, int] | None = None, priority: int = 0
+    ) -> "bool | Future[bool]":
+        key = id(model)
+        queue = self._transition_queue_dict.get(key)
+        future: Future[bool] | None = Future() if self.queue_futures else None
+        # an existing queue implies a running transition of this model; skip immediate execution
+        if queue is not None:
+            return self._enqueue(queue, trigger, coalesce_key, priority, future)[0]
+        template = self._transition_queue
+        queue = self._transition_queue_dict[key] = TransitionQueue(template.capacity, template.overflow, self.queue_stats)
+        result, _ = self._enqueue(queue, trigger, None, 0, future)
+        try:
+            queue.drain()
+        finally:
+            # the queue might have been dropped (and replaced) when the model has been removed meanwhile
+            if self._transition_queue_dict.get(key) is queue:
+                del self._transition_queue_dict[key]
+        return result
+
+    def _enqueue(
+        self, queue: TransitionQueue, entry: Any, key: tuple[str, int] | None, priority: int, future: Any
+    ) -> "tuple[bool | Future[bool], bool]":
+        """Adds ``entry`` to ``queue`` unless it can be merged into a pending entry.
+        Returns:
+            tuple: The value returned to the caller (``future`` if passed) and whether ``entry`` has been appended.
+        """
+        if key is not None:
+            pending = self._coalesce_pending(queue, key, entry)
+            if pending is not None:
+                queue.promote(pending, priority)
+                return (queue.future(pending) if future is not None else True), False
+        if not queue.append(entry, key, priority, future):
+            return (future if future is not None else False), False
+        return (future if future is not None else True), True
+
+    def coalesce(self, trigger: str, policy: CoalescePolicy | None = "latest") -> None:
+        """Merges calls of ``trigger`` with a pending call of the same trigger and model in the transition queue
+        instead of queueing them. Only affects queued machines. A call which is already executed is not
+        considered pending. When the merged call has a higher priority (see ``prioritize``), the pending call
+        is moved in the queue as if it had been made with that priority.
+        Args:
+            trigger (str): The name of the trigger.
+            policy (str or callable): 'latest' (default) replaces the arguments of the pending call with the new
+                ones. 'first' discards the new call. A callable is passed the event data of the pending and the
+                new call and returns event data whose arguments are used for the pending call.
+                None disables coalescing for ``trigger``.
+        """
+        if policy is None:
+            self._coalescing.pop(trigger, None)
+        elif callable(policy) or policy in ("latest", "first"):
+            self._coalescing[trigger] = policy
+        else:
+            raise ValueError("Coalescing policy '%s' is not supported. Use 'latest', 'first' or a callable." % policy)
 
-        # execute as long as transition queue is not empty
-        while self._transition_queue:
-            try:
-                self._transition_queue[0]()
-                self._transition_queue.popleft()
-            except BaseException:
-                # if a transition raises an exception, clear queue and delegate exception handling
-                self._transition_queue.clear()
-                raise
-        return True
+    def prioritize(self, trigger: str, priority: int) -> None:
+        """Sets the queue priority of ``trigger``. Queued calls of triggers with a higher priority are executed
+        before pending calls with a lower priority. Calls with the same priority are executed in the order they
+        have been made. The default priority is 0. Individual calls may pass a priority with the keyword
+        argument named by ``priority_keyword`` which is not passed on to callbacks. Only affects queued machines.
+        Args:
+            trigger (str): The name of the trigger.
+            priority (int): The priority of the trigger. 0 resets the priority.
+        """
+        if priority:
+            self._priorities[trigger] = priority
+        else:
+            self._priorities.pop(trigger, None)
+
+    def _queue_options(self, entry: Any, model: Any) -> tuple[tuple[str, int] | None, int]:
+        """Returns the key under which a queue entry can be coalesced (or None if its trigger is not coalesced)
+        and its priority. Entries are partials of event processing methods which are passed the event data
+        first. Nested machines pass the name of the trigger as a second argument."""
+        args = getattr(entry, "args", ())
+        if not args:
+            return None, 0
+        event_data = args[0]
+        name = args[1] if len(args) > 1 else event_data.event.name
+        priority = event_data.kwargs.pop(self.priority_keyword, None) if self.priority_keyword else None
+        if priority is None:
+            priority = self._priorities.get(name, 0)
+        return ((name, id(model)) if name in self._coalescing else None), priority
+
+    def _coalesce_pending(self, queue: TransitionQueue, key: tuple[str, int], entry: Any) -> Any:
+        """Merges ``entry`` into the pending entry of ``queue`` with the same key according to the coalescing
+        policy of the trigger. Returns the pending entry or None if there is none."""
+        pending = queue.pending(key)
+        if pending is None:
+            return None
+        policy = self._coalescing[key[0]]
+        queued, event_data = pending.args[0], entry.args[0]
+        if policy == "latest":
+            queued.args, queued.kwargs = event_data.args, event_data.kwargs
+        elif policy != "first":
+            merged = cast(Callable[[EventData, EventData], EventData], policy)(queued, event_data)
+            queued.args, queued.kwargs = merged.args, merged.kwargs
+        queue.stats.add("coalesced")
+        return pending
 
     def _identify_callback(self, name: str) -> tuple[str | None, str | None]:
         # Does the prefix match a known callback?
@@ -3,14 +3,17 @@ tfsm.extensions
 ----------------------
 
 Additional functionality such as hierarchical (nested) machine support, Graphviz-based diagram creation
-and threadsafe execution of machine methods. Additionally, combinations of all those features are possible
+and threadsafe or concurrent execution of machine methods. Additionally, combinations of all those features are possible
 and made easier to access with a convenience factory.
 """
 
 from .diagrams import GraphMachine, HierarchicalGraphMachine
+from .executor import ExecutorMachine
 from .factory import LockedGraphMachine, LockedHierarchicalGraphMachine, LockedHierarchicalMachine, MachineFactory
 from .locking import LockedMachine
 from .nesting import HierarchicalMachine
+from .sharding import ShardedMachine
+from .table import TableMachine
 
 try:
     # only available for Python 3
@@ -20,6 +23,7 @@ except (ImportError, SyntaxError):  # pragma: no cover
     pass
 
 __all__ = [
+    "ExecutorMachine",
     "GraphMachine",
     "HierarchicalGraphMachine",
     "HierarchicalMachine",
@@ -28,6 +32,8 @@ __all__ = [
     "LockedHierarchicalGraphMachine",
     "LockedHierarchicalMachine",
     "LockedGraphMachine",
+    "ShardedMachine",
+    "TableMachine",
     "AsyncMachine",
     "HierarchicalAsyncMachine",
     "AsyncGraphMachine",
@@ -69,11 +69,27 @@ import logging
 import sys
 import warnings
 from collections import deque
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from functools import partial, reduce
 from typing import Any, Optional
 
-from ..core import Callback, CallbackList, Condition, Event, EventData, Machine, MachineError, State, StateName, Transition, listify
+from ..core import (
+    Callback,
+    CallbackList,
+    Condition,
+    DispatchResults,
+    Event,
+    EventData,
+    Machine,
+    MachineError,
+    ModelRegistry,
+    State,
+    StateName,
+    Transition,
+    TransitionQueue,
+    _TriggerChecks,
+    listify,
+)
 from .nesting import FunctionWrapper, HierarchicalMachine, NestedEvent, NestedState, NestedTransition, resolve_order
 
 _LOGGER = logging.getLogger(__name__)
@@ -669,7 +685,7 @@ class AsyncEvent(Event):
                 _LOGGER.error("%sWhile executing finalize callbacks a %s occurred: %s.", self.machine.name, type(err).__name__, str(err))
         return event_data.result
 
-    def _process(self, event_data: EventData) -> None:
+    def _process(self, event_data: EventData, transitions: Sequence[Transition] | None = None) -> None:
         """Synchronous version is disabled in AsyncEvent!
 
         ⚠️  Use 'await _aprocess(...)' instead.
@@ -742,7 +758,7 @@ class NestedAsyncEvent(NestedEvent):
                         elems.pop()
         return event_data.result
 
-    def _process(self, event_data: EventData) -> None:
+    def _process(self, event_data: EventData, transitions: Sequence[Transition] | None = None) -> None:
         """Synchronous version is disabled in NestedAsyncEvent!
 
         ⚠️  Use 'await _aprocess(...)' instead.
@@ -825,6 +841,7 @@ class AsyncMachine(Machine):
     state_cls = AsyncState
     transition_cls = AsyncTransition
     event_cls = AsyncEvent
+    model_bindings = ("instance",)  # async triggers are bound as wrapped coroutine functions
     async_tasks: dict[int, list["asyncio.Task[Any]"]] = {}
     protected_tasks: list["asyncio.Task[Any]"] = []
     current_context: contextvars.ContextVar[Optional["asyncio.Task[Any]"]] = contextvars.ContextVar("current_context", default=None)
@@ -874,8 +891,8 @@ class AsyncMachine(Machine):
             **kwargs,
         )
 
-        self._transition_queue_dict: dict[int, deque[partial[Any]]] = _DictionaryMock(self._transition_queue) if queued is True else {}
-        self._queued: bool | str = queued  # type: ignore[assignment]
+        self._transition_queue_dict: dict[int, TransitionQueue] = _DictionaryMock(self._transition_queue) if queued is True else {}
+        self._queued = queued
         for model in listify(model):
             self.add_model(model)
 
@@ -905,7 +922,13 @@ class AsyncMachine(Machine):
                     return await self._acan_trigger(model, trigger_name, *args, **kwargs)
 
                 self._checked_assignment(mod, "trigger", _trigger_wrapper)
+
+                async def _may_trigger_all_wrapper(*args: Any, model: Any = mod, **kwargs: Any) -> list[str]:
+                    """Async wrapper for may_trigger_all."""
+                    return await self.aget_available_triggers(model, *args, **kwargs)
+
                 self._checked_assignment(mod, "may_trigger", _may_trigger_wrapper)
+                self._checked_assignment(mod, "may_trigger_all", _may_trigger_all_wrapper)
 
                 for trigger in self.events:
                     self._add_trigger_to_model(trigger, mod)
@@ -916,9 +939,12 @@ class AsyncMachine(Machine):
                 self.set_state(initial, model=mod)  # type: ignore[arg-type]
                 self.models.append(mod)
 
-        if self.has_queue == "model":  # type: ignore[comparison-overlap]
+        if self.has_queue == "model":
+            template = self._transition_queue
             for mod in listify(model):
-                self._transition_queue_dict[id(self) if mod is self.self_literal else id(mod)] = deque()
+                self._transition_queue_dict[id(self) if mod is self.self_literal else id(mod)] = TransitionQueue(
+                    template.capacity, template.overflow, self.queue_stats
+                )
 
     def _add_trigger_to_model(self, trigger: str, model: Any) -> None:
         """Add an async trigger wrapper to the model.
@@ -992,7 +1018,7 @@ class AsyncMachine(Machine):
             return False
         return await event.atrigger(model, *args, **kwargs)  # type: ignore[attr-defined, no-any-return]
 
-    def dispatch(self, trigger: str, *args: Any, **kwargs: Any) -> bool:
+    def dispatch(self, trigger: str, *args: Any, **kwargs: Any) -> DispatchResults:
         """Synchronous version is disabled in AsyncMachine!
 
         ⚠️  Use 'await adispatch(...)' instead.
@@ -1002,7 +1028,17 @@ class AsyncMachine(Machine):
         """
         raise RuntimeError("AsyncMachine.dispatch() is disabled. Use 'await machine.adispatch(...)' instead.")
 
-    async def adispatch(self, trigger: str, *args: Any, **kwargs: Any) -> bool:
+    def dispatch_to(self, models: Iterable[Any], trigger: str, *args: Any, **kwargs: Any) -> DispatchResults:
+        """Synchronous version is disabled in AsyncMachine!
+
+        ⚠️  Use 'await adispatch_to(...)' instead.
+
+        Raises:
+            RuntimeError: Always raised when called
+        """
+        raise RuntimeError("AsyncMachine.dispatch_to() is disabled. Use 'await machine.adispatch_to(...)' instead.")
+
+    async def adispatch(self, trigger: str, *args: Any, **kwargs: Any) -> DispatchResults:
         """Trigger an event on all models assigned to the machine asynchronously.
 
         ⚠️  CRITICAL:
@@ -1017,10 +1053,23 @@ class AsyncMachine(Machine):
             *args (list): List of arguments passed to the event trigger
             **kwargs (dict): Dictionary of keyword arguments passed to the event trigger
         Returns:
-            bool: The truth value of all triggers combined with AND
+            DispatchResults: The result of every model which is truthy if all triggers succeeded
         """
-        results = await self.await_all([partial(getattr(model, trigger), *args, **kwargs) for model in self.models])
-        return all(results)
+        return await self.adispatch_to(self.models, trigger, *args, **kwargs)
+
+    async def adispatch_to(self, models: Iterable[Any], trigger: str, *args: Any, **kwargs: Any) -> DispatchResults:
+        """Trigger an event on ``models`` asynchronously. The triggers are processed concurrently.
+
+        Args:
+            models (iterable): Models assigned to the machine
+            trigger (str): Event name
+            *args (list): List of arguments passed to the event trigger
+            **kwargs (dict): Dictionary of keyword arguments passed to the event trigger
+        Returns:
+            DispatchResults: The result of every model which is truthy if all triggers succeeded
+        """
+        results = await self.await_all([partial(getattr(model, trigger), *args, **kwargs) for model in models])
+        return DispatchResults(results)
 
     def callbacks(self, funcs: CallbackList, event_data: EventData) -> None:
         """Synchronous version is disabled in AsyncMachine!
@@ -1152,18 +1201,17 @@ class AsyncMachine(Machine):
         and callbacks, but will not receive updates when states or tfsm are added to the Machine.
         If an event queue is used, all queued events of that model will be removed."""
         models = listify(model)
-        if self.has_queue == "model":  # type: ignore[comparison-overlap]
+        if self.has_queue == "model":
             for mod in models:
-                del self._transition_queue_dict[id(mod)]
+                # pending events are discarded (and their futures cancelled); the running one finishes
+                self._transition_queue_dict.pop(id(mod)).retain(lambda entry: False)
                 self.models.remove(mod)
         else:
             for mod in models:
                 self.models.remove(mod)
         if len(self._transition_queue) > 0:
-            queue = self._transition_queue
-            new_queue = [queue.popleft()] + [e for e in queue if e.args[0].model not in models]
-            self._transition_queue.clear()
-            self._transition_queue.extend(new_queue)
+            removed = ModelRegistry(models)
+            self._transition_queue.retain(lambda entry: entry.args[0].model not in removed)
 
     def _can_trigger(self, model: Any, trigger: str, *args: Any, **kwargs: Any) -> bool:
         """Synchronous version is disabled in AsyncMachine!
@@ -1183,19 +1231,16 @@ class AsyncMachine(Machine):
         state = self.get_model_state(model)
         event_data = AsyncEventData(state, AsyncEvent(name=trigger, machine=self), self, model, args, kwargs)
 
-        for trigger_name in self.get_triggers(state):
-            if trigger_name != trigger:
-                continue
-            for transition in self.events[trigger_name].transitions[state.name]:
+        event = self.events.get(trigger)
+        if event is not None and state.name in event.transitions:
+            for transition in event.transitions[state.name]:
                 try:
                     _ = self.get_state(transition.dest) if transition.dest is not None else transition.source
                 except ValueError:
                     continue
                 event_data.transition = transition
                 try:
-                    await self.acallbacks(self.prepare_event, event_data)
-                    await self.acallbacks(transition.prepare, event_data)
-                    if all(await self.await_all([partial(c.acheck, event_data) for c in transition.conditions])):  # type: ignore[attr-defined]
+                    if await self._acheck_transition(transition, event_data):
                         return True
                 except BaseException as err:  # pylint: disable=broad-except
                     event_data.error = err  # type: ignore[assignment]
@@ -1205,7 +1250,85 @@ class AsyncMachine(Machine):
                         raise
         return False
 
-    def _process(self, trigger: Callable[[], bool]) -> bool:
+    async def _acheck_transition(self, transition: Transition, event_data: EventData, checks: _TriggerChecks | None = None) -> bool:
+        """Async version of ``Machine._check_transition``. Conditions which have to be checked are awaited
+        concurrently.
+
+        ⚠️  CRITICAL: Must be awaited.
+        """
+        if checks is None:
+            await self.acallbacks(self.prepare_event, event_data)
+            await self.acallbacks(transition.prepare, event_data)
+            return all(await self.await_all([partial(c.acheck, event_data) for c in transition.conditions]))  # type: ignore[attr-defined]
+        if not checks.prepared:
+            await self.acallbacks(self.prepare_event, event_data)
+            checks.prepared = True
+        if transition.prepare:
+            await self.acallbacks(transition.prepare, event_data)
+            # prepare callbacks might change what conditions return
+            checks.results.clear()
+        keys: list[Any] = []
+        missing: dict[Any, Condition] = {}
+        for condition in transition.conditions:
+            key: Any = (condition.func, condition.target)
+            try:
+                cached = key in checks.results
+            except TypeError:  # unhashable callbacks are cached by condition
+                key = condition
+                cached = key in checks.results
+            keys.append(key)
+            if not cached:
+                missing[key] = condition
+        if missing:
+            results = await self.await_all([partial(c.acheck, event_data) for c in missing.values()])  # type: ignore[attr-defined]
+            checks.results.update(zip(missing, results, strict=True))
+        return all(checks.results[key] for key in keys)
+
+    def get_available_triggers(self, model: Any, *args: Any, **kwargs: Any) -> list[str]:
+        """Synchronous version is disabled in AsyncMachine!
+
+        ⚠️  Use 'await aget_available_triggers(...)' instead.
+
+        Raises:
+            RuntimeError: Always raised when called
+        """
+        raise RuntimeError("AsyncMachine.get_available_triggers() is disabled. Use 'await machine.aget_available_triggers(...)' instead.")
+
+    async def aget_available_triggers(self, model: Any, *args: Any, **kwargs: Any) -> list[str]:
+        """Async version of get_available_triggers. Like the synchronous version, 'prepare_event' callbacks are
+        called once and distinct conditions are checked at most once until the prepare callbacks of a transition
+        are called.
+
+        ⚠️  CRITICAL: Must be awaited.
+        """
+        state = self.get_model_state(model)
+        event_data: AsyncEventData | None = None
+        checks = _TriggerChecks()
+        available = []
+        for trigger in self._get_model_triggers(model):
+            event = self.events[trigger]
+            for transition in event.transitions[state.name]:
+                try:
+                    _ = self.get_state(transition.dest) if transition.dest is not None else transition.source
+                except ValueError:
+                    continue
+                if event_data is None:
+                    event_data = AsyncEventData(state, event, self, model, args, kwargs)
+                event_data.event = event
+                event_data.transition = transition
+                try:
+                    if await self._acheck_transition(transition, event_data, checks):
+                        available.append(trigger)
+                        break
+                except BaseException as err:  # pylint: disable=broad-except
+                    event_data.error = err  # type: ignore[assignment]
+                    if self.on_exception:
+                        await self.acallbacks(self.on_exception, event_data)
+                    else:
+                        raise
+        return available
+
+    def _process(self, trigger: Callable[..., bool], *args: Any, model: Any = None) -> bool:
         """Synchronous version is disabled in AsyncMachine!
 
         ⚠️  Use 'await _aprocess(...)' instead.
@@ -1223,23 +1346,38 @@ class AsyncMachine(Machine):
                 return await trigger()  # type: ignore[no-any-return]
             raise MachineError("Attempt to process events synchronously while transition queue is not empty!")
 
-        self._transition_queue_dict[id(model)].append(trigger)
+        queue = self._transition_queue_dict[id(model)]
+        key, priority = self._queue_options(trigger, model)
+        future = asyncio.get_running_loop().create_future() if self.queue_futures else None
+        result, appended = self._enqueue(queue, trigger, key, priority, future)
         # another entry in the queue implies a running transition; skip immediate execution
-        if len(self._transition_queue_dict[id(model)]) > 1:
-            return True
+        if not appended or len(queue) > 1:
+            return result  # type: ignore[return-value]
 
-        while self._transition_queue_dict[id(model)]:
-            try:
-                await self._transition_queue_dict[id(model)][0]()
-            except BaseException:
-                # if a transition raises an exception, clear queue and delegate exception handling
-                self._transition_queue_dict[id(model)].clear()
-                raise
-            try:
-                self._transition_queue_dict[id(model)].popleft()
-            except KeyError:
-                return True
-        return True
+        processed = 0
+        try:
+            while self._transition_queue_dict[id(model)]:
+                try:
+                    head = self._transition_queue_dict[id(model)][0]
+                    self._transition_queue_dict[id(model)].forget(head)
+                    res = await head()
+                except BaseException as err:
+                    # if a transition raises an exception, clear queue and delegate exception handling
+                    # the caller of the running trigger receives the exception directly; its future is cancelled
+                    if head is not trigger:
+                        self._transition_queue_dict[id(model)].settle(head, error=err)
+                    self._transition_queue_dict[id(model)].clear()
+                    raise
+                processed += 1
+                # settled first since the queue is dropped when a callback has removed the model
+                queue.settle(head, res)
+                try:
+                    self._transition_queue_dict[id(model)].popleft()
+                except KeyError:
+                    return result  # type: ignore[return-value]
+        finally:
+            queue.stats.record_drain(processed)
+        return result  # type: ignore[return-value]
 
 
 class HierarchicalAsyncMachine(HierarchicalMachine, AsyncMachine):
@@ -1391,6 +1529,18 @@ class HierarchicalAsyncMachine(HierarchicalMachine, AsyncMachine):
         """
         raise RuntimeError("HierarchicalAsyncMachine._can_trigger() is disabled. Use 'await machine._acan_trigger(...)' instead.")
 
+    def get_available_triggers(self, model: Any, *args: Any, **kwargs: Any) -> list[str]:
+        """Synchronous version is disabled in HierarchicalAsyncMachine!
+
+        ⚠️  Use 'await aget_available_triggers(...)' instead.
+
+        Raises:
+            RuntimeError: Always raised when called
+        """
+        raise RuntimeError(
+            "HierarchicalAsyncMachine.get_available_triggers() is disabled. Use 'await machine.aget_available_triggers(...)' instead."
+        )
+
     async def _acan_trigger(self, model: Any, trigger: str, *args: Any, **kwargs: Any) -> bool:
         """Async version of _can_trigger.
 
@@ -1418,6 +1568,21 @@ class HierarchicalAsyncMachine(HierarchicalMachine, AsyncMachine):
     async def _acan_trigger_nested(self, model: Any, trigger: str, path: list[str], *args: Any, **kwargs: Any) -> bool:
         """Async version of _can_trigger_nested.
 
+        ⚠️  CRITICAL: Must be awaited!
+        """
+        return await self._acheck_trigger_nested(model, trigger, path, args, kwargs)
+
+    async def _acheck_trigger_nested(
+        self,
+        model: Any,
+        trigger: str,
+        path: list[str],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        checks: _TriggerChecks | None = None,
+    ) -> bool:
+        """Async version of HierarchicalMachine._check_trigger_nested.
+
         ⚠️  CRITICAL: Must be awaited!
         """
         if trigger in self.events:
@@ -1432,9 +1597,7 @@ class HierarchicalAsyncMachine(HierarchicalMachine, AsyncMachine):
                         continue
                     event_data.transition = transition
                     try:
-                        await self.acallbacks(self.prepare_event, event_data)
-                        await self.acallbacks(transition.prepare, event_data)
-                        if all(await self.await_all([partial(c.acheck, event_data) for c in transition.conditions])):  # type: ignore[attr-defined]
+                        if await self._acheck_transition(transition, event_data, checks):
                             return True
                     except BaseException as err:  # pylint: disable=broad-except
                         event_data.error = err  # type: ignore[assignment]
@@ -1445,9 +1608,27 @@ class HierarchicalAsyncMachine(HierarchicalMachine, AsyncMachine):
                 source_path.pop(-1)
         if path:
             with self(path.pop(0)):
-                return await self._acan_trigger_nested(model, trigger, path, *args, **kwargs)
+                return await self._acheck_trigger_nested(model, trigger, path, args, kwargs, checks)
         return False
 
+    async def aget_available_triggers(self, model: Any, *args: Any, **kwargs: Any) -> list[str]:
+        """Async version of HierarchicalMachine.get_available_triggers.
+
+        ⚠️  CRITICAL: Must be awaited!
+        """
+        state_tree = self.build_state_tree(getattr(model, self.model_attribute), self.state_cls.separator)
+        ordered_states = resolve_order(state_tree)
+        triggers = self._get_model_triggers(model)
+        checks = _TriggerChecks()
+        available = []
+        with self():
+            for trigger in triggers:
+                for path in ordered_states:
+                    if await self._acheck_trigger_nested(model, trigger, list(path), args, kwargs, checks):
+                        available.append(trigger)
+                        break
+        return available
+
 
 class AsyncTimeout(AsyncState):
     """
@@ -100,6 +100,7 @@ class GraphMachine(MarkupMachine):
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         self.__dict__.update(state)
+        self._rebind_models()
         self.model_graphs: dict[int, Any] = {}  # reinitialize new model_graphs
         for model in self.models:
             try:
@@ -226,18 +227,15 @@ class GraphMachine(MarkupMachine):
                 the current state.
         Returns: AGraph (pygraphviz) or Digraph (graphviz) graph instance that can be drawn.
         """
-        if force_new:
+        # the graph is kept in a local since other threads might replace the graph of the model meanwhile
+        graph = None if force_new else self.model_graphs.get(id(model))
+        if graph is None:
             graph = self.graph_cls(self)
             self.model_graphs[id(model)] = graph
             try:
                 graph.set_node_style(getattr(model, self.model_attribute), "active")
             except AttributeError:
                 _LOGGER.info("Could not set active state of diagram")
-        try:
-            graph = self.model_graphs[id(model)]
-        except KeyError:
-            _ = self._get_graph(model, title, force_new=True)
-            graph = self.model_graphs[id(model)]
         return graph.get_graph(title=title, roi_state=getattr(model, self.model_attribute) if show_roi else None)
 
     def get_combined_graph(self, title: str | None = None, force_new: bool = False, show_roi: bool = False) -> Any:
@@ -0,0 +1,131 @@
+"""
+tfsm.extensions.executor
+------------------------------
+
+Processes the events of every model in a mailbox of its own. Mailboxes are processed by an executor which means that
+events of one model are executed in order while events of different models can be executed in parallel.
+"""
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Any
+
+from tfism.core import Machine, TransitionQueue, listify
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addHandler(logging.NullHandler())
+
+
+class ExecutorMachine(Machine):
+    """Machine which queues events in a mailbox for every model and processes mailboxes with an executor.
+    Triggers return a ``concurrent.futures.Future`` which resolves to the result of the event or its exception.
+    Events triggered in callbacks are queued like in a machine with ``queued='model'``. Exceptions are passed to the
+    future of the failing event only. Subsequent events of the same model are still processed.
+    Mailboxes support the queue options of ``Machine`` ('queue_capacity', 'queue_overflow' except for 'block',
+    priorities and coalescing). States and transitions must not be changed while events are processed
+    (see ``Machine.freeze``).
+
+    Attributes:
+        executor (Executor): The executor processing the mailboxes.
+    """
+
+    def __init__(
+        self,
+        model: Any = Machine.self_literal,
+        states: Any = None,
+        initial: Any = "initial",
+        transitions: Any = None,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            executor (Executor): The executor to process mailboxes with. If not passed, the machine creates a
+                ``ThreadPoolExecutor`` which is shut down with ``shutdown``.
+            max_workers (int): The number of worker threads of the created ``ThreadPoolExecutor``.
+            Other arguments are passed to ``Machine``. 'queued' is always set to 'model'.
+        """
+        if kwargs.get("queue_overflow") == "block":
+            raise ValueError("%s does not support the overflow policy 'block'." % type(self).__name__)
+        self._owns_executor = executor is None
+        self._max_workers = max_workers
+        self.executor: Executor = executor if executor is not None else ThreadPoolExecutor(max_workers)
+        # guards mailboxes; callbacks are never executed while the lock is held
+        self._mailbox_lock = Lock()
+        kwargs["queued"] = "model"
+        super().__init__(model=model, states=states, initial=initial, transitions=transitions, **kwargs)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_mailbox_lock"]
+        if self._owns_executor:
+            del state["executor"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._mailbox_lock = Lock()
+        if state["_owns_executor"]:
+            self.executor = ThreadPoolExecutor(state["_max_workers"])
+        super().__setstate__(state)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the executor if it has been created by the machine.
+        Args:
+            wait (bool): Whether to wait until all mailboxes have been processed.
+        """
+        if self._owns_executor:
+            self.executor.shutdown(wait=wait)
+
+    def remove_model(self, model: Any | list[Any]) -> None:
+        """Extends ``Machine.remove_model`` by cancelling the futures of pending events of removed models.
+        An event which is currently executed is finished."""
+        with self._mailbox_lock:
+            super().remove_model(listify(model))
+
+    def _process(self, trigger: Callable[..., bool], *args: Any, model: Any = None) -> "Future[bool]":
+        """Adds ``trigger(*args)`` to the mailbox of ``model`` and schedules the mailbox if it has been empty."""
+        self._update_log_guards()
+        entry = partial(trigger, *args) if args else trigger
+        key, priority = self._queue_options(entry, model)
+        with self._mailbox_lock:
+            mailbox = self._transition_queue_dict.get(id(model))
+            if mailbox is None:
+                template = self._transition_queue
+                mailbox = self._transition_queue_dict[id(model)] = TransitionQueue(template.capacity, template.overflow, self.queue_stats)
+            result, appended = self._enqueue(mailbox, entry, key, priority, Future())
+            if appended and len(mailbox) == 1:
+                self.executor.submit(self._run_mailbox, mailbox, id(model))
+        return result  # type: ignore[return-value]
+
+    def _run_mailbox(self, mailbox: TransitionQueue, key: int) -> None:
+        """Executes the events of ``mailbox`` until it is empty. Every event stays in the mailbox while it is executed."""
+        processed = 0
+        while True:
+            head = mailbox[0]
+            with self._mailbox_lock:
+                mailbox.forget(head)
+                future = mailbox.future(head)
+            result, error = None, None
+            # events whose future has been cancelled are skipped
+            if future is None or future.set_running_or_notify_cancel():
+                try:
+                    result = head()
+                except BaseException as err:  # pylint: disable=broad-except
+                    _LOGGER.debug("%sEvent raised an exception which is passed to its future: %r", self.name, err)
+                    error = err
+                processed += 1
+            with self._mailbox_lock:
+                mailbox.popleft()
+                done = not mailbox
+                if done:
+                    # the mailbox might have been dropped (and replaced) when the model has been removed meanwhile
+                    if self._transition_queue_dict.get(key) is mailbox:
+                        del self._transition_queue_dict[key]
+                    self.queue_stats.record_drain(processed)
+            mailbox.settle(head, result, error)
+            if done:
+                return
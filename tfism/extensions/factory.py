@@ -7,9 +7,6 @@ extension modules. These classes can be accessed by names as well as through a s
 factory object.
 """
 
-import itertools
-from collections.abc import Callable
-from functools import partial
 from typing import Any
 
 from ..core import Machine, Transition
@@ -60,6 +57,9 @@ class LockedHierarchicalMachine(LockedMachine, HierarchicalMachine):
     """
 
     event_cls = NestedEvent  # type: ignore[assignment]
+    # events and queries change the scope of the shared machine (see HierarchicalMachine.__call__) and must not run
+    # concurrently
+    lock_modes: tuple[str, ...] = ("machine",)
 
     def _get_qualified_state_name(self, state: Any) -> str:
         result = self.get_global_name(state.name)
@@ -71,20 +71,6 @@ class LockedGraphMachine(GraphMachine, LockedMachine):  # type: ignore[misc]
     A threadsafe machine with graph support.
     """
 
-    @staticmethod
-    def format_references(func: Callable[..., Any] | partial[Any]) -> str:
-        if isinstance(func, partial) and func.func.__name__.startswith("_locked_method"):
-            return "%s(%s)" % (
-                func.args[0].__name__,
-                ", ".join(
-                    itertools.chain(
-                        (str(_) for _ in func.args[1:]),
-                        ("%s=%s" % (key, value) for key, value in (func.keywords if func.keywords else {}).items()),
-                    )
-                ),
-            )
-        return GraphMachine.format_references(func)
-
 
 class LockedHierarchicalGraphMachine(GraphMachine, LockedHierarchicalMachine):  # type: ignore[misc]
     """
@@ -94,10 +80,6 @@ class LockedHierarchicalGraphMachine(GraphMachine, LockedHierarchicalMachine):
     transition_cls = NestedGraphTransition
     event_cls = NestedEvent
 
-    @staticmethod
-    def format_references(func: Callable[..., Any] | partial[Any]) -> str:
-        return LockedGraphMachine.format_references(func)
-
 
 class AsyncGraphMachine(GraphMachine, AsyncMachine):
     """A machine that supports asynchronous event/callback processing with Graphviz support."""
@@ -8,11 +8,13 @@ Additionally, the user can inject her/his own context manager into the machine i
 
 import inspect
 import logging
+import weakref
 from collections import defaultdict
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from concurrent.futures import Executor
 from contextlib import ExitStack, contextmanager
-from functools import partial
-from threading import Lock, get_ident
+from functools import partial, wraps
+from threading import Condition, Lock, RLock, get_ident
 from typing import Any
 
 from tfism.core import Callback, CallbackList, Event, Machine, listify
@@ -20,6 +22,10 @@ from tfism.core import Callback, CallbackList, Event, Machine, listify
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.addHandler(logging.NullHandler())
 
+# Functions created by _lock_methods mapped to whether they wrap a method defined by the class they have been
+# assigned to (True) or an inherited one (False). Subclasses wrap the original functions again.
+_LOCK_WRAPPERS: "weakref.WeakKeyDictionary[Callable[..., Any], bool]" = weakref.WeakKeyDictionary()
+
 
 @contextmanager
 def nested(*contexts: Any) -> Generator[tuple[Any, ...], None, None]:
@@ -55,8 +61,109 @@ class PicklableLock:
         self.lock.__exit__(exc_type, exc_val, exc_tb)
 
 
+class PicklableRLock(PicklableLock):
+    """A reentrant variant of PicklableLock."""
+
+    def __init__(self) -> None:
+        self.lock: RLock = RLock()  # type: ignore[assignment]
+
+    def __setstate__(self, value: str) -> None:
+        PicklableRLock.__init__(self)
+
+
+class ReadWriteLock:
+    """A reentrant readers/writer lock which prefers writers. Entering the lock acquires it for writing while
+    entering ``reader`` acquires it for reading. Readers share the lock and are blocked as soon as a writer waits
+    for it. The thread holding the write lock may also read but a thread holding a read lock cannot acquire the
+    write lock which raises a RuntimeError. Like PicklableLock, the state is discarded during pickling.
+    """
+
+    def __init__(self) -> None:
+        self._condition = Condition(Lock())
+        self._readers: dict[int, int] = {}
+        self._writer = 0
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self.reader = _ReadLock(self)
+
+    def __getstate__(self) -> str:
+        return ""
+
+    def __setstate__(self, value: str) -> None:
+        ReadWriteLock.__init__(self)
+
+    def reading(self) -> bool:
+        """Returns whether the calling thread holds the lock for reading."""
+        return get_ident() in self._readers
+
+    def acquire_read(self) -> None:
+        ident = get_ident()
+        with self._condition:
+            if ident not in self._readers and self._writer != ident:
+                while self._writer or self._waiting_writers:
+                    self._condition.wait()
+            self._readers[ident] = self._readers.get(ident, 0) + 1
+
+    def release_read(self) -> None:
+        ident = get_ident()
+        with self._condition:
+            if self._readers[ident] > 1:
+                self._readers[ident] -= 1
+                return
+            del self._readers[ident]
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        ident = get_ident()
+        with self._condition:
+            if self._writer == ident:
+                self._writer_depth += 1
+                return
+            if ident in self._readers:
+                raise RuntimeError("A thread holding a read lock cannot acquire the write lock.")
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = ident
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        with self._condition:
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = 0
+                self._condition.notify_all()
+
+    def __enter__(self) -> None:
+        self.acquire_write()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.release_write()
+
+
+class _ReadLock:
+    """Context manager which acquires a ReadWriteLock for reading."""
+
+    def __init__(self, lock: ReadWriteLock) -> None:
+        self.lock = lock
+
+    def __enter__(self) -> None:
+        self.lock.acquire_read()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.lock.release_read()
+
+
 class IdentManager:
-    """Manages the identity of threads to detect whether the current thread already has a lock."""
+    """Manages the identity of threads to detect whether the current thread already has a lock.
+    ``current`` is only written by the thread holding the lock and other threads merely compare it with their own
+    identity. A stale value can therefore never match another thread which is why reading it needs no lock,
+    with or without the GIL.
+    """
 
     def __init__(self) -> None:
         self.current: int = 0
@@ -77,7 +184,7 @@ class LockedEvent(Event):
         # noinspection PyProtectedMember
         # LockedMachine._locked should not be called somewhere else. That's why it should not be exposed
         # to Machine users.
-        if self.machine._ident.current != get_ident():
+        if self.machine._model_locks or self.machine._ident.current != get_ident():
             with nested(*self.machine.model_context_map[id(model)]):
                 return super().trigger(model, *args, **kwargs)
         else:
@@ -87,12 +194,65 @@ class LockedEvent(Event):
 class LockedMachine(Machine):
     """Machine class which manages contexts. In it's default version the machine uses a `threading.Lock`
         context to lock access to its methods and event triggers bound to model objects.
+        With ``lock_mode`` set to 'model' or 'striped', events only enter the contexts of the triggered model
+        which contain a reentrant lock of the model ('model') or a lock shared by the models hashed to the same
+        stripe ('striped') instead of ``machine_context``. ``machine_context`` is then only entered by methods that
+        change the structure of the machine (see ``structural_methods``). Other machine methods are not locked.
+        Structural changes should not happen while events are processed (see ``Machine.freeze``).
+        Callbacks which trigger events of other models acquire the locks of several models. Two such events
+        which lock the same models in opposite order deadlock. Hierarchical machines only support 'machine' since
+        their events and queries change the scope of the shared machine.
+        With ``lock_mode`` set to 'rw', ``machine_context`` starts with a ``ReadWriteLock``. Events and machine
+        methods acquire it for writing except for ``read_methods`` (including 'is_<state>' and 'may_<trigger>'
+        of models) which acquire it for reading and may run concurrently.
+        While a ``dispatch_executor`` is set, ``dispatch_methods`` do not enter ``machine_context`` since the
+        workers of the executor enter the contexts of every model they trigger. Dispatches from threads which
+        hold ``machine_context`` already (e.g. from callbacks) process all models in the calling thread. With
+        'model' or 'striped', callbacks must not dispatch with an executor since its workers might wait for the
+        locks held by the callback (with 'striped' also those of other models sharing a stripe).
     Attributes:
         machine_context (dict): A dict of context managers to be entered whenever a machine method is
             called or an event is triggered. Contexts are managed for each model individually.
+        lock_mode (str): Either 'machine', 'model', 'striped' or 'rw'.
     """
 
     event_cls = LockedEvent
+    lock_modes: tuple[str, ...] = ("machine", "model", "striped", "rw")  # supported values of 'lock_mode'
+    lock_mode = "machine"
+    # methods which are locked with 'machine_context' when lock_mode is not 'machine'
+    structural_methods = frozenset({
+        "add_model",
+        "remove_model",
+        "add_state",
+        "add_states",
+        "add_transition",
+        "add_transitions",
+        "add_ordered_transitions",
+        "remove_transition",
+        "freeze",
+        "coalesce",
+        "prioritize",
+    })
+    # methods which do not enter 'machine_context' while a 'dispatch_executor' is set
+    dispatch_methods = frozenset({"dispatch", "dispatch_to"})
+    # methods which are passed a model first and are locked with its contexts when lock_mode is not 'machine'
+    model_methods = frozenset({"trigger_event", "to_state"})
+    # methods which only acquire the read lock when lock_mode is 'rw'; private methods listed here are locked as well
+    read_methods = frozenset({
+        "get_available_triggers",
+        "get_global_name",
+        "get_model_state",
+        "get_nested_state_names",
+        "get_nested_transitions",
+        "get_nested_triggers",
+        "get_state",
+        "get_states",
+        "get_transitions",
+        "get_triggers",
+        "has_trigger",
+        "is_state",
+        "_can_trigger",
+    })
 
     def __init__(
         self,
@@ -107,7 +267,7 @@ class LockedMachine(Machine):
         before_state_change: str | Callback | CallbackList | None = None,
         after_state_change: str | Callback | CallbackList | None = None,
         name: str | None = None,
-        queued: bool = False,
+        queued: bool | str = False,
         prepare_event: str | Callback | CallbackList | None = None,
         finalize_event: str | Callback | CallbackList | None = None,
         model_attribute: str = "state",
@@ -115,12 +275,36 @@ class LockedMachine(Machine):
         on_exception: str | Callback | CallbackList | None = None,
         on_final: str | Callback | CallbackList | None = None,
         machine_context: Any = None,
+        lock_mode: str = "machine",
+        lock_stripes: int = 16,
         **kwargs: Any,
     ) -> None:
-
+        """
+        Args:
+            machine_context (list or object): Context managers entered by machine methods and (unless
+                ``lock_mode`` is 'model' or 'striped') event triggers. Defaults to a lock.
+            lock_mode (str): 'machine' (default) locks events with ``machine_context``. 'model' uses a reentrant
+                lock per model and 'striped' a pool of ``lock_stripes`` reentrant locks shared by models.
+                'rw' locks like 'machine' but with a ``ReadWriteLock`` which ``read_methods`` share.
+            lock_stripes (int): The number of locks used when ``lock_mode`` is 'striped'.
+            Other arguments are passed to ``Machine``.
+        """
+        if lock_mode not in self.lock_modes:
+            raise ValueError("%s does not support lock_mode '%s'. Use one of %s." % (type(self).__name__, lock_mode, self.lock_modes))
+        if lock_mode in ("model", "striped") and queued is True:
+            raise ValueError("lock_mode '%s' requires queued to be False or 'model'." % lock_mode)
+        if lock_stripes < 1:
+            raise ValueError("lock_stripes must be at least 1 but was %d." % lock_stripes)
+        self.lock_mode = lock_mode
+        self._lock_stripes: list[PicklableRLock] = [PicklableRLock() for _ in range(lock_stripes)] if lock_mode == "striped" else []
+        self._model_locks = lock_mode in ("model", "striped")
+        self._rw_lock: ReadWriteLock | None = ReadWriteLock() if lock_mode == "rw" else None
         self._ident: IdentManager = IdentManager()
-        machine_context_list: list[Any] | tuple[Any, ...] = listify(machine_context) or [PicklableLock()]
-        self.machine_context: list[Any] = list(machine_context_list)
+        if self._rw_lock is not None:
+            # the read/write lock must be acquired first to keep the order of reads and writes consistent
+            self.machine_context: list[Any] = [self._rw_lock, *listify(machine_context)]
+        else:
+            self.machine_context = list(listify(machine_context) or [PicklableLock()])
         self.machine_context.append(self._ident)
         self.model_context_map: defaultdict[Any, list[Any]] = defaultdict(list)
 
@@ -162,6 +346,7 @@ class LockedMachine(Machine):
         for model in self.models:
             self.model_context_map[id(model)] = self._model_context_map_store[model]
         del self._model_context_map_store
+        self._rebind_models()
 
     def add_model(self, model: Any, initial: Any = None, model_context: Any = None) -> Any:
         """Extends `tfsm.core.Machine.add_model` by `model_context` keyword.
@@ -177,7 +362,13 @@ class LockedMachine(Machine):
 
         for mod in models:
             mod = self if mod is self.self_literal else mod
-            self.model_context_map[id(mod)].extend(self.machine_context)
+            if not self._model_locks:
+                self.model_context_map[id(mod)].extend(self.machine_context)
+            elif self.lock_mode == "model":
+                self.model_context_map[id(mod)].append(PicklableRLock())
+            else:
+                # ids of objects are aligned which is why the lower bits are dropped
+                self.model_context_map[id(mod)].append(self._lock_stripes[(id(mod) >> 4) % len(self._lock_stripes)])
             self.model_context_map[id(mod)].extend(model_context_list)
 
     def remove_model(self, model: Any) -> Any:
@@ -190,18 +381,9 @@ class LockedMachine(Machine):
 
         return super().remove_model(models)
 
-    def __getattribute__(self, item: str) -> Any:
-        get_attr = super().__getattribute__
-        tmp = get_attr(item)
-        if not item.startswith("_") and inspect.ismethod(tmp):
-            return partial(get_attr("_locked_method"), tmp)
-        return tmp
-
-    def __getattr__(self, item: str) -> Any:
-        try:
-            return super().__getattribute__(item)
-        except AttributeError:
-            return super().__getattr__(item)
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _lock_methods(cls)
 
     # Determine if the returned method is a partial and make sure the returned partial has
     # not been created by Machine.__getattr__.
@@ -214,13 +396,108 @@ class LockedMachine(Machine):
             if isinstance(func, partial) and func.func != state.add_callback:
                 state.add_callback(prefix, callback)
 
+    def _get_dispatch_executor(self) -> Executor | None:
+        # workers would wait for the contexts held by the calling thread
+        if self._ident.current == get_ident():
+            return None
+        return super()._get_dispatch_executor()
+
     # this needs to be overridden by the HSM variant to resolve names correctly
     def _get_qualified_state_name(self, state: Any) -> Any:
         return state.name
 
-    def _locked_method(self, func: Any, *args: Any, **kwargs: Any) -> Any:
-        if self._ident.current != get_ident():
+
+def _lock_method(
+    func: Callable[..., Any], structural: bool, model_method: bool, read: bool, dispatching: bool = False
+) -> Callable[..., Any]:
+    """Wraps a public machine method to enter the machine's contexts unless the calling thread has entered them
+    already. Depending on ``lock_mode``, only structural methods are locked, model methods enter the contexts
+    of the model passed as first argument and read methods acquire the read lock. Dispatching methods are not
+    locked while a dispatch executor is set."""
+    if structural:
+
+        def locked(self: LockedMachine, *args: Any, **kwargs: Any) -> Any:
+            if self._ident.current == get_ident():
+                return func(self, *args, **kwargs)
             with nested(*self.machine_context):
-                return func(*args, **kwargs)
-        else:
-            return func(*args, **kwargs)
+                return func(self, *args, **kwargs)
+
+    elif model_method:
+
+        def locked(self: LockedMachine, *args: Any, **kwargs: Any) -> Any:
+            if self._model_locks:
+                with nested(*self.model_context_map[id(args[0])]):
+                    return func(self, *args, **kwargs)
+            if self._ident.current == get_ident():
+                return func(self, *args, **kwargs)
+            with nested(*self.machine_context):
+                return func(self, *args, **kwargs)
+
+    elif read:
+
+        def locked(self: LockedMachine, *args: Any, **kwargs: Any) -> Any:
+            if self._ident.current == get_ident():
+                return func(self, *args, **kwargs)
+            if self._rw_lock is not None:
+                with self._rw_lock.reader:
+                    return func(self, *args, **kwargs)
+            if self._model_locks:
+                return func(self, *args, **kwargs)
+            with nested(*self.machine_context):
+                return func(self, *args, **kwargs)
+
+    else:
+
+        def locked(self: LockedMachine, *args: Any, **kwargs: Any) -> Any:
+            if self._ident.current == get_ident() or self._model_locks:
+                return func(self, *args, **kwargs)
+            # methods like 'callbacks' which are called while reading are considered part of the read
+            if self._rw_lock is not None and self._rw_lock.reading():
+                return func(self, *args, **kwargs)
+            with nested(*self.machine_context):
+                return func(self, *args, **kwargs)
+
+    if dispatching:
+        lock = locked
+
+        def locked(self: LockedMachine, *args: Any, **kwargs: Any) -> Any:
+            if self.dispatch_executor is not None and self._ident.current != get_ident():
+                return func(self, *args, **kwargs)
+            return lock(self, *args, **kwargs)
+
+    return wraps(func)(locked)
+
+
+def _resolve_method(cls: type, name: str) -> Any:
+    """Returns the attribute ``name`` of ``cls`` like ``getattr`` but skips locked wrappers."""
+    for klass in cls.__mro__:
+        attr = klass.__dict__.get(name)
+        if attr is None:
+            continue
+        try:
+            own = _LOCK_WRAPPERS[attr]
+        except (KeyError, TypeError):
+            return attr
+        if own:
+            return attr.__wrapped__
+    return None
+
+
+def _lock_methods(cls: type[LockedMachine]) -> None:
+    """Replaces all public methods of ``cls`` (including inherited ones) and private ``read_methods`` with locked
+    wrappers. Wrappers of base classes are not wrapped again but the original functions are which means methods
+    are locked only once."""
+    for name in dir(cls):
+        if name.startswith("_") and name not in cls.read_methods:
+            continue
+        own = name in cls.__dict__
+        func = _resolve_method(cls, name)
+        if inspect.isfunction(func):
+            wrapper = _lock_method(
+                func, name in cls.structural_methods, name in cls.model_methods, name in cls.read_methods, name in cls.dispatch_methods
+            )
+            _LOCK_WRAPPERS[wrapper] = own
+            setattr(cls, name, wrapper)
+
+
+_lock_methods(LockedMachine)
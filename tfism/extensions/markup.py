@@ -15,7 +15,7 @@ from enum import Enum
 from functools import partial
 from typing import Any
 
-from ..core import Machine
+from ..core import AutoTransitions, Machine
 from .nesting import HierarchicalMachine
 
 
@@ -249,6 +249,9 @@ class MarkupMachine(Machine):
     # auto transition events commonly a) start with the 'to_' prefix, followed by b) the state name
     # and c) contain a transition from each state to the target state (including the target)
     def _is_auto_transition(self, event: Any) -> bool:
+        # lazily created auto transitions can be identified without creating all of them
+        if isinstance(event.transitions, AutoTransitions):
+            return True
         if event.name.startswith("to_") and len(event.transitions) == len(self.states):
             state_name = event.name.removeprefix("to_")
             try:
@@ -11,11 +11,25 @@ import copy
 import inspect
 import logging
 from collections import OrderedDict
+from collections.abc import Sequence
 from enum import Enum, EnumMeta
 from functools import partial, reduce
 from typing import Any, Optional, Union
 
-from ..core import Callback, CallbackList, Event, EventData, Machine, MachineError, State, StateName, Transition, listify
+from ..core import (
+    Callback,
+    CallbackList,
+    Event,
+    EventData,
+    Machine,
+    MachineError,
+    State,
+    StateName,
+    Transition,
+    _enabled_levels,
+    _TriggerChecks,
+    listify,
+)
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.addHandler(logging.NullHandler())
@@ -132,11 +146,14 @@ class NestedEvent(Event):
                         elems.pop()
         return event_data.result
 
-    def _process(self, event_data: EventData) -> None:
+    def _process(self, event_data: EventData, transitions: Sequence[Transition] | None = None) -> None:
         machine = event_data.machine
         machine.callbacks(event_data.machine.prepare_event, event_data)
-        _LOGGER.debug("%sExecuted machine preparation callbacks before conditions.", machine.name)
-        for trans in self.transitions[event_data.source_name]:  # type: ignore[attr-defined]
+        if machine._log_debug:
+            _LOGGER.debug("%sExecuted machine preparation callbacks before conditions.", machine.name)
+        if transitions is None:
+            transitions = self.transitions[event_data.source_name]  # type: ignore[attr-defined]
+        for trans in transitions:
             event_data.transition = trans
             event_data.result = trans.execute(event_data)
             if event_data.result:
@@ -450,6 +467,7 @@ class HierarchicalMachine(Machine):
     state_cls = NestedState
     transition_cls = NestedTransition
     event_cls = NestedEvent
+    model_bindings = ("instance",)  # nested triggers and states are bound with custom wrappers
 
     def __init__(
         self,
@@ -622,6 +640,7 @@ class HierarchicalMachine(Machine):
                 passed in an individual state's initialization arguments.
             **kwargs additional keyword arguments used by state mixins.
         """
+        self._check_mutable()
         remap = kwargs.pop("remap", None)
         ignore = self.ignore_invalid_triggers if ignore_invalid_triggers is None else ignore_invalid_triggers
 
@@ -881,6 +900,7 @@ class HierarchicalMachine(Machine):
             source (str, State or Enum): Limits list to tfsm from a certain state.
             dest (str, State or Enum): Limits list to tfsm to a certain state.
         """
+        self._check_mutable()
         with self():
             source_path = (
                 []
@@ -914,6 +934,19 @@ class HierarchicalMachine(Machine):
             return any(self._can_trigger_nested(model, trigger, state_path, *args, **kwargs) for state_path in ordered_states)
 
     def _can_trigger_nested(self, model: Any, trigger: str, path: list[str], *args: Any, **kwargs: Any) -> bool:
+        return self._check_trigger_nested(model, trigger, path, args, kwargs)
+
+    def _check_trigger_nested(
+        self,
+        model: Any,
+        trigger: str,
+        path: list[str],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        checks: _TriggerChecks | None = None,
+    ) -> bool:
+        """Checks whether ``trigger`` can be fired from ``path`` or one of its parents in the current scope and the
+        scopes along ``path`` which is consumed. ``checks`` is passed to ``_check_transition``."""
         if trigger in self.events:
             source_path = copy.copy(path)
             while source_path:
@@ -926,9 +959,7 @@ class HierarchicalMachine(Machine):
                         continue
                     event_data.transition = transition
                     try:
-                        self.callbacks(self.prepare_event, event_data)
-                        self.callbacks(transition.prepare, event_data)
-                        if all(c.check(event_data) for c in transition.conditions):
+                        if self._check_transition(transition, event_data, checks):
                             return True
                     except BaseException as err:  # pylint: disable=broad-except
                         event_data.error = err  # type: ignore[assignment]
@@ -939,9 +970,29 @@ class HierarchicalMachine(Machine):
                 source_path.pop(-1)
         if path:
             with self(path.pop(0)):
-                return self._can_trigger_nested(model, trigger, path, *args, **kwargs)
+                return self._check_trigger_nested(model, trigger, path, args, kwargs, checks)
         return False
 
+    def get_available_triggers(self, model: Any, *args: Any, **kwargs: Any) -> list[str]:
+        """Extends tfsm.core.Machine.get_available_triggers to nested and parallel states. Like in the core
+        machine, 'prepare_event' callbacks are called once and distinct conditions are checked at most once
+        until the prepare callbacks of a transition are called."""
+        state_tree = self.build_state_tree(getattr(model, self.model_attribute), self.state_cls.separator)
+        ordered_states = resolve_order(state_tree)
+        triggers = self._get_model_triggers(model)
+        checks = _TriggerChecks()
+        with self():
+            return [
+                trigger
+                for trigger in triggers
+                if any(self._check_trigger_nested(model, trigger, list(path), args, kwargs, checks) for path in ordered_states)
+            ]
+
+    def _get_model_triggers(self, model: Any) -> list[str]:
+        state_tree = self.build_state_tree(getattr(model, self.model_attribute), self.state_cls.separator)
+        paths = resolve_order(state_tree)
+        return list(dict.fromkeys(self.get_triggers(*(self.state_cls.separator.join(path) for path in paths))))
+
     def get_triggers(self, *args: Any) -> list[str]:
         """Extends tfsm.core.Machine.get_triggers to also include parent state triggers."""
         triggers = []
@@ -957,6 +1008,11 @@ class HierarchicalMachine(Machine):
                     state_path.pop()
         return triggers
 
+    def _get_state_triggers(self, name: str) -> list[str]:
+        # events are swapped when the machine changes its scope; the reverse index of the core machine
+        # does not account for that
+        return [t for (t, ev) in self.events.items() if name in ev.transitions]
+
     def has_trigger(self, trigger: str, state: Union["NestedState", "HierarchicalMachine"] | None = None) -> bool:
         """Check whether an event/trigger is known to the machine
         Args:
@@ -1060,7 +1116,7 @@ class HierarchicalMachine(Machine):
         event_data = NestedEventData(state=None, event=None, machine=self, model=model, args=args, kwargs=kwargs)
         event_data.result = None  # type: ignore[assignment]
 
-        return self._process(partial(self._trigger_event, event_data, trigger))  # type: ignore[arg-type]
+        return self._process(self._trigger_event, event_data, trigger, model=model)  # type: ignore[arg-type, return-value]
 
     def _trigger_event(self, event_data: "NestedEventData", trigger: str) -> bool | None:
         try:
@@ -1076,7 +1132,8 @@ class HierarchicalMachine(Machine):
         finally:
             try:
                 self.callbacks(self.finalize_event, event_data)
-                _LOGGER.debug("%sExecuted machine finalize callbacks", self.name)
+                if self._log_debug:
+                    _LOGGER.debug("%sExecuted machine finalize callbacks", self.name)
             except BaseException as err:  # pylint: disable=broad-except; Exception will be handled elsewhere
                 _LOGGER.error("%sWhile executing finalize callbacks a %s occurred: %s.", self.name, type(err).__name__, str(err))
         return event_data.result
@@ -1246,6 +1303,12 @@ class HierarchicalMachine(Machine):
                 tmp = tmp.setdefault(elem.name if hasattr(elem, "name") else elem, OrderedDict())
         return tree
 
+    def _log_levels(self) -> tuple[bool, bool]:
+        # this module's logger might be configured independently of tfsm.core
+        core_debug, core_info = super()._log_levels()
+        log_debug, log_info = _enabled_levels(_LOGGER)
+        return core_debug or log_debug, core_info or log_info
+
     def _get_enum_path(self, enum_state: Enum, prefix: list[str] | None = None) -> list[str] | None:
         prefix = prefix or []
         if enum_state.name in self.states and self.states[enum_state.name].value == enum_state:
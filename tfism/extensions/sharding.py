@@ -0,0 +1,338 @@
+"""
+tfsm.extensions.sharding
+------------------------------
+
+Partitions models across worker processes. Every process runs an identical machine built from a markup
+configuration (see ``MarkupMachine.markup``) and manages the models assigned to it. Requests are routed by the key of
+a model, sent to the processes in batches and answered with futures.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+from collections import Counter
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from threading import RLock, Thread
+from typing import Any
+
+from tfism.core import Machine
+from tfism.extensions.markup import MarkupMachine
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addHandler(logging.NullHandler())
+
+
+@dataclass(eq=False)
+class ShardModel:
+    """Default model of ShardedMachine which only stores its key.
+
+    Attributes:
+        key (Hashable): The key of the model.
+    """
+
+    key: Hashable
+
+
+class ShardFuture(Future[Any]):
+    """A future of a request which sends the batch containing the request when its result is retrieved.
+    Waiting for the future with ``concurrent.futures.wait`` does not send the batch (see ``ShardedMachine.flush``).
+    """
+
+    def __init__(self, machine: "ShardedMachine", shard: int) -> None:
+        super().__init__()
+        self._machine = machine
+        self._shard = shard
+
+    def result(self, timeout: float | None = None) -> Any:
+        if not self.done():
+            self._machine.flush(self._shard)
+        return super().result(timeout)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        if not self.done():
+            self._machine.flush(self._shard)
+        return super().exception(timeout)
+
+
+class _Shard:
+    """Connections, pending requests and the process of a shard."""
+
+    def __init__(self, index: int, process: Any, requests: Connection, responses: Connection) -> None:
+        self.index = index
+        self.process = process
+        self.requests = requests
+        self.responses = responses
+        self.batch: list[tuple[str, int, Any]] = []
+        self.futures: dict[int, Future[Any]] = {}
+        self.receiver = Thread(target=self._receive, name="shard-%d-receiver" % index, daemon=True)
+        self.receiver.start()
+
+    def _receive(self) -> None:
+        while True:
+            try:
+                results = self.responses.recv()
+            except (EOFError, OSError):
+                break
+            for request, error, value in results:
+                future = self.futures.pop(request, None)
+                if future is None:
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(value)
+        # requests which have not been answered will never be
+        for request in list(self.futures):
+            future = self.futures.pop(request, None)
+            if future is not None and not future.done():
+                future.set_exception(RuntimeError("Shard %d has been stopped before answering the request." % self.index))
+
+
+class ShardedMachine:
+    """Front end which partitions models by key across worker processes. Every process runs an instance of
+    ``machine_cls`` built from ``markup`` and creates its models with ``model_factory``. Requests (adding and removing
+    models, triggers and state queries) are collected in a batch for every shard and return a ``ShardFuture``.
+    A batch is sent when it contains ``batch_size`` requests, when ``flush`` is called or when the result of one of
+    its futures is retrieved. Requests of a model are processed in the order they have been made.
+    The machine class, model factory, trigger arguments and results must be picklable.
+
+    Attributes:
+        batch_size (int): The number of requests collected per shard before they are sent.
+    """
+
+    def __init__(
+        self,
+        markup: dict[str, Any],
+        shards: int | None = None,
+        machine_cls: type[Machine] = MarkupMachine,
+        model_factory: Callable[[Hashable], Any] = ShardModel,
+        batch_size: int = 256,
+        mp_context: Any = None,
+    ) -> None:
+        """
+        Args:
+            markup (dict): The configuration of the machines, for instance ``MarkupMachine.markup``. Models of the
+                configuration are ignored.
+            shards (int): The number of worker processes. Defaults to the number of CPUs.
+            machine_cls (type): A machine class accepting ``markup`` as keyword argument.
+            model_factory (callable): Creates a model in the worker process and is passed the key of the model.
+            batch_size (int): The number of requests collected per shard before they are sent.
+            mp_context: The ``multiprocessing`` context used to start processes. Defaults to the default context.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1 but was %d." % batch_size)
+        self.batch_size = batch_size
+        self._markup = {key: value for key, value in markup.items() if key != "models"}
+        self._machine_cls = machine_cls
+        self._model_factory = model_factory
+        self._context = mp_context or multiprocessing.get_context()
+        self._lock = RLock()
+        self._requests = itertools.count()
+        self._assignments: dict[Hashable, int] = {}
+        self._shards: list[_Shard] = []
+        self._start(shards or os.cpu_count() or 1)
+
+    def __enter__(self) -> "ShardedMachine":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    @property
+    def shards(self) -> int:
+        """The number of worker processes."""
+        return len(self._shards)
+
+    @property
+    def shard_sizes(self) -> list[int]:
+        """The number of models assigned to each shard."""
+        sizes = Counter(self._assignments.values())
+        return [sizes[index] for index in range(len(self._shards))]
+
+    def shard_of(self, key: Hashable) -> int:
+        """Returns the index of the shard managing the model with ``key``."""
+        try:
+            return self._assignments[key]
+        except KeyError:
+            raise ValueError("Model with key %r has not been added to the machine." % (key,)) from None
+
+    def add_model(self, key: Hashable, initial: Any = None) -> "Future[None]":
+        """Creates a model for ``key`` in the shard selected by the hash of ``key``.
+        Args:
+            key (Hashable): The key of the model.
+            initial: The initial state of the model. Defaults to the initial state of the machine.
+        """
+        with self._lock:
+            if key in self._assignments:
+                raise ValueError("Model with key %r has already been added to the machine." % (key,))
+            shard = hash(key) % len(self._shards)
+            self._assignments[key] = shard
+            return self._request(shard, "add", (key, initial))
+
+    def remove_model(self, key: Hashable) -> "Future[Any]":
+        """Removes the model with ``key``. The future resolves to the last state of the model."""
+        with self._lock:
+            shard = self.shard_of(key)
+            del self._assignments[key]
+            return self._request(shard, "remove", key)
+
+    def trigger(self, key: Hashable, trigger: str, *args: Any, **kwargs: Any) -> "Future[Any]":
+        """Triggers ``trigger`` of the model with ``key``. The future resolves to the result of the trigger."""
+        with self._lock:
+            return self._request(self.shard_of(key), "trigger", (key, trigger, args, kwargs))
+
+    def get_model_state(self, key: Hashable) -> "Future[Any]":
+        """Returns a future of the current state of the model with ``key``."""
+        with self._lock:
+            return self._request(self.shard_of(key), "state", key)
+
+    def flush(self, shard: int | None = None) -> None:
+        """Sends the collected requests of ``shard`` or of all shards if ``shard`` is None."""
+        with self._lock:
+            for index in range(len(self._shards)) if shard is None else [shard]:
+                self._send(self._shards[index])
+
+    def rebalance(self, shards: int | None = None) -> int:
+        """Moves models between shards until all shards manage the same number of models (plus or minus one).
+        If ``shards`` is passed, processes are started or stopped first. Models of stopped processes are moved to
+        the remaining ones. Requests are blocked while models are moved.
+        Args:
+            shards (int): The new number of worker processes.
+        Returns:
+            int: The number of moved models.
+        """
+        with self._lock:
+            count = len(self._shards) if shards is None else shards
+            if count < 1:
+                raise ValueError("A sharded machine requires at least one shard.")
+            if count > len(self._shards):
+                self._start(count - len(self._shards))
+            sizes = Counter(self._assignments.values())
+            quota, remainder = divmod(len(self._assignments), count)
+            targets = [quota + (1 if index < remainder else 0) for index in range(count)]
+            # shards with more models than targeted and shards which will be stopped give models away
+            surplus = {index: sizes[index] - (targets[index] if index < count else 0) for index in range(len(self._shards))}
+            moves: list[tuple[Hashable, int]] = []
+            for key, shard in self._assignments.items():
+                if surplus[shard] > 0:
+                    surplus[shard] -= 1
+                    moves.append((key, shard))
+            receivers = (index for index in range(count) for _ in range(max(0, targets[index] - sizes[index])))
+            exports = [(key, target, self._request(shard, "remove", key)) for (key, shard), target in zip(moves, receivers, strict=True)]
+            self.flush()
+            for key, target, state in exports:
+                self._assignments[key] = target
+                self._request(target, "add", (key, state.result()))
+            self.flush()
+            if count < len(self._shards):
+                self._stop(self._shards[count:])
+                del self._shards[count:]
+            return len(exports)
+
+    def close(self) -> None:
+        """Sends pending requests and stops all worker processes after they have processed their requests."""
+        with self._lock:
+            self.flush()
+            self._stop(self._shards)
+            self._shards = []
+            self._assignments.clear()
+
+    def _request(self, shard: int, operation: str, payload: Any) -> "Future[Any]":
+        target = self._shards[shard]
+        request = next(self._requests)
+        future = ShardFuture(self, shard)
+        target.futures[request] = future
+        target.batch.append((operation, request, payload))
+        if len(target.batch) >= self.batch_size:
+            self._send(target)
+        return future
+
+    def _send(self, shard: _Shard) -> None:
+        if shard.batch:
+            batch, shard.batch = shard.batch, []
+            shard.requests.send(batch)
+
+    def _start(self, count: int) -> None:
+        for _ in range(count):
+            request_reader, request_writer = self._context.Pipe(duplex=False)
+            response_reader, response_writer = self._context.Pipe(duplex=False)
+            process = self._context.Process(
+                target=_serve,
+                args=(request_reader, response_writer, self._machine_cls, self._markup, self._model_factory),
+                daemon=True,
+            )
+            process.start()
+            # the worker owns these ends; closing them here lets both sides detect when the other one stops
+            request_reader.close()
+            response_writer.close()
+            self._shards.append(_Shard(len(self._shards), process, request_writer, response_reader))
+
+    def _stop(self, shards: list[_Shard]) -> None:
+        for shard in shards:
+            self._send(shard)
+            shard.requests.send(None)
+            shard.requests.close()
+        for shard in shards:
+            shard.process.join()
+            shard.receiver.join()
+            shard.responses.close()
+
+
+def _serve(
+    requests: Connection,
+    responses: Connection,
+    machine_cls: type[Machine],
+    markup: dict[str, Any],
+    model_factory: Callable[[Hashable], Any],
+) -> None:
+    """Runs in a worker process and processes batches of requests until ``None`` is received."""
+    machine = machine_cls(markup=dict(markup))
+    models: dict[Hashable, Any] = {}
+
+    def add(payload: tuple[Hashable, Any]) -> None:
+        key, initial = payload
+        model = model_factory(key)
+        machine.add_model(model, initial=initial)
+        models[key] = model
+
+    def remove(key: Hashable) -> Any:
+        model = models.pop(key)
+        machine.remove_model(model)
+        return getattr(model, machine.model_attribute)
+
+    def trigger(payload: tuple[Hashable, str, tuple[Any, ...], dict[str, Any]]) -> Any:
+        key, name, args, kwargs = payload
+        return models[key].trigger(name, *args, **kwargs)
+
+    def state(key: Hashable) -> Any:
+        return getattr(models[key], machine.model_attribute)
+
+    operations: dict[str, Callable[[Any], Any]] = {"add": add, "remove": remove, "trigger": trigger, "state": state}
+    while True:
+        try:
+            batch = requests.recv()
+        except EOFError:
+            break
+        if batch is None:
+            break
+        results: list[tuple[int, Exception | None, Any]] = []
+        for operation, request, payload in batch:
+            try:
+                results.append((request, None, operations[operation](payload)))
+            except Exception as err:  # pylint: disable=broad-except
+                results.append((request, _picklable(err), None))
+        responses.send(results)
+    responses.close()
+
+
+def _picklable(error: Exception) -> Exception:
+    try:
+        pickle.dumps(error)
+    except Exception:  # pylint: disable=broad-except
+        return RuntimeError(repr(error))
+    return error
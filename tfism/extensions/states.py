@@ -107,7 +107,7 @@ class Timeout(State):
 
     def exit(self, event_data: EventData) -> None:
         """Extends `tfsm.core.State.exit` by canceling a timer for the current model."""
-        timer = self.runner.get(id(event_data.model), None)
+        timer = self.runner.pop(id(event_data.model), None)
         if timer is not None and timer.is_alive():
             timer.cancel()
         super().exit(event_data)
@@ -0,0 +1,445 @@
+"""
+tfsm.extensions.table
+------------------------------
+
+Stores the states of many lightweight models in a column of small integers instead of an attribute of model objects.
+Models are rows of the table and are only represented by Python objects when an event needs to be processed the
+regular way.
+"""
+
+import itertools
+import logging
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from tfism.core import Event, EventData, Machine, State, Transition
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addHandler(logging.NullHandler())
+
+# markers of row lookup tables; other entries are the state id a row moves to
+_INVALID = -1  # the event cannot be triggered from the state
+_REGULAR = -2  # the event has to be processed the regular way with a row model
+_CONDITIONAL = -3  # compiled events only: the destination depends on conditions evaluated per batch of rows
+
+
+class StateTable:
+    """A column of state ids, one per row. Ids are assigned in the order in which states are added to the table.
+    The column is an ``array`` whose type code is widened when more states are added than it can address.
+
+    Attributes:
+        attribute (str): The name of the model attribute which represents the state of a row.
+        column (array): The state id of every row.
+        names (list): The state name of every id.
+        values (list): The state value (name or Enum) of every id as it would be assigned to a model.
+        ids (dict): Maps state names and values to ids.
+    """
+
+    def __init__(self, attribute: str = "state") -> None:
+        self.attribute = attribute
+        self.column: array[int] = array("B")
+        self.names: list[str] = []
+        self.values: list[Any] = []
+        self.ids: dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.column)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.values[self.column[row]]
+
+    def __setitem__(self, row: int, state: Any) -> None:
+        self.column[row] = self.ids[state]
+
+    def add_state(self, state: State) -> int:
+        """Interns ``state`` if necessary and returns its id."""
+        try:
+            return self.ids[state.name]
+        except KeyError:
+            pass
+        state_id = len(self.names)
+        self.names.append(state.name)
+        self.values.append(state.value)
+        self.ids[state.name] = self.ids[state.value] = state_id
+        if state_id >= 1 << (8 * self.column.itemsize):
+            self.column = array("H" if state_id < 1 << 16 else "I", self.column)
+        return state_id
+
+    def extend(self, count: int, state: Any) -> range:
+        """Appends ``count`` rows in ``state`` and returns their indices."""
+        start = len(self.column)
+        self.column.extend(array(self.column.typecode, [self.ids[state]]) * count)
+        return range(start, start + count)
+
+    def count(self, state: Any) -> int:
+        """Returns the number of rows in ``state``."""
+        return self.column.count(self.ids[state])
+
+
+class RowModel:
+    """Proxy of a table row which can be used like a regular model. The state attribute reads and writes the
+    table while other attributes such as convenience functions added by the machine are stored in the proxy.
+
+    Attributes:
+        row (int): The row represented by the proxy.
+    """
+
+    def __init__(self, table: StateTable, row: int) -> None:
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "row", row)
+
+    def __getattr__(self, name: str) -> Any:
+        table = self.__dict__.get("_table")
+        if table is not None and name == table.attribute:
+            return table[self.row]
+        raise AttributeError("%s has no attribute '%s'" % (type(self).__name__, name))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == self._table.attribute:
+            self._table[self.row] = value
+        else:
+            object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        return "<%s(%d)@%s>" % (type(self).__name__, self.row, id(self))
+
+
+class RowGroup:
+    """Rows which have been moved from ``source`` to ``dest`` by ``TableMachine.advance_rows``. Callbacks of
+    the group receive it as model (``event_data.model`` when ``send_event`` is set).
+
+    Attributes:
+        rows (numpy.ndarray): The indices of the rows.
+        source (str): The name of the state the rows have left.
+        dest (str): The name of the state the rows have entered.
+    """
+
+    def __init__(self, rows: Any, source: str, dest: str) -> None:
+        self.rows = rows
+        self.source = source
+        self.dest = dest
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __repr__(self) -> str:
+        return "<%s('%s', '%s', %d rows)@%s>" % (type(self).__name__, self.source, self.dest, len(self.rows), id(self))
+
+
+class TableMachine(Machine):
+    """Machine which manages rows of a ``StateTable`` in addition to (or instead of) regular models. Rows are
+    added with ``add_rows`` and triggered in bulk with ``trigger_rows``. Transitions which have no conditions and
+    no callbacks (including callbacks of the machine, the source and the destination state) only update the
+    table. Other transitions are processed the regular way with a ``RowModel`` which is created when it is first
+    needed and kept until it is released with ``release_row_model``. Row lookup tables are cached when the machine
+    is frozen (see ``Machine.freeze``) and rebuilt on every call otherwise. With NumPy installed, events can be
+    applied to many rows at once with ``advance_rows`` which evaluates conditions once per batch of rows if they
+    have a vectorized form (see ``tfism.core.vectorized``).
+    Nested states are not supported.
+
+    Attributes:
+        table (StateTable): The states of all rows.
+    """
+
+    def __init__(self, model: Any = None, states: Any = None, initial: Any = "initial", transitions: Any = None, **kwargs: Any) -> None:
+        """
+        Args:
+            model: Regular models. In contrast to ``Machine``, the machine itself is not a model by default.
+            Other arguments are passed to ``Machine``.
+        """
+        self.table = StateTable(kwargs.get("model_attribute", "state"))
+        self._row_models: dict[int, RowModel] = {}
+        self._row_lookups: dict[Event, list[int]] = {}
+        self._row_arrays: dict[Event, Any] = {}
+        super().__init__(model=model, states=states, initial=initial, transitions=transitions, **kwargs)
+
+    def add_states(self, *args: Any, **kwargs: Any) -> None:
+        """Extends ``Machine.add_states`` by assigning ids to new states."""
+        super().add_states(*args, **kwargs)
+        for state in self.states.values():
+            self.table.add_state(state)
+
+    def add_rows(self, count: int, initial: Any = None) -> range:
+        """Adds ``count`` rows in state ``initial`` (defaults to the initial state of the machine) without calling
+        any callbacks.
+        Returns:
+            range: The indices of the added rows.
+        """
+        if initial is None:
+            if self.initial is None:
+                raise ValueError("No initial state configured for machine, must specify when adding rows.")
+            initial = self.initial
+        state = initial if isinstance(initial, State) else self.get_state(initial)
+        return self.table.extend(count, state.name)
+
+    def row_model(self, row: int) -> RowModel:
+        """Returns the model of ``row`` and adds it to the machine if necessary."""
+        try:
+            return self._row_models[row]
+        except KeyError:
+            pass
+        if not 0 <= row < len(self.table):
+            raise IndexError("Row %d does not exist." % row)
+        model = RowModel(self.table, row)
+        self.add_model(model, initial=self.table.names[self.table.column[row]])
+        self._row_models[row] = model
+        return model
+
+    def release_row_model(self, row: int) -> None:
+        """Removes the model of ``row`` from the machine. The state of the row is kept."""
+        model = self._row_models.pop(row, None)
+        if model is not None:
+            self.remove_model(model)
+
+    def trigger_rows(self, trigger: str, rows: Iterable[int], *args: Any, **kwargs: Any) -> list[bool]:
+        """Triggers ``trigger`` for every row in ``rows``. Arguments are only passed to events which are processed
+        the regular way.
+        Returns:
+            list: Whether a transition has been executed for each row.
+        """
+        try:
+            event = self.events[trigger]
+        except KeyError:
+            raise AttributeError("Do not know event named '%s'." % trigger) from None
+        lookup = self._get_row_lookup(event)
+        column = self.table.column
+        results: list[bool] = []
+        append = results.append
+        for row in rows:
+            dest = lookup[column[row]]
+            if dest >= 0:
+                column[row] = dest
+                append(True)
+            elif dest == _INVALID:
+                append(event._is_valid_source(self.states[self.table.names[column[row]]]))  # pylint: disable=protected-access
+            else:
+                append(event.trigger(self.row_model(row), *args, **kwargs))
+                # callbacks might have added states which replaces the column with a wider one if necessary
+                if len(lookup) < len(self.table.names):
+                    lookup = self._get_row_lookup(event)
+                    column = self.table.column
+        return results
+
+    def compile_event(self, trigger: str) -> Any:
+        """Compiles the transitions of ``trigger`` into a NumPy array which maps every state id to the id of the
+        destination state, -1 if the event cannot be triggered from that state or -3 if the destination depends on
+        conditions. Requires NumPy and transitions and states which are not customized by subclasses (such as
+        ``tfism.extensions.states.Timeout``) since their methods would be skipped. Arrays are cached while the
+        machine is frozen.
+        Returns:
+            numpy.ndarray: The destination id of every state id.
+        """
+        if np is None:
+            raise ImportError("TableMachine.compile_event requires NumPy.")
+        try:
+            event = self.events[trigger]
+        except KeyError:
+            raise AttributeError("Do not know event named '%s'." % trigger) from None
+        lookup = self._row_arrays.get(event)
+        if lookup is not None and self._frozen:
+            return lookup
+        lookup = np.full(len(self.table.names), -1, dtype=np.intp)
+        for state_id, name in enumerate(self.table.names):
+            transitions = event.transitions.get(name)
+            if not transitions:
+                continue
+            if any(type(transition) is not Transition for transition in transitions):
+                raise ValueError("Event '%s' cannot be compiled since its transitions from '%s' are customized." % (trigger, name))
+            # internal transitions neither exit nor enter states
+            dests = [self.states[transition.dest] for transition in transitions if transition.dest is not None]
+            if dests and any(type(state) is not State for state in [self.states[name], *dests]):
+                raise ValueError(
+                    "Event '%s' cannot be compiled since states of its transitions from '%s' are customized." % (trigger, name)
+                )
+            transition = transitions[0]
+            if transition.conditions:
+                lookup[state_id] = _CONDITIONAL
+            else:
+                lookup[state_id] = state_id if transition.dest is None else self.table.ids[transition.dest]
+        if self._frozen:
+            self._row_arrays[event] = lookup
+        return lookup
+
+    def advance_rows(self, trigger: str, rows: Any = None, *args: Any, **kwargs: Any) -> Any:
+        """Triggers ``trigger`` for ``rows`` (all rows if None) in one vectorized step with the array returned by
+        ``compile_event``. Conditions of the transitions are evaluated first, once for every group of rows in the
+        same source state (see ``_check_row_conditions``). Then the table is updated. Afterwards, rows whose state
+        has changed are grouped by transition and the callbacks of every group (of the machine, the transition and
+        the source and destination state) are called once with a ``RowGroup`` as model. Consequently, prepare
+        callbacks are called after conditions have been checked. Rows whose state has not changed do not cause
+        callbacks. When rows are in states the event cannot be triggered from, a MachineError is raised before any
+        row is changed unless invalid triggers are ignored.
+        Args:
+            trigger (str): The name of the event.
+            rows (array_like): The indices of the rows. Defaults to all rows.
+            args, kwargs: Passed to the callbacks.
+        Returns:
+            numpy.ndarray: Whether a transition has been executed for each row.
+        """
+        lookup = self.compile_event(trigger)
+        event = self.events[trigger]
+        if not len(self.table):
+            return np.zeros(0 if rows is None else len(rows), dtype=bool)
+        column = np.frombuffer(self.table.column, dtype=self.table.column.typecode)
+        indices = None if rows is None else np.asarray(rows, dtype=np.intp)
+        sources = column.copy() if indices is None else column[indices]
+        dests = lookup[sources]
+        invalid = dests == _INVALID
+        if invalid.any():
+            for source in np.unique(sources[invalid]).tolist():
+                # raises a MachineError unless invalid triggers are ignored for the state
+                event._is_valid_source(self.states[self.table.names[source]])  # pylint: disable=protected-access
+        # index of the executed transition of every row in the transition list of its source state
+        choices = np.zeros(len(sources), dtype=np.intp)
+        conditional = dests == _CONDITIONAL
+        if conditional.any():
+            # conditions might add rows which must not be changed
+            del column
+            if indices is None:
+                indices = np.arange(len(sources))
+            for source in np.unique(sources[conditional]).tolist():
+                positions = np.flatnonzero(sources == source)
+                self._check_row_conditions(event, self.table.names[source], indices[positions], positions, dests, choices, args, kwargs)
+            column = np.frombuffer(self.table.column, dtype=self.table.column.typecode)
+        executed = dests >= 0
+        if not executed.all():
+            column[executed if indices is None else indices[executed]] = dests[executed]
+        else:
+            column[slice(None) if indices is None else indices] = dests
+        # the column must not be exported while callbacks are executed since they might add rows
+        del column
+        changed = np.flatnonzero(executed & (sources != dests))
+        if len(changed) and self._has_row_callbacks(event):
+            width = max(len(transitions) for transitions in event.transitions.values())
+            keys = sources[changed].astype(np.intp) * width + choices[changed]
+            order = np.argsort(keys, kind="stable")
+            keys, starts = np.unique(keys[order], return_index=True)
+            changed_rows = changed if indices is None else indices[changed]
+            for key, group in zip(keys.tolist(), np.split(changed_rows[order], starts[1:]), strict=True):
+                source, choice = divmod(key, width)
+                self._process_row_group(event, event.transitions[self.table.names[source]][choice], group, args, kwargs)
+        return executed
+
+    def _check_row_conditions(
+        self,
+        event: Event,
+        source: str,
+        rows: Any,
+        positions: Any,
+        dests: Any,
+        choices: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Evaluates the transitions of ``event`` from ``source`` in order for ``rows`` and writes the destination id
+        and the index of the first transition whose conditions pass into ``dests`` and ``choices`` at ``positions``.
+        Conditions with a vectorized form are evaluated once with a ``RowGroup`` of the remaining rows as model.
+        Other conditions are checked for every remaining row with its row model or, if the row has none, a
+        ``RowModel`` which is not added to the machine. Rows for which no transition passes keep the marker
+        ``_CONDITIONAL``.
+        """
+        state = self.states[source]
+        remaining = np.arange(len(rows))
+        for index, transition in enumerate(event.transitions[source]):
+            dest = self.table.ids[source] if transition.dest is None else self.table.ids[transition.dest]
+            passed = np.ones(len(remaining), dtype=bool)
+            for condition in transition.conditions:
+                selected = rows[remaining[passed]]
+                event_data = EventData(state, event, self, RowGroup(selected, source, self.table.names[dest]), args, kwargs)
+                event_data.transition = transition
+                mask = condition.check_batch(event_data, event_data.model)
+                if mask is None:
+                    mask = []
+                    for row in selected.tolist():
+                        # rows without a model are checked with a proxy which is not added to the machine
+                        event_data.model = self._row_models.get(row) or RowModel(self.table, row)
+                        mask.append(condition.check(event_data))
+                passed[passed] = np.asarray(mask, dtype=bool)
+            taken = positions[remaining[passed]]
+            dests[taken] = dest
+            choices[taken] = index
+            remaining = remaining[~passed]
+            if not len(remaining):
+                break
+
+    def _has_row_callbacks(self, event: Event) -> bool:
+        """Returns whether any transition of ``event`` which changes the state of a row has callbacks."""
+        if self.prepare_event or self.before_state_change or self.after_state_change or self.finalize_event:
+            return True
+        for source, transitions in event.transitions.items():
+            for transition in transitions:
+                if transition.dest is None or transition.dest == source:
+                    continue
+                dest = self.states[transition.dest]
+                if transition.prepare or transition.before or transition.after or self.states[source].on_exit or dest.on_enter:
+                    return True
+                if dest.final and self.on_final:
+                    return True
+        return False
+
+    def _process_row_group(self, event: Event, transition: Transition, rows: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        """Calls the callbacks of ``transition`` once for ``rows``."""
+        source, dest = transition.source, transition.dest or transition.source
+        source_state, dest_state = self.states[source], self.states[dest]
+        before = list(
+            itertools.chain(self.prepare_event, transition.prepare, self.before_state_change, transition.before, source_state.on_exit)
+        )
+        after = list(
+            itertools.chain(
+                dest_state.on_enter,
+                self.on_final if dest_state.final else [],
+                transition.after,
+                self.after_state_change,
+                self.finalize_event,
+            )
+        )
+        if not (before or after):
+            return
+        event_data = EventData(source_state, event, self, RowGroup(rows, source_state.name, dest_state.name), args, kwargs)
+        event_data.transition = transition
+        self.callbacks(before, event_data)
+        event_data.state = dest_state
+        self.callbacks(after, event_data)
+
+    def _get_row_lookup(self, event: Event) -> list[int]:
+        """Returns the destination id (or a marker) of ``event`` for every state id."""
+        lookup = self._row_lookups.get(event)
+        if lookup is not None and self._frozen:
+            return lookup
+        # events which are triggered from a callback of a queued machine have to be queued as well
+        busy = self.has_queue and (self._transition_queue or self._transition_queue_dict)
+        simple = not (busy or self.prepare_event or self.finalize_event or self.before_state_change or self.after_state_change)
+        lookup = []
+        for name in self.table.names:
+            transitions = event.transitions.get(name)
+            if not transitions:
+                lookup.append(_INVALID)
+            elif simple and type(event) is Event:
+                lookup.append(self._get_row_destination(self.states[name], transitions[0]))
+            else:
+                lookup.append(_REGULAR)
+        if self._frozen:
+            self._row_lookups[event] = lookup
+        return lookup
+
+    def _get_row_destination(self, source: State, transition: Transition) -> int:
+        """Returns the id of the state ``transition`` leads to if it only changes the state of a model."""
+        if type(transition) is not Transition or transition.conditions or transition.prepare or transition.before or transition.after:
+            return _REGULAR
+        if transition.dest is None:
+            return self.table.ids[source.name]
+        dest = self.states[transition.dest]
+        if type(source) is not State or type(dest) is not State or source.on_exit or dest.on_enter or dest.final:
+            return _REGULAR
+        return self.table.ids[dest.name]
+
+    def _invalidate_dispatch_table(self) -> None:
+        super()._invalidate_dispatch_table()
+        self._row_lookups.clear()
+        self._row_arrays.clear()